@@ -0,0 +1,496 @@
+"""
+네이버 부동산 비동기 크롤링 모듈
+asyncio + aiohttp로 여러 단지/거래 유형의 API를 동시에 호출
+
+✅ requests 모드 전용 엔진:
+- 쿠키/헤더: NaverRealEstateScraper와 동일 (requests로 초기 방문)
+- API 호출: aiohttp (동시 요청 수 제한)
+- 요청 간격: 모든 작업이 하나의 RateScheduler(요청 예산)를 공유
+"""
+
+import asyncio
+import queue
+import random
+import threading
+import logging
+from typing import List, Dict, Optional, Callable, Iterator
+
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+    logging.warning("aiohttp를 사용할 수 없습니다. pip install aiohttp 설치가 필요합니다.")
+
+from scraper import NaverRealEstateScraper, DeadlineExceeded
+from rate_scheduler import RateScheduler
+from fixtures import FixtureArchive
+from clock import SystemClock
+from session_state import SessionStateStore
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncNaverRealEstateScraper(NaverRealEstateScraper):
+    """네이버 부동산 비동기 크롤러 클래스 (requests 모드 API 경로)"""
+    
+    def __init__(self, max_concurrency: int = 4, rate_scheduler: Optional[RateScheduler] = None,
+                 fixtures: Optional[FixtureArchive] = None, base_url: Optional[str] = None,
+                 clock: Optional[SystemClock] = None,
+                 session_store: Optional[SessionStateStore] = None):
+        """
+        비동기 크롤러 초기화
+        
+        Args:
+            max_concurrency: 동시에 진행할 최대 요청 수
+            rate_scheduler: 모든 작업이 공유할 속도 조절기 (없으면 기본 설정으로 생성)
+            fixtures: 기록/재생 픽스처 (replay 모드면 네트워크 요청과 대기 없이 기록을 재생)
+            base_url: 접속할 서버 주소 (없으면 new.land.naver.com)
+            clock: 시간 읽기/대기에 사용할 시계 (없으면 실제 시계)
+            session_store: 쿠키 저장소 (있으면 저장된 세션을 검증 후 재사용)
+        """
+        if not AIOHTTP_AVAILABLE:
+            raise RuntimeError("aiohttp가 설치되지 않아 비동기 엔진을 사용할 수 없습니다.")
+        
+        # 쿠키/헤더 준비는 동기 크롤러와 동일 (브라우저 없이 requests로 방문)
+        super().__init__(
+            use_browser=False,
+            rate_scheduler=rate_scheduler,
+            fixtures=fixtures,
+            base_url=base_url,
+            clock=clock,
+            session_store=session_store
+        )
+        
+        self.max_concurrency = max_concurrency
+        
+        # 이벤트 루프 안에서 생성되는 객체들 (scrape_region 실행 시마다 새로 생성)
+        self._http = None
+        self._semaphore = None
+    
+    async def _open_session(self):
+        """aiohttp 세션 초기화 (requests 세션의 헤더/쿠키 복사)"""
+        self._http = aiohttp.ClientSession(
+            headers=dict(self.session.headers),
+            cookies=self.session.cookies.get_dict(),
+            timeout=aiohttp.ClientTimeout(total=30)
+        )
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+    
+    async def _close_session(self):
+        """aiohttp 세션 종료"""
+        if self._http:
+            await self._http.close()
+            self._http = None
+    
+    async def _safe_request_async(self, url: str, params: Dict = None, retry: int = 3) -> Optional[Dict]:
+        """
+        안전한 비동기 HTTP 요청 (재시도 포함, 응답 코드를 RateScheduler에 전달)
+        
+        Args:
+            url: 요청 URL
+            params: 쿼리 파라미터
+            retry: 재시도 횟수
+        
+        Returns:
+            JSON 응답 또는 None
+        """
+        # 픽스처 재생 모드: 기록된 응답 그대로 반환 (가상 시계면 요청 간격만 가상으로 기록)
+        if self.replaying:
+            if self.simulating:
+                await self._acquire_token_async()
+            return self.fixtures.replay_response(url, params)
+        
+        data = await self._send_request_async(url, params, retry)
+        
+        if self.fixtures and self.fixtures.recording:
+            self.fixtures.record_response(url, params, data)
+        
+        return data
+    
+    async def _acquire_token_async(self) -> float:
+        """
+        RateScheduler 토큰 받기 (비동기, 실행 시간 제한 확인 포함)
+        
+        Returns:
+            실제 대기 시간 (초)
+        """
+        self._check_deadline(0.0, "요청")
+        try:
+            return await self.rate_scheduler.acquire_async(max_wait=self.remaining_time())
+        except TimeoutError as e:
+            self.deadline_reached = True
+            raise DeadlineExceeded(str(e))
+    
+    async def _sleep_async(self, seconds: float):
+        """
+        대기 (비동기, 실행 시간 제한 확인 포함)
+        
+        Args:
+            seconds: 대기 시간 (초)
+        """
+        if seconds > 0:
+            self._check_deadline(seconds, "대기")
+            await self.clock.sleep_async(seconds)
+    
+    async def _send_request_async(self, url: str, params: Dict = None, retry: int = 3) -> Optional[Dict]:
+        """
+        실제 비동기 HTTP 요청 (RateScheduler 대기, 재시도 포함)
+        
+        Args:
+            url: 요청 URL
+            params: 쿼리 파라미터
+            retry: 재시도 횟수
+        
+        Returns:
+            JSON 응답 또는 None
+        """
+        headers = {'Referer': self._get_referer_for_url(url)}
+        
+        for attempt in range(retry):
+            # 모든 작업이 같은 RateScheduler를 공유하므로 동시 작업 수와 무관하게 전체 속도 유지
+            await self._acquire_token_async()
+            
+            try:
+                async with self._semaphore:
+                    self.request_count += 1
+                    async with self._http.get(url, params=params, headers=headers) as response:
+                        status = response.status
+                        self.rate_scheduler.record_response(status)
+                        if status == 200:
+                            return await response.json(content_type=None)
+                
+                if status == 429:
+                    # 429 Too Many Requests - RateScheduler가 모든 작업을 정지시킴
+                    logger.warning("⚠️  429 에러 (Too Many Requests) 발생!")
+                    if attempt < retry - 1:
+                        logger.info(f"🕐 속도 조절 후 재시도 예정 ({attempt + 2}/{retry})")
+                    else:
+                        logger.error("❌ 최대 재시도 횟수 초과. 프로그램을 나중에 다시 실행하세요.")
+                
+                elif status == 403:
+                    logger.warning(f"접근 거부 (403). 감소된 속도로 재시도... ({attempt + 1}/{retry})")
+                
+                else:
+                    logger.warning(f"응답 코드 {status}")
+                    if attempt < retry - 1:
+                        await self._sleep_async(random.uniform(3, 7))
+            
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                logger.error(f"요청 오류: {e}")
+                if attempt < retry - 1:
+                    await self._sleep_async(random.uniform(5, 10))
+        
+        return None
+    
+    async def search_complexes_async(self, cortarNo: str, trade_type: str = "A1", db=None) -> List[Dict]:
+        """
+        지역별 단지 검색 (비동기)
+        
+        Args:
+            cortarNo: 지역 코드
+            trade_type: 거래 유형
+            db: 완료된 페이지를 기록/재사용할 PropertyDatabase (선택)
+        
+        Returns:
+            단지 정보 리스트
+        """
+        url = f"{self.BASE_URL}/api/complexes"
+        params = self._complex_search_params(cortarNo, trade_type)
+        checkpoint = self._checkpoint(db, cortarNo, trade_type)
+        
+        logger.info(f"단지 검색: cortarNo={cortarNo}, tradeType={trade_type}")
+        complexes = []
+        async for page_items in self._iter_pages_async(url, params, 'complexList', checkpoint):
+            complexes.extend(page_items)
+        
+        logger.info(f"검색된 단지 수: {len(complexes)}")
+        return complexes
+    
+    async def _iter_pages_async(self, url: str, params: Dict, list_key: str, checkpoint: Optional[tuple] = None):
+        """
+        목록 API를 isMoreData가 false가 될 때까지 페이지 단위로 요청 (비동기)
+        
+        Args:
+            url: 요청 URL
+            params: 쿼리 파라미터 ('page'는 자동으로 설정)
+            list_key: 응답에서 목록이 담긴 키
+            checkpoint: 작업 항목 키 (최근에 완료된 페이지는 요청 없이 저장된 결과 사용, 선택)
+        
+        Yields:
+            페이지별 목록
+        """
+        for page in range(1, self.MAX_PAGES + 1):
+            saved = await self._load_checkpoint_async(checkpoint, page)
+            
+            if saved is not None:
+                items, has_more = saved['items'], saved['has_more']
+            else:
+                await self._save_checkpoint_async(checkpoint, page, 'in_progress')
+                data = await self._safe_request_async(url, dict(params, page=page))
+                
+                if not data or list_key not in data:
+                    await self._save_checkpoint_async(checkpoint, page, 'failed')
+                    logger.warning(f"목록 조회 실패: {url} (page={page})")
+                    return
+                
+                items = data[list_key]
+                has_more = bool(items and data.get('isMoreData'))
+                await self._save_checkpoint_async(checkpoint, page, 'done', items, has_more)
+            
+            yield items
+            
+            if not has_more:
+                return
+        
+        logger.warning(f"⚠️  최대 페이지 수({self.MAX_PAGES}) 도달, 나머지 페이지 생략: {url}")
+    
+    async def _load_checkpoint_async(self, checkpoint: Optional[tuple], page: int) -> Optional[Dict]:
+        """_load_checkpoint (SQLite 조회는 이벤트 루프를 막지 않도록 스레드에서 실행)"""
+        if checkpoint is None:
+            return None
+        return await asyncio.to_thread(self._load_checkpoint, checkpoint, page)
+    
+    async def _save_checkpoint_async(self, checkpoint: Optional[tuple], page: int, state: str,
+                                     items: Optional[List[Dict]] = None, has_more: bool = False):
+        """_save_checkpoint (SQLite 기록은 이벤트 루프를 막지 않도록 스레드에서 실행)"""
+        if checkpoint is not None:
+            await asyncio.to_thread(self._save_checkpoint, checkpoint, page, state, items, has_more)
+    
+    async def get_complex_articles_async(self, complex_no: str, trade_type: str = "A1", db=None,
+                                         cortarNo: str = '') -> List[Dict]:
+        """
+        특정 단지의 매물 목록 가져오기 (비동기, 모든 페이지)
+        
+        Args:
+            complex_no: 단지 번호
+            trade_type: 거래 유형
+            db: 페이지 조기 종료 판단/진행 상태 저장에 사용할 PropertyDatabase (선택)
+            cortarNo: 작업 항목 키에 쓸 지역 코드 (선택)
+        
+        Returns:
+            매물 정보 리스트
+        """
+        url = f"{self.BASE_URL}/api/articles/complex/{complex_no}"
+        params = self._article_list_params(trade_type)
+        checkpoint = self._checkpoint(db, cortarNo, trade_type, complex_no)
+        
+        logger.info(f"매물 검색: complexNo={complex_no}")
+        articles = []
+        try:
+            async for page_items in self._iter_pages_async(url, params, 'articleList', checkpoint):
+                articles.extend(page_items)
+                
+                # 한 페이지가 모두 이전 크롤링에서 받은 매물이면 이후(더 오래된) 페이지 생략 (seen_articles)
+                if db is not None and page_items:
+                    page_ids = [f"{complex_no}_{article.get('articleNo', '')}" for article in page_items]
+                    known_ids = await asyncio.to_thread(db.filter_seen_ids, page_ids)
+                    if len(known_ids) == len(set(page_ids)):
+                        logger.info(f"⏹️  기존 매물만 있는 페이지 도달 → 이후 페이지 생략 (complexNo={complex_no})")
+                        break
+        except DeadlineExceeded as e:
+            # 시간 제한: 이미 받은 페이지의 매물은 반환
+            if not articles:
+                raise
+            logger.warning(f"⏰ 실행 시간 제한으로 이후 페이지 생략 (complexNo={complex_no}): {e}")
+        
+        logger.info(f"검색된 매물 수: {len(articles)}")
+        return articles
+    
+    async def get_article_detail_async(self, article_no: str) -> Optional[Dict]:
+        """
+        매물 상세 정보 가져오기 (비동기)
+        
+        Args:
+            article_no: 매물 번호
+        
+        Returns:
+            매물 상세 정보
+        """
+        url = f"{self.BASE_URL}/api/articles/{article_no}"
+        
+        logger.info(f"매물 상세 정보: articleNo={article_no}")
+        return await self._safe_request_async(url)
+    
+    async def _scrape_complex(self, complex_info: Dict, trade_type: str, db=None, cortarNo: str = '') -> List[Dict]:
+        """
+        단지 하나의 매물을 가져와 파싱 (건너뛸 단지는 _plan_targets에서 이미 제외)
+        
+        Args:
+            complex_info: 단지 정보
+            trade_type: 거래 유형
+            db: 페이지 조기 종료 및 변경 없는 단지 건너뛰기에 사용할 PropertyDatabase (선택)
+            cortarNo: 작업 항목 키에 쓸 지역 코드 (선택)
+        
+        Returns:
+            파싱된 매물 정보 리스트
+        """
+        complex_no = complex_info.get('complexNo')
+        articles = await self.get_complex_articles_async(complex_no, trade_type, db=db, cortarNo=cortarNo)
+        properties = [self._parse_article(article, complex_info, trade_type) for article in articles]
+        
+        # 시간 제한으로 일부 페이지만 받았을 수 있으면 스냅샷을 남기지 않음 (다음 실행에서 다시 크롤링)
+        if self.deadline_reached:
+            return properties
+        
+        await asyncio.to_thread(self._record_complex_snapshots, complex_info, trade_type, properties, db)
+        return properties
+    
+    def _plan_targets(self, complexes: List[Dict], trade_type: str, db=None, cortarNo: str = '') -> List[Dict]:
+        """
+        크롤링할 단지 목록 (동기 크롤러와 같은 순서로 정한 뒤 건너뛸 단지를 빼고 최대 max_complexes개)
+        
+        단지마다 _needs_crawl을 한 번만 평가하며, DB 조회가 많아 스레드에서 실행합니다.
+        
+        Args:
+            complexes: 단지 목록
+            trade_type: 거래 유형
+            db: PropertyDatabase (선택)
+            cortarNo: 지역 코드 (선택)
+            
+        Returns:
+            크롤링할 단지 정보 리스트
+        """
+        targets = []
+        for complex_info in self._plan_complexes(complexes, trade_type, db, cortarNo):
+            if self.max_complexes and len(targets) >= self.max_complexes:
+                break
+            
+            # 매물 수가 지난 실행과 같으면 요청 없이 건너뜀 (중단된 실행이 저장한 결과가 있으면 다시 사용)
+            if self._needs_crawl(complex_info, trade_type, db, cortarNo):
+                targets.append(complex_info)
+            else:
+                logger.info(f"⏭️  매물 수 변경 없음 → 건너뜀: {complex_info.get('complexName', complex_info.get('complexNo'))}")
+        return targets
+    
+    async def _scrape_trade_type(self, cortarNo: str, trade_type: str, db=None,
+                                 on_batch: Optional[Callable[[List[Dict]], None]] = None) -> List[Dict]:
+        """
+        거래 유형 하나에 대해 지역의 단지들을 동시에 크롤링
+        
+        Args:
+            cortarNo: 지역 코드
+            trade_type: 거래 유형
+            db: 페이지 조기 종료 판단에 사용할 PropertyDatabase (선택)
+            on_batch: 단지 하나가 끝날 때마다 그 단지의 매물 리스트로 호출할 함수 (선택)
+        
+        Returns:
+            파싱된 매물 정보 리스트
+        """
+        logger.info(f"=== 거래 유형 {trade_type} 크롤링 시작 (비동기) ===")
+        try:
+            complexes = await asyncio.to_thread(self._cached_complexes, cortarNo, trade_type, db)
+            if complexes is None:
+                complexes = await self.search_complexes_async(cortarNo, trade_type, db=db)
+                await asyncio.to_thread(self._cache_complexes, cortarNo, trade_type, complexes, db)
+        except DeadlineExceeded as e:
+            logger.warning(f"⏰ 실행 시간 제한으로 크롤링 중단: {e}")
+            return []
+        
+        # 순서 결정 (우선순위, 무작위 또는 시간 제한 모드에서 기대 신규 매물 순)
+        targets = await asyncio.to_thread(self._plan_targets, complexes, trade_type, db, cortarNo)
+        
+        async def scrape_and_emit(complex_info: Dict) -> List[Dict]:
+            properties = await self._scrape_complex(complex_info, trade_type, db=db, cortarNo=cortarNo)
+            if on_batch and properties:
+                on_batch(properties)
+            return properties
+        
+        results = await asyncio.gather(
+            *(scrape_and_emit(complex_info) for complex_info in targets),
+            return_exceptions=True
+        )
+        
+        properties = []
+        for complex_info, result in zip(targets, results):
+            if isinstance(result, DeadlineExceeded):
+                logger.warning(f"⏰ 실행 시간 제한으로 건너뜀: {complex_info.get('complexName', '알 수 없음')}")
+                continue
+            if isinstance(result, Exception):
+                logger.error(f"❌ 단지 크롤링 실패: {complex_info.get('complexName', '알 수 없음')} - {result}")
+                continue
+            properties.extend(result)
+        
+        return properties
+    
+    async def scrape_region_async(self, cortarNo: str, trade_types: List[str] = ["A1"], db=None,
+                                  on_batch: Optional[Callable[[List[Dict]], None]] = None) -> List[Dict]:
+        """
+        특정 지역의 모든 매물 크롤링 (거래 유형/단지 동시 진행)
+        
+        Args:
+            cortarNo: 지역 코드
+            trade_types: 거래 유형 리스트 (combine_trade_types면 한 번에 요청)
+            db: 페이지 조기 종료 판단에 사용할 PropertyDatabase (선택)
+            on_batch: 단지 하나가 끝날 때마다 그 단지의 매물 리스트로 호출할 함수 (선택)
+        
+        Returns:
+            모든 매물 정보 리스트
+        """
+        await self._open_session()
+        try:
+            results = await asyncio.gather(
+                *(self._scrape_trade_type(cortarNo, trade_type, db=db, on_batch=on_batch)
+                  for trade_type in self._trade_type_groups(trade_types))
+            )
+        finally:
+            await self._close_session()
+        
+        all_properties = [prop for properties in results for prop in properties]
+        logger.info(f"총 {len(all_properties)}개 매물 크롤링 완료 (요청 {self.request_count}회)")
+        logger.info(f"⏱️  요청 속도 통계: {self.rate_scheduler.get_stats()}")
+        if self.simulating:
+            logger.info(f"🕰️  가상 시계 통계: {self.clock.get_stats()}")
+        return all_properties
+    
+    def scrape_region(self, cortarNo: str, trade_types: List[str] = ["A1"], db=None) -> List[Dict]:
+        """
+        특정 지역의 모든 매물 크롤링 (동기 인터페이스, RealEstateBot.run 호환)
+        
+        Args:
+            cortarNo: 지역 코드
+            trade_types: 거래 유형 리스트
+            db: 페이지 조기 종료 판단에 사용할 PropertyDatabase (선택)
+        
+        Returns:
+            모든 매물 정보 리스트
+        """
+        return asyncio.run(self.scrape_region_async(cortarNo, trade_types, db=db))
+    
+    def iter_region(self, cortarNo: str, trade_types: List[str] = ["A1"], db=None) -> Iterator[List[Dict]]:
+        """
+        특정 지역의 매물을 단지 하나가 끝날 때마다 반환하는 제너레이터 (동기 인터페이스)
+        
+        이벤트 루프는 별도 스레드에서 실행하고, 끝난 단지의 매물을 큐로 넘겨받습니다.
+        
+        Args:
+            cortarNo: 지역 코드
+            trade_types: 거래 유형 리스트
+            db: 페이지 조기 종료 판단에 사용할 PropertyDatabase (선택)
+        
+        Yields:
+            단지 하나의 매물 정보 리스트
+        """
+        batches = queue.Queue()
+        done = object()
+        
+        def run():
+            try:
+                asyncio.run(self.scrape_region_async(cortarNo, trade_types, db=db, on_batch=batches.put))
+            except Exception as e:
+                batches.put(e)
+            finally:
+                batches.put(done)
+        
+        worker = threading.Thread(target=run, name=f"async-crawl-{cortarNo}", daemon=True)
+        worker.start()
+        
+        while True:
+            item = batches.get()
+            if item is done:
+                break
+            if isinstance(item, Exception):
+                raise item
+            yield item
+        
+        worker.join()
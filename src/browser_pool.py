@@ -0,0 +1,162 @@
+"""
+브라우저 페이지 풀 모듈
+Chromium 프로세스 하나에 컨텍스트/페이지를 여러 개 열어두고 빌려 쓰고 돌려받음 (여러 단지 페이지 동시 로딩)
+
+- 빌리기/돌려주기: checkout()/checkin() 또는 with pool.page() as slot
+- 상태 확인: 빌려줄 때 페이지가 닫혔거나 크래시했거나 응답이 없으면 새로 만듦
+- 재생성: 페이지 이동 횟수가 max_navigations에 도달하면 컨텍스트째 닫고 새로 열어 메모리 누수 방지
+- Playwright sync API 객체는 만든 스레드에서만 쓸 수 있으므로 풀도 브라우저를 연 스레드에서만 사용
+"""
+
+import logging
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List
+
+logger = logging.getLogger(__name__)
+
+
+class PooledPage:
+    """풀의 페이지 하나 (전용 컨텍스트, 페이지, 이동 횟수)"""
+    
+    def __init__(self, context, page):
+        """
+        Args:
+            context: playwright BrowserContext
+            page: 컨텍스트의 playwright Page
+        """
+        self.context = context
+        self.page = page
+        self.navigations = 0
+        self.crashed = False
+        page.on('crash', self._on_crash)
+    
+    def _on_crash(self, page):
+        self.crashed = True
+
+
+class BrowserPagePool:
+    """브라우저 컨텍스트/페이지 풀 클래스"""
+    
+    def __init__(self, new_context: Callable[[], object], size: int = 2, max_navigations: int = 50):
+        """
+        페이지 풀 초기화 (페이지는 처음 빌려줄 때 만듦)
+        
+        Args:
+            new_context: 새 BrowserContext를 만드는 함수 (User-Agent, 쿠키, 리소스 차단 설정 포함)
+            size: 최대 페이지 수
+            max_navigations: 페이지 하나로 이동할 최대 횟수 (도달하면 컨텍스트째 다시 만듦, 0이면 제한 없음)
+        """
+        if size < 1:
+            raise ValueError(f"풀 크기는 1 이상이어야 합니다: {size}")
+        
+        self.new_context = new_context
+        self.size = size
+        self.max_navigations = max_navigations
+        
+        self._idle: List[PooledPage] = []
+        self._open = 0
+        self.stats = {'created': 0, 'recycled': 0, 'unhealthy': 0}
+    
+    def _create(self) -> PooledPage:
+        """새 컨텍스트와 페이지 열기"""
+        context = self.new_context()
+        slot = PooledPage(context, context.new_page())
+        self._open += 1
+        self.stats['created'] += 1
+        return slot
+    
+    def _discard(self, slot: PooledPage):
+        """컨텍스트 닫기 (페이지도 함께 닫힘)"""
+        self._open -= 1
+        try:
+            slot.context.close()
+        except Exception as e:
+            logger.debug(f"컨텍스트 종료 실패 (무시): {e}")
+    
+    def is_healthy(self, slot: PooledPage) -> bool:
+        """
+        페이지 상태 확인 (닫힘, 크래시, 스크립트 실행 불가)
+        
+        Args:
+            slot: 확인할 페이지
+        
+        Returns:
+            정상 여부
+        """
+        if slot.crashed or slot.page.is_closed():
+            return False
+        try:
+            return slot.page.evaluate("1 + 1") == 2
+        except Exception:
+            return False
+    
+    def checkout(self) -> PooledPage:
+        """
+        페이지 빌리기 (남은 페이지가 없으면 size까지 새로 만듦)
+        
+        Returns:
+            빌린 페이지
+        
+        Raises:
+            RuntimeError: size개를 모두 빌려준 상태
+        """
+        while self._idle:
+            slot = self._idle.pop()
+            if self.is_healthy(slot):
+                return slot
+            logger.warning("🩺 응답 없는 브라우저 페이지 → 새로 만듦")
+            self.stats['unhealthy'] += 1
+            self._discard(slot)
+        
+        if self._open >= self.size:
+            raise RuntimeError(f"브라우저 페이지 풀에 남은 페이지가 없습니다 (크기 {self.size})")
+        return self._create()
+    
+    def checkin(self, slot: PooledPage, healthy: bool = True):
+        """
+        페이지 돌려주기 (상태가 나쁘거나 이동 횟수 제한에 도달하면 닫음, 다음에 빌려줄 때 새로 만듦)
+        
+        Args:
+            slot: 돌려줄 페이지
+            healthy: 사용 중 오류가 없었는지
+        """
+        if not healthy:
+            self.stats['unhealthy'] += 1
+            self._discard(slot)
+        elif self.max_navigations and slot.navigations >= self.max_navigations:
+            logger.info(f"♻️  브라우저 페이지 {slot.navigations}회 이동 → 컨텍스트 새로 만듦")
+            self.stats['recycled'] += 1
+            self._discard(slot)
+        else:
+            self._idle.append(slot)
+    
+    @contextmanager
+    def page(self) -> Iterator[PooledPage]:
+        """
+        with 블록 동안 페이지 빌리기 (예외가 나면 그 페이지는 버림)
+        
+        Yields:
+            빌린 페이지
+        """
+        slot = self.checkout()
+        try:
+            yield slot
+        except Exception:
+            self.checkin(slot, healthy=False)
+            raise
+        self.checkin(slot)
+    
+    def close(self):
+        """남은 페이지 모두 닫기"""
+        while self._idle:
+            self._discard(self._idle.pop())
+    
+    def get_stats(self) -> Dict[str, int]:
+        """
+        풀 통계
+        
+        Returns:
+            {'size': 최대 페이지 수, 'open': 열린 페이지 수, 'created': 만든 수, 'recycled': 이동 횟수로 다시 만든 수,
+             'unhealthy': 상태 이상으로 버린 수}
+        """
+        return dict(self.stats, size=self.size, open=self._open)
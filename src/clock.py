@@ -0,0 +1,105 @@
+"""
+시계 모듈
+크롤러와 속도 조절기가 시간을 읽고 대기할 때 사용하는 교체 가능한 시계
+
+- SystemClock: 실제 시간, 실제 대기 (기본값)
+- VirtualClock: 대기하면 가상 시간만 즉시 앞으로 이동 (시뮬레이션/벤치마크용)
+  실제로 기다렸다면 걸렸을 시간을 기록하므로, 대기 정책을 몇 초 만에 평가하고
+  대기를 뺀 실제 CPU/IO 비용을 따로 측정할 수 있습니다.
+"""
+
+import asyncio
+import threading
+import time
+from datetime import datetime
+from typing import Dict, Optional
+
+
+class SystemClock:
+    """실제 시간을 사용하는 시계 클래스"""
+    
+    def time(self) -> float:
+        """현재 시각 (epoch 초)"""
+        return time.time()
+    
+    def monotonic(self) -> float:
+        """단조 증가 시각 (간격 계산용)"""
+        return time.monotonic()
+    
+    def now(self) -> datetime:
+        """현재 시각 (datetime)"""
+        return datetime.now()
+    
+    def sleep(self, seconds: float):
+        """대기 (동기)"""
+        if seconds > 0:
+            time.sleep(seconds)
+    
+    async def sleep_async(self, seconds: float):
+        """대기 (비동기)"""
+        if seconds > 0:
+            await asyncio.sleep(seconds)
+
+
+class VirtualClock(SystemClock):
+    """대기 없이 가상 시간만 진행하는 시계 클래스 (스레드 안전)"""
+    
+    def __init__(self, start: Optional[float] = None):
+        """
+        가상 시계 초기화
+        
+        Args:
+            start: 시작 시각 (epoch 초, 없으면 현재 시각)
+        """
+        self._lock = threading.Lock()
+        self._start = time.time() if start is None else start
+        self._offset = 0.0  # 시작 후 흐른 가상 시간 (초)
+        self._wall_start = time.perf_counter()
+        
+        self.sleep_count = 0
+    
+    def time(self) -> float:
+        with self._lock:
+            return self._start + self._offset
+    
+    def monotonic(self) -> float:
+        with self._lock:
+            return self._offset
+    
+    def now(self) -> datetime:
+        return datetime.fromtimestamp(self.time())
+    
+    def advance(self, seconds: float):
+        """
+        가상 시간 진행
+        
+        Args:
+            seconds: 진행할 시간 (초)
+        """
+        if seconds <= 0:
+            return
+        with self._lock:
+            self._offset += seconds
+            self.sleep_count += 1
+    
+    def sleep(self, seconds: float):
+        self.advance(seconds)
+    
+    async def sleep_async(self, seconds: float):
+        self.advance(seconds)
+        # 다른 코루틴에 실행 기회를 넘김 (실제 대기는 없음)
+        await asyncio.sleep(0)
+    
+    def get_stats(self) -> Dict:
+        """
+        가상 시간 통계
+        
+        Returns:
+            가상 경과 시간(실제로 기다렸다면 걸렸을 시간)과 실제 경과 시간
+        """
+        with self._lock:
+            return {
+                'virtual_seconds': round(self._offset, 1),
+                'wall_seconds': round(time.perf_counter() - self._wall_start, 3),
+                'sleeps': self.sleep_count
+            }
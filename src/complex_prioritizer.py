@@ -0,0 +1,143 @@
+"""
+단지 우선순위 모듈
+무작위 순서 대신 알림으로 이어질 가능성이 큰 단지부터 크롤링하도록 순위를 매깁니다.
+
+- 필터 호환성: 단지 정보(세대수, 사용승인연도, 면적)만으로 필터를 절대 통과할 수 없는 단지는 요청 없이 제외
+- 필터 통과율: 지난 기록에서 단지 매물 중 필터를 통과해 저장된 비율 (기록이 적으면 50%에 가깝게 보정)
+- 기대 신규 매물 + 경과도: 매물 수 변화량과 재크롤링 일정 대비 지난 시간
+"""
+
+import logging
+from datetime import datetime, timedelta
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class ComplexPrioritizer:
+    """필터 통과 가능성 기반 단지 우선순위 클래스"""
+    
+    def __init__(self, filters: Dict, db=None, history_days: float = 30):
+        """
+        우선순위 계산기 초기화
+        
+        Args:
+            filters: 필터 설정 (FilterManager.filters)
+            db: PropertyDatabase (없으면 필터 호환성만 사용)
+            history_days: 필터 통과율 계산에 사용할 기간 (일)
+        """
+        self.filters = filters
+        self.db = db
+        self.history_days = history_days
+        
+        self._passed_counts: Dict[str, Dict[str, int]] = {}  # 거래 유형별 {단지 번호: 저장된 매물 수}
+    
+    def incompatibility(self, complex_info: Dict, trade_type: str) -> Optional[str]:
+        """
+        단지 정보만으로 필터를 통과할 수 없는 이유 확인
+        
+        세대수와 사용승인연도는 매물이 아니라 단지 값이 그대로 필터에 쓰이므로 정확히 판단할 수 있습니다.
+        면적은 단지의 최대 면적이 필터 최소 면적보다 작을 때만 제외합니다
+        (단지 목록의 면적이 공급면적이어도 전용면적은 그보다 작으므로 안전).
+        
+        Args:
+            complex_info: 단지 정보 (complexList 항목)
+            trade_type: 거래 유형 (묶음 'B1:B2'는 하나라도 필터 대상이면 통과)
+        
+        Returns:
+            제외 이유 (통과할 수 있으면 None)
+        """
+        allowed_types = self.filters.get('trade_types')
+        if allowed_types is not None and not any(t in allowed_types for t in trade_type.split(':')):
+            return f"거래 유형 {trade_type} 필터 대상 아님"
+        
+        household_count = complex_info.get('totalHouseholdCount')
+        if household_count is not None:
+            household_filter = self.filters.get('household_count', {})
+            if not household_filter.get('min', 0) <= int(household_count) <= household_filter.get('max', 999999):
+                return f"세대수 {household_count}"
+        
+        approve_ymd = str(complex_info.get('useApproveYmd') or '')
+        if approve_ymd[:4].isdigit():
+            approval_year = int(approve_ymd[:4])
+            year_filter = self.filters.get('approval_year', {})
+            if not year_filter.get('min', 0) <= approval_year <= year_filter.get('max', 9999):
+                return f"사용승인연도 {approval_year}"
+        
+        max_area = complex_info.get('maxArea')
+        if max_area is not None:
+            area_min = self.filters.get('area_range', {}).get('min', 0)
+            if float(max_area) < area_min:
+                return f"최대 면적 {max_area}㎡"
+        
+        return None
+    
+    def pass_rate(self, complex_no: str, trade_type: str, listed: int, now: Optional[datetime] = None) -> float:
+        """
+        단지 매물의 필터 통과율 추정
+        
+        Args:
+            complex_no: 단지 번호
+            trade_type: 거래 유형 (묶음 'B1:B2'는 거래 유형별 저장 수의 합)
+            listed: 현재 매물 수 (모르면 0)
+            now: 기록 기간의 기준 시각 (없으면 현재 시각)
+        
+        Returns:
+            통과율 (0 ~ 1, 기록이 없으면 0.5)
+        """
+        if self.db is None:
+            return 0.5
+        
+        passed = 0
+        for single_type in trade_type.split(':'):
+            if single_type not in self._passed_counts:
+                since = (now or datetime.now()) - timedelta(days=self.history_days)
+                self._passed_counts[single_type] = self.db.get_passed_counts(single_type, since)
+            passed += self._passed_counts[single_type].get(complex_no, 0)
+        
+        passed = min(passed, listed) if listed else 0
+        return (passed + 1) / (listed + 2)
+    
+    def staleness(self, complex_no: str, trade_type: str, now: datetime) -> float:
+        """
+        재크롤링 일정 대비 경과도 (마지막 크롤링 후 지난 시간 / 재크롤링 간격)
+        
+        Args:
+            complex_no: 단지 번호
+            trade_type: 거래 유형 (묶음 'B1:B2'는 가장 오래된 거래 유형 기준)
+            now: 현재 시각
+        
+        Returns:
+            경과도 (한 번도 크롤링하지 않았으면 1)
+        """
+        if ':' in trade_type:
+            return max(self.staleness(complex_no, t, now) for t in trade_type.split(':'))
+        
+        schedule = self.db.get_crawl_schedule(complex_no, trade_type) if self.db is not None else None
+        if not schedule or not schedule['last_crawled_at'] or not schedule['interval_hours']:
+            return 1.0
+        
+        elapsed_hours = (now - datetime.fromisoformat(schedule['last_crawled_at'])).total_seconds() / 3600
+        return max(0.0, elapsed_hours / schedule['interval_hours'])
+    
+    def score(self, complex_info: Dict, trade_type: str, expected_new: int, listed: int, now: datetime) -> float:
+        """
+        단지 우선순위 점수 (기대 알림 수에 비례)
+        
+        Args:
+            complex_info: 단지 정보
+            trade_type: 거래 유형
+            expected_new: 기대 신규/변경 매물 수 (매물 수 변화량)
+            listed: 현재 매물 수 (모르면 0)
+            now: 현재 시각
+        
+        Returns:
+            점수 (클수록 먼저 크롤링)
+        """
+        complex_no = complex_info.get('complexNo')
+        return self.pass_rate(complex_no, trade_type, listed, now) * \
+            (expected_new + self.staleness(complex_no, trade_type, now))
+    
+    def reset(self):
+        """저장된 매물 수 기록을 다시 읽도록 초기화 (실행마다 호출)"""
+        self._passed_counts = {}
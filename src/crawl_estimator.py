@@ -0,0 +1,358 @@
+"""
+크롤링 소요 시간 추정 모듈 (Monte Carlo)
+NaverRealEstateScraper의 대기 정책을 NumPy로 수천 번 동시에 시뮬레이션해
+설정별 전체 실행 시간과 요청 수의 분포를 추정
+
+모델링하는 대기 (scraper.py와 같은 분포):
+- human 모드: 생각 시간 / 매물 목록 확인 / 단지 이동 / 거래 유형 전환 (_human_like_delay, 정규분포)
+  요청 전 휴식 (_take_break, 베타분포), 페이지 읽기 (_simulate_reading, 감마분포),
+  단지 이동 후 20% 확률 추가 휴식 (균등분포), 피로도와 시간대 보정
+- 공통: RateScheduler 토큰 간격, 429 응답 시 정지와 속도 감소, 30분마다 쿠키 갱신, 응답 지연
+
+매물이 모두 기존 매물이라 페이지를 일찍 멈추는 경우는 모델링하지 않으므로 결과는 보수적인 추정치입니다.
+
+사용 예:
+    python crawl_estimator.py --runs 10000 --complexes 40 --articles 30 --limit-hours 6
+"""
+
+import argparse
+import os
+import logging
+from datetime import datetime
+from typing import Dict, Optional
+
+import numpy as np
+from dotenv import load_dotenv
+
+from rate_scheduler import RateScheduler
+
+logger = logging.getLogger(__name__)
+
+
+class CrawlEstimator:
+    """크롤링 소요 시간 Monte Carlo 추정 클래스"""
+    
+    PAGE_SIZE = 20  # API 한 페이지당 항목 수
+    MAX_PAGES = 50  # NaverRealEstateScraper.MAX_PAGES
+    COOKIE_LIFETIME = 1800  # 쿠키 갱신 주기 (초)
+    
+    def __init__(self, pacing_mode: str = 'human', use_browser: bool = False,
+                 requests_per_minute: float = 4.0, max_requests_per_minute: Optional[float] = None,
+                 complexes_per_region: float = 30, articles_per_complex: float = 40,
+                 max_complexes: int = 10, changed_ratio: float = 1.0,
+                 request_latency: float = 0.5, render_seconds: float = 1.0,
+                 throttle_rate: float = 0.0, penalty_seconds: float = 60.0,
+                 start_hour: Optional[int] = None, seed: Optional[int] = None):
+        """
+        추정기 초기화
+        
+        Args:
+            pacing_mode: 'human' 또는 'scheduler' (NaverRealEstateScraper.pacing_mode)
+            use_browser: Playwright 브라우저 모드 여부
+            requests_per_minute: RateScheduler 목표 분당 요청 수
+            max_requests_per_minute: RateScheduler 최대 분당 요청 수 (기본값: 목표 속도 × RateScheduler.DEFAULT_CEILING_FACTOR)
+            complexes_per_region: 지역·거래 유형당 평균 단지 수 (포아송 분포)
+            articles_per_complex: 단지당 평균 매물 수 (포아송 분포)
+            max_complexes: 지역·거래 유형당 크롤링할 최대 단지 수
+            changed_ratio: 매물 수가 바뀌어 실제로 크롤링하는 단지 비율
+            request_latency: 요청 한 번의 평균 응답 시간 (초)
+            render_seconds: 브라우저 모드 페이지 방문 후 목록 API 응답까지 걸리는 시간 (초)
+            throttle_rate: 요청이 429를 받을 확률
+            penalty_seconds: 429 응답 시 정지 시간 (연속 429마다 2배)
+            start_hour: 실행 시작 시각 (시, 없으면 현재 시각)
+            seed: 난수 시드
+        """
+        if pacing_mode not in ('scheduler', 'human'):
+            raise ValueError(f"지원하지 않는 pacing_mode: {pacing_mode}")
+        
+        self.pacing_mode = pacing_mode
+        self.use_browser = use_browser
+        self.target_rpm = requests_per_minute
+        self.max_rpm = max_requests_per_minute or requests_per_minute * RateScheduler.DEFAULT_CEILING_FACTOR
+        self.min_rpm = min(0.5, requests_per_minute)
+        self.complexes_per_region = complexes_per_region
+        self.articles_per_complex = articles_per_complex
+        self.max_complexes = max_complexes
+        self.changed_ratio = changed_ratio
+        self.request_latency = request_latency
+        self.render_seconds = render_seconds
+        self.throttle_rate = throttle_rate
+        self.penalty_seconds = penalty_seconds
+        self.start_hour = start_hour
+        self.rng = np.random.default_rng(seed)
+    
+    @property
+    def human(self) -> bool:
+        return self.pacing_mode == 'human'
+    
+    def _reset(self, runs: int):
+        """시뮬레이션 상태 배열 초기화 (실행 하나당 원소 하나)"""
+        if self.start_hour is None:
+            self._start_hour = datetime.now().hour
+        else:
+            self._start_hour = self.start_hour
+        
+        self.t = np.zeros(runs)  # 경과 시간 (초)
+        self.requests = np.zeros(runs, dtype=np.int64)  # 전체 요청 수 (랜딩/쿠키 방문 포함)
+        self.api_requests = np.zeros(runs, dtype=np.int64)  # API 요청 수 (휴식 판단 기준)
+        self.last_break = np.zeros(runs, dtype=np.int64)
+        self.next_token = np.zeros(runs)  # 다음 토큰 충전 시각
+        self.rpm = np.full(runs, float(self.target_rpm))
+        self.throttles = np.zeros(runs)  # 연속 429 수
+        self.last_refresh = np.zeros(runs)
+    
+    def _human_delay(self, min_minutes: float, max_minutes: float, mask: np.ndarray) -> np.ndarray:
+        """_human_like_delay와 같은 분포의 대기 시간 (초, mask가 False인 실행은 0)"""
+        mean = (min_minutes + max_minutes) / 2
+        std = (max_minutes - min_minutes) / 4
+        delay = np.clip(self.rng.normal(mean, std, self.t.size), min_minutes, max_minutes)
+        
+        # 피로도 (세션 10시간에 최대) 와 시간대 보정
+        fatigue = np.minimum(1.0, self.t / 3600 * 0.1)
+        delay *= 1 + fatigue * 0.5
+        
+        hour = (self._start_hour + self.t // 3600) % 24
+        delay *= np.where((hour >= 9) & (hour <= 18), 0.8,
+                          np.where((hour >= 22) | (hour <= 6), 1.3, 1.0))
+        
+        return delay * 60 * mask
+    
+    def _pace(self, min_minutes: float, max_minutes: float, mask: np.ndarray):
+        """_pace: human 모드에서만 대기"""
+        if self.human:
+            self.t += self._human_delay(min_minutes, max_minutes, mask)
+    
+    def _token(self, mask: np.ndarray):
+        """RateScheduler 토큰 대기 (버킷 크기 1, 대기 시간 ±20% 흔들림)"""
+        wait = np.maximum(0.0, self.next_token - self.t)
+        wait *= self.rng.uniform(0.8, 1.2, self.t.size)
+        self.t += wait * mask
+        self.next_token = np.where(mask, np.maximum(self.t, self.next_token) + 60 / self.rpm, self.next_token)
+    
+    def _visit(self, mask: np.ndarray):
+        """랜딩 페이지/쿠키 갱신 방문 (토큰 + 응답 지연)"""
+        self._token(mask)
+        self.t += self.request_latency * mask
+        self.requests += mask
+    
+    def _render(self, mask: np.ndarray):
+        """브라우저 페이지 방문 (토큰 + 응답 지연 + 목록 API 응답 대기)"""
+        self._visit(mask)
+        self.t += self.render_seconds * mask
+    
+    def _request(self, mask: np.ndarray, retry: int = 3):
+        """_send_request: 쿠키 갱신, 휴식, 생각 시간, 재시도, 페이지 읽기"""
+        n = self.t.size
+        
+        refresh = mask & (self.t - self.last_refresh > self.COOKIE_LIFETIME)
+        self._visit(refresh)
+        self.last_refresh = np.where(refresh, self.t, self.last_refresh)
+        
+        if self.human:
+            # _should_take_break: 5-10개 요청마다 80%, 그 외 5% 확률로 휴식
+            since_break = self.api_requests - self.last_break
+            threshold = self.rng.integers(5, 11, n)
+            roll = self.rng.random(n)
+            take_break = mask & np.where(since_break >= threshold, roll < 0.8, roll < 0.05)
+            self.t += (5 + self.rng.beta(2, 2, n) * 10) * 60 * take_break
+            self.last_break = np.where(take_break, self.api_requests, self.last_break)
+            
+            self._pace(0.5, 1.5, mask)
+        
+        pending = mask.copy()
+        for _ in range(retry):
+            if not pending.any():
+                break
+            
+            self._token(pending)
+            self.t += self.request_latency * pending
+            self.requests += pending
+            self.api_requests += pending
+            
+            throttled = pending & (self.rng.random(n) < self.throttle_rate)
+            success = pending & ~throttled
+            
+            # AIMD: 200은 가산 증가, 429는 절반 감소 + 전체 정지
+            self.rpm = np.where(success, np.minimum(self.max_rpm, self.rpm + 0.25), self.rpm)
+            self.rpm = np.where(throttled, np.maximum(self.min_rpm, self.rpm * 0.5), self.rpm)
+            penalty = np.minimum(1800, self.penalty_seconds * 2 ** self.throttles)
+            self.next_token = np.where(throttled, np.maximum(self.next_token, self.t + penalty), self.next_token)
+            self.throttles = np.where(throttled, self.throttles + 1, np.where(success, 0, self.throttles))
+            
+            if self.human:
+                # _simulate_reading: 30% 확률, 30~150초
+                reading = np.clip(self.rng.gamma(2, 1.5, n) * 30, 30, 150)
+                self.t += reading * (success & (self.rng.random(n) < 0.3))
+            
+            pending = throttled
+    
+    def _pages(self, counts: np.ndarray) -> np.ndarray:
+        """항목 수 → 페이지 수 (최소 1, 최대 MAX_PAGES)"""
+        return np.clip(np.ceil(counts / self.PAGE_SIZE), 1, self.MAX_PAGES).astype(np.int64)
+    
+    def _paged_requests(self, pages: np.ndarray, mask: np.ndarray, pace: bool = False):
+        """페이지 수만큼 요청 (실행마다 페이지 수가 다름)"""
+        for page in range(int(pages[mask].max(initial=0))):
+            page_mask = mask & (page < pages)
+            self._request(page_mask)
+            if pace:
+                self._pace(1.0, 2.5, page_mask)
+    
+    def _scrape_region(self, trade_types: int):
+        """scrape_region 한 번 (지역 하나, 모든 거래 유형)"""
+        n = self.t.size
+        everyone = np.ones(n, dtype=bool)
+        
+        for idx in range(trade_types):
+            if idx > 0:
+                self._pace(15.0, 30.0, everyone)
+            
+            complexes = self.rng.poisson(self.complexes_per_region, n)
+            
+            # 단지 목록
+            if self.use_browser:
+                self._render(everyone)
+            else:
+                self._visit(everyone)
+                self._paged_requests(self._pages(complexes), everyone)
+            
+            # 단지별 매물
+            crawl_count = np.minimum(complexes, self.max_complexes)
+            for slot in range(self.max_complexes):
+                changed = (slot < crawl_count) & (self.rng.random(n) < self.changed_ratio)
+                if not changed.any():
+                    continue
+                
+                if self.use_browser:
+                    self._render(changed)
+                else:
+                    self._visit(changed)
+                    articles = self.rng.poisson(self.articles_per_complex, n)
+                    self._paged_requests(self._pages(articles), changed, pace=True)
+                
+                self._pace(2.5, 5.0, changed)
+                
+                if self.human:
+                    long_break = changed & (self.rng.random(n) < 0.2)
+                    self.t += self.rng.uniform(7.5, 15, n) * 60 * long_break
+    
+    def simulate(self, regions: int, trade_types: int, runs: int = 10000) -> Dict[str, np.ndarray]:
+        """
+        전체 실행(모든 지역 × 거래 유형)을 runs번 시뮬레이션
+        
+        Args:
+            regions: 지역 수 (SEARCH_REGIONS 개수)
+            trade_types: 거래 유형 수 (TRADE_TYPES 개수)
+            runs: 시뮬레이션 횟수
+        
+        Returns:
+            {'seconds': 실행별 소요 시간, 'requests': 실행별 요청 수}
+        """
+        self._reset(runs)
+        
+        # 크롤러 생성 시 메인 페이지 방문
+        self._visit(np.ones(runs, dtype=bool))
+        
+        for _ in range(regions):
+            self._scrape_region(trade_types)
+        
+        return {'seconds': self.t.copy(), 'requests': self.requests.copy()}
+    
+    def estimate(self, regions: int, trade_types: int, runs: int = 10000,
+                 limit_hours: Optional[float] = None) -> Dict:
+        """
+        소요 시간/요청 수 분포 요약
+        
+        Args:
+            regions: 지역 수
+            trade_types: 거래 유형 수
+            runs: 시뮬레이션 횟수
+            limit_hours: 실행 시간 제한 (시간, 초과 확률 계산용)
+        
+        Returns:
+            요약 통계 딕셔너리 (시간 단위: 시간)
+        """
+        result = self.simulate(regions, trade_types, runs)
+        hours = result['seconds'] / 3600
+        requests = result['requests']
+        
+        summary = {
+            'runs': runs,
+            'hours_mean': round(float(hours.mean()), 2),
+            'hours_p50': round(float(np.percentile(hours, 50)), 2),
+            'hours_p90': round(float(np.percentile(hours, 90)), 2),
+            'hours_p95': round(float(np.percentile(hours, 95)), 2),
+            'hours_p99': round(float(np.percentile(hours, 99)), 2),
+            'hours_max': round(float(hours.max()), 2),
+            'requests_mean': round(float(requests.mean()), 1),
+            'requests_p95': int(np.percentile(requests, 95)),
+        }
+        if limit_hours:
+            summary['limit_hours'] = limit_hours
+            summary['over_limit_ratio'] = round(float((hours > limit_hours).mean()), 4)
+        
+        return summary
+
+
+def main():
+    """명령줄 실행 (기본값은 .env의 SEARCH_REGIONS, TRADE_TYPES, PACING_MODE, TARGET_RPM 등)"""
+    load_dotenv()
+    
+    regions = [r for r in os.getenv('SEARCH_REGIONS', '').split(',') if r.strip()]
+    trade_types = [t for t in os.getenv('TRADE_TYPES', 'A1,B1').split(',') if t.strip()]
+    
+    parser = argparse.ArgumentParser(description='크롤링 소요 시간 Monte Carlo 추정')
+    parser.add_argument('--regions', type=int, default=len(regions) or 1, help='지역 수 (기본값: SEARCH_REGIONS)')
+    parser.add_argument('--trade-types', type=int, default=len(trade_types), help='거래 유형 수 (기본값: TRADE_TYPES)')
+    parser.add_argument('--pacing', default=os.getenv('PACING_MODE', 'scheduler').strip().lower(),
+                        choices=['scheduler', 'human'])
+    parser.add_argument('--browser', type=int, default=int(os.getenv('USE_BROWSER', '1').strip().lower() not in ('0', 'false', 'no')),
+                        help='1: Playwright 브라우저 모드, 0: requests 모드')
+    parser.add_argument('--rpm', type=float, default=float(os.getenv('TARGET_RPM', '4')), help='목표 분당 요청 수')
+    parser.add_argument('--max-rpm', type=float, default=float(os.getenv('MAX_RPM', '0')) or None, help='최대 분당 요청 수')
+    parser.add_argument('--complexes', type=float, default=30, help='지역당 평균 단지 수')
+    parser.add_argument('--articles', type=float, default=40, help='단지당 평균 매물 수')
+    parser.add_argument('--max-complexes', type=int, default=10, help='지역·거래 유형당 최대 크롤링 단지 수')
+    parser.add_argument('--changed-ratio', type=float, default=1.0, help='매물 수가 바뀐 단지 비율')
+    parser.add_argument('--latency', type=float, default=0.5, help='평균 응답 시간 (초)')
+    parser.add_argument('--throttle-rate', type=float, default=0.0, help='429 응답 확률')
+    parser.add_argument('--start-hour', type=int, default=None, help='실행 시작 시각 (시)')
+    parser.add_argument('--runs', type=int, default=10000, help='시뮬레이션 횟수')
+    parser.add_argument('--limit-hours', type=float, default=6.0, help='실행 시간 제한 (GitHub Actions: 6시간)')
+    parser.add_argument('--seed', type=int, default=None)
+    args = parser.parse_args()
+    
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    
+    estimator = CrawlEstimator(
+        pacing_mode=args.pacing,
+        use_browser=bool(args.browser),
+        requests_per_minute=args.rpm,
+        max_requests_per_minute=args.max_rpm,
+        complexes_per_region=args.complexes,
+        articles_per_complex=args.articles,
+        max_complexes=args.max_complexes,
+        changed_ratio=args.changed_ratio,
+        request_latency=args.latency,
+        throttle_rate=args.throttle_rate,
+        start_hour=args.start_hour,
+        seed=args.seed
+    )
+    
+    logger.info(f"🎲 시뮬레이션: 지역 {args.regions}개 × 거래 유형 {args.trade_types}개, "
+                f"{args.pacing} 모드, {args.runs}회")
+    summary = estimator.estimate(args.regions, args.trade_types, args.runs, args.limit_hours)
+    
+    logger.info(f"⏱️  소요 시간 (시간): 평균 {summary['hours_mean']}, 중앙값 {summary['hours_p50']}, "
+                f"p90 {summary['hours_p90']}, p95 {summary['hours_p95']}, p99 {summary['hours_p99']}, "
+                f"최대 {summary['hours_max']}")
+    logger.info(f"📨 요청 수: 평균 {summary['requests_mean']}, p95 {summary['requests_p95']}")
+    if 'over_limit_ratio' in summary:
+        logger.info(f"🚨 {summary['limit_hours']}시간 초과 확률: {summary['over_limit_ratio'] * 100:.2f}%")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,31 +5,95 @@ SQLite 데이터베이스 관리 모듈
 
 import sqlite3
 import os
-from datetime import datetime
-from typing import List, Dict, Optional
+import json
+import threading
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from typing import List, Dict, Optional, Set, Iterator
 
 
 class PropertyDatabase:
     """부동산 매물 데이터베이스 관리 클래스"""
     
-    def __init__(self, db_path: str = "data/properties.db"):
+    # properties 테이블 컬럼 (병합 시 컬럼 순서에 의존하지 않도록 명시)
+    PROPERTY_COLUMNS = [
+        'id', 'complex_no', 'complex_name', 'article_no',
+        'price', 'area_real', 'area_exclusive', 'floor', 'total_floors',
+        'direction', 'trade_type', 'approval_year', 'household_count',
+        'room_count', 'bathroom_count', 'loan_amount', 'description',
+        'url', 'first_seen', 'last_checked', 'notified'
+    ]
+    
+    # 단지 정보에서 오는 컬럼 (새 매물은 비워 두고 complexes 테이블 값으로 채워 읽음)
+    COMPLEX_PROPERTY_COLUMNS = {
+        'complex_name': 'c.complex_name',
+        'total_floors': 'c.max_floor',
+        'approval_year': 'CAST(substr(c.use_approve_ymd, 1, 4) AS INTEGER)',
+        'household_count': 'c.household_count',
+    }
+    
+    def __init__(self, db_path: str = "data/properties.db", persistent: bool = False):
         """
         데이터베이스 초기화
         
         Args:
             db_path: 데이터베이스 파일 경로
+            persistent: 연결 하나를 계속 열어두고 재사용 (데몬 모드, 여러 스레드가 잠금으로 나눠 씀)
         """
         self.db_path = db_path
         
         # 디렉토리가 없으면 생성
         os.makedirs(os.path.dirname(db_path), exist_ok=True)
         
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False) if persistent else None
+        
         # 데이터베이스 연결 및 테이블 생성
         self._init_database()
     
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """
+        데이터베이스 연결 (블록이 끝나면 커밋, 오류면 롤백)
+        
+        persistent 모드면 열어둔 연결을 잠금과 함께 빌려주고, 아니면 매번 새로 연결 후 닫습니다.
+        """
+        if self._conn is None:
+            conn = sqlite3.connect(self.db_path)
+            try:
+                with conn:
+                    yield conn
+            finally:
+                conn.close()
+            return
+        
+        with self._lock:
+            with self._conn:
+                yield self._conn
+    
+    def _property_select(self) -> str:
+        """매물 조회 SELECT 구문 (비어 있는 단지 정보 컬럼은 complexes 테이블 값 사용)"""
+        columns = [
+            f"COALESCE(p.{column}, {self.COMPLEX_PROPERTY_COLUMNS[column]}) AS {column}"
+            if column in self.COMPLEX_PROPERTY_COLUMNS else f"p.{column}"
+            for column in self.PROPERTY_COLUMNS
+        ]
+        return f"""
+            SELECT {', '.join(columns)}
+            FROM properties p
+            LEFT JOIN complexes c ON p.complex_no = c.complex_no
+        """
+    
+    def close(self):
+        """열어둔 연결 닫기 (persistent 모드)"""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+    
     def _init_database(self):
         """데이터베이스 테이블 생성"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             
             cursor.execute("""
@@ -69,6 +133,86 @@ class PropertyDatabase:
                 ON properties(notified)
             """)
             
+            # 단지별 매물 수 스냅샷 (변경 없는 단지 건너뛰기용)
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS complex_snapshots (
+                    complex_no TEXT,
+                    trade_type TEXT,
+                    deal_count INTEGER,
+                    lease_count INTEGER,
+                    rent_count INTEGER,
+                    checked_at TIMESTAMP,
+                    PRIMARY KEY (complex_no, trade_type)
+                )
+            """)
+            
+            # 크롤링에서 받은 모든 매물 ID (필터 통과 여부와 무관, 기존 매물만 있는 페이지에서 조기 종료용)
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS seen_articles (
+                    id TEXT PRIMARY KEY,
+                    complex_no TEXT,
+                    first_seen TIMESTAMP,
+                    last_seen TIMESTAMP
+                )
+            """)
+            
+            # 단지별 재크롤링 일정 (신규 매물이 자주 나오는 단지일수록 짧은 간격)
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS crawl_schedule (
+                    complex_no TEXT,
+                    trade_type TEXT,
+                    rate_per_day REAL,
+                    interval_hours REAL,
+                    last_crawled_at TIMESTAMP,
+                    next_crawl_at TIMESTAMP,
+                    PRIMARY KEY (complex_no, trade_type)
+                )
+            """)
+            
+            # 단지 정보 (매물이 complex_no로 참조, updated_at이 있으면 단지 목록 요청으로 받은 정보)
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS complexes (
+                    complex_no TEXT PRIMARY KEY,
+                    cortar_no TEXT,
+                    complex_name TEXT,
+                    max_floor INTEGER,
+                    use_approve_ymd TEXT,
+                    household_count INTEGER,
+                    latitude REAL,
+                    longitude REAL,
+                    data TEXT,
+                    updated_at TIMESTAMP
+                )
+            """)
+            
+            # 지역/거래 유형별 단지 목록 캐시 (query: 단지 목록 요청 파라미터, 바뀌면 다시 요청)
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS complex_lists (
+                    cortar_no TEXT,
+                    trade_type TEXT,
+                    query TEXT,
+                    complex_nos TEXT,
+                    fetched_at TIMESTAMP,
+                    PRIMARY KEY (cortar_no, trade_type)
+                )
+            """)
+            
+            # 크롤링 작업 항목 (중단 후 재시작 시 완료된 페이지부터 이어서 진행)
+            # complex_no가 빈 문자열이면 단지 목록 페이지
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS crawl_frontier (
+                    region TEXT,
+                    trade_type TEXT,
+                    complex_no TEXT,
+                    page INTEGER,
+                    state TEXT,
+                    items TEXT,
+                    has_more BOOLEAN DEFAULT 0,
+                    updated_at TIMESTAMP,
+                    PRIMARY KEY (region, trade_type, complex_no, page)
+                )
+            """)
+            
             conn.commit()
     
     def property_exists(self, property_id: str) -> bool:
@@ -81,7 +225,7 @@ class PropertyDatabase:
         Returns:
             존재 여부
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             cursor.execute(
                 "SELECT COUNT(*) FROM properties WHERE id = ?",
@@ -90,12 +234,82 @@ class PropertyDatabase:
             count = cursor.fetchone()[0]
             return count > 0
     
-    def add_property(self, property_data: Dict) -> bool:
+    def filter_existing_ids(self, property_ids: List[str]) -> Set[str]:
+        """
+        주어진 매물 ID 중 이미 데이터베이스에 존재하는 ID만 반환
+        
+        Args:
+            property_ids: 확인할 매물 ID 리스트
+            
+        Returns:
+            존재하는 매물 ID 집합
+        """
+        if not property_ids:
+            return set()
+        
+        with self._connect() as conn:
+            cursor = conn.cursor()
+            placeholders = ','.join('?' * len(property_ids))
+            cursor.execute(
+                f"SELECT id FROM properties WHERE id IN ({placeholders})",
+                list(property_ids)
+            )
+            return {row[0] for row in cursor.fetchall()}
+    
+    def filter_seen_ids(self, property_ids: List[str]) -> Set[str]:
+        """
+        주어진 매물 ID 중 이전 크롤링에서 이미 받은 ID만 반환 (필터에서 걸러진 매물 포함)
+        
+        Args:
+            property_ids: 확인할 매물 ID 리스트 ('{단지 번호}_{매물 번호}')
+            
+        Returns:
+            이미 받은 매물 ID 집합
+        """
+        if not property_ids:
+            return set()
+        
+        with self._connect() as conn:
+            cursor = conn.cursor()
+            placeholders = ','.join('?' * len(property_ids))
+            cursor.execute(
+                f"SELECT id FROM seen_articles WHERE id IN ({placeholders})",
+                list(property_ids)
+            )
+            return {row[0] for row in cursor.fetchall()}
+    
+    def mark_articles_seen(self, complex_no: str, property_ids: List[str], seen_at: Optional[datetime] = None):
+        """
+        크롤링에서 받은 매물 ID 기록 (이미 있으면 last_seen만 갱신)
+        
+        Args:
+            complex_no: 단지 번호
+            property_ids: 매물 ID 리스트
+            seen_at: 받은 시각 (없으면 현재 시각, 가상 시계를 쓰면 크롤러의 clock.now())
+        """
+        if not property_ids:
+            return
+        
+        now = (seen_at or datetime.now()).isoformat()
+        with self._connect() as conn:
+            cursor = conn.cursor()
+            cursor.executemany("""
+                INSERT INTO seen_articles (id, complex_no, first_seen, last_seen)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT(id) DO UPDATE SET last_seen = excluded.last_seen
+            """, [(property_id, complex_no, now, now) for property_id in set(property_ids)])
+            conn.commit()
+    
+    def add_property(self, property_data: Dict, seen_at: Optional[datetime] = None) -> bool:
         """
         새 매물 추가
         
+        단지명, 총 층수, 사용승인연도, 세대수는 매물마다 복사하지 않고 complexes 테이블에 한 번만 저장합니다
+        (단지 정보가 없으면 매물 값으로 만듦).
+        
         Args:
             property_data: 매물 정보 딕셔너리
+            seen_at: 발견 시각 (없으면 현재 시각, 가상 시계를 쓰면 크롤러의 clock.now())
             
         Returns:
             추가 성공 여부
@@ -103,11 +317,23 @@ class PropertyDatabase:
         if self.property_exists(property_data['id']):
             return False
         
-        now = datetime.now().isoformat()
+        now = (seen_at or datetime.now()).isoformat()
         
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             
+            cursor.execute("""
+                INSERT OR IGNORE INTO complexes (
+                    complex_no, complex_name, max_floor, use_approve_ymd, household_count
+                ) VALUES (?, ?, ?, ?, ?)
+            """, (
+                property_data.get('complex_no', ''),
+                property_data.get('complex_name', ''),
+                property_data.get('total_floors', 0),
+                str(property_data.get('approval_year', '') or ''),
+                property_data.get('household_count', 0)
+            ))
+            
             cursor.execute("""
                 INSERT INTO properties (
                     id, complex_no, complex_name, article_no,
@@ -119,17 +345,17 @@ class PropertyDatabase:
             """, (
                 property_data['id'],
                 property_data.get('complex_no', ''),
-                property_data.get('complex_name', ''),
+                None,  # complex_name → complexes
                 property_data.get('article_no', ''),
                 property_data.get('price', 0),
                 property_data.get('area_real', 0),
                 property_data.get('area_exclusive', 0),
                 property_data.get('floor', ''),
-                property_data.get('total_floors', 0),
+                None,  # total_floors → complexes
                 property_data.get('direction', ''),
                 property_data.get('trade_type', ''),
-                property_data.get('approval_year', 0),
-                property_data.get('household_count', 0),
+                None,  # approval_year → complexes
+                None,  # household_count → complexes
                 property_data.get('room_count', 0),
                 property_data.get('bathroom_count', 0),
                 property_data.get('loan_amount', 0),
@@ -150,7 +376,7 @@ class PropertyDatabase:
         Args:
             property_id: 매물 고유 ID
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             cursor.execute(
                 "UPDATE properties SET notified = 1 WHERE id = ?",
@@ -165,14 +391,14 @@ class PropertyDatabase:
         Returns:
             매물 정보 리스트
         """
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
+        with self._connect() as conn:
             cursor = conn.cursor()
+            cursor.row_factory = sqlite3.Row
             
-            cursor.execute("""
-                SELECT * FROM properties 
-                WHERE notified = 0 
-                ORDER BY first_seen DESC
+            cursor.execute(f"""
+                {self._property_select()}
+                WHERE p.notified = 0 
+                ORDER BY p.first_seen DESC
             """)
             
             rows = cursor.fetchall()
@@ -185,11 +411,528 @@ class PropertyDatabase:
         Returns:
             매물 ID 리스트
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             cursor.execute("SELECT id FROM properties")
             return [row[0] for row in cursor.fetchall()]
     
+    def save_complexes(self, cortar_no: str, trade_type: str, query: str, complexes: List[Dict],
+                       fetched_at: Optional[datetime] = None):
+        """
+        단지 목록 요청 결과를 단지 정보와 지역/거래 유형별 단지 목록으로 저장
+        
+        Args:
+            cortar_no: 지역 코드
+            trade_type: 거래 유형
+            query: 단지 목록 요청 파라미터 (같은 파라미터로 요청할 때만 캐시 사용)
+            complexes: 단지 정보 리스트 (complexList 항목)
+            fetched_at: 요청 시각 (없으면 현재 시각)
+        """
+        now = (fetched_at or datetime.now()).isoformat()
+        
+        with self._connect() as conn:
+            cursor = conn.cursor()
+            cursor.executemany("""
+                INSERT INTO complexes (
+                    complex_no, cortar_no, complex_name, max_floor, use_approve_ymd,
+                    household_count, latitude, longitude, data, updated_at
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(complex_no) DO UPDATE SET
+                    cortar_no = excluded.cortar_no,
+                    complex_name = excluded.complex_name,
+                    max_floor = excluded.max_floor,
+                    use_approve_ymd = excluded.use_approve_ymd,
+                    household_count = excluded.household_count,
+                    latitude = excluded.latitude,
+                    longitude = excluded.longitude,
+                    data = excluded.data,
+                    updated_at = excluded.updated_at
+            """, [
+                (
+                    str(complex_info.get('complexNo', '')),
+                    complex_info.get('cortarNo', cortar_no),
+                    complex_info.get('complexName', ''),
+                    complex_info.get('maxFloor', 0),
+                    complex_info.get('useApproveYmd', ''),
+                    complex_info.get('totalHouseholdCount', 0),
+                    complex_info.get('latitude'),
+                    complex_info.get('longitude'),
+                    json.dumps(complex_info, ensure_ascii=False),
+                    now
+                )
+                for complex_info in complexes
+            ])
+            
+            cursor.execute("""
+                INSERT OR REPLACE INTO complex_lists (cortar_no, trade_type, query, complex_nos, fetched_at)
+                VALUES (?, ?, ?, ?, ?)
+            """, (
+                cortar_no, trade_type, query,
+                json.dumps([str(complex_info.get('complexNo', '')) for complex_info in complexes]),
+                now
+            ))
+    
+    def get_cached_complexes(self, cortar_no: str, trade_type: str, query: str,
+                             max_age_hours: float, now: Optional[datetime] = None) -> Optional[List[Dict]]:
+        """
+        캐시된 단지 목록 가져오기
+        
+        Args:
+            cortar_no: 지역 코드
+            trade_type: 거래 유형
+            query: 단지 목록 요청 파라미터
+            max_age_hours: 캐시 유효 시간 (시간)
+            now: 기준 시각 (없으면 현재 시각)
+            
+        Returns:
+            단지 정보 리스트 (캐시가 없거나 만료됐거나 요청 파라미터가 다르면 None)
+        """
+        cutoff = ((now or datetime.now()) - timedelta(hours=max_age_hours)).isoformat()
+        
+        with self._connect() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT complex_nos FROM complex_lists
+                WHERE cortar_no = ? AND trade_type = ? AND query = ? AND fetched_at >= ?
+            """, (cortar_no, trade_type, query, cutoff))
+            row = cursor.fetchone()
+            if row is None:
+                return None
+            
+            complex_nos = json.loads(row[0])
+            if not complex_nos:
+                return []
+            
+            placeholders = ','.join('?' * len(complex_nos))
+            cursor.execute(
+                f"SELECT complex_no, data FROM complexes WHERE complex_no IN ({placeholders}) AND data IS NOT NULL",
+                complex_nos
+            )
+            cached = {complex_no: json.loads(data) for complex_no, data in cursor.fetchall()}
+        
+        # 단지 정보가 빠졌으면 (병합 등) 캐시를 쓰지 않고 다시 요청
+        if len(cached) < len(complex_nos):
+            return None
+        return [cached[complex_no] for complex_no in complex_nos]
+    
+    def get_complex_snapshot(self, complex_no: str, trade_type: str) -> Optional[Dict]:
+        """
+        단지의 마지막 매물 수 스냅샷 가져오기
+        
+        Args:
+            complex_no: 단지 번호
+            trade_type: 거래 유형
+            
+        Returns:
+            스냅샷 정보 (없으면 None)
+        """
+        with self._connect() as conn:
+            cursor = conn.cursor()
+            cursor.row_factory = sqlite3.Row
+            cursor.execute(
+                "SELECT * FROM complex_snapshots WHERE complex_no = ? AND trade_type = ?",
+                (complex_no, trade_type)
+            )
+            row = cursor.fetchone()
+            return dict(row) if row else None
+    
+    def save_complex_snapshot(self, complex_no: str, trade_type: str, counts: Dict,
+                              checked_at: Optional[datetime] = None):
+        """
+        단지의 매물 수 스냅샷 저장 (있으면 덮어쓰기)
+        
+        Args:
+            complex_no: 단지 번호
+            trade_type: 거래 유형
+            counts: 매물 수 ({'deal_count', 'lease_count', 'rent_count'})
+            checked_at: 확인 시각 (없으면 현재 시각)
+        """
+        with self._connect() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                INSERT OR REPLACE INTO complex_snapshots (
+                    complex_no, trade_type, deal_count, lease_count, rent_count, checked_at
+                ) VALUES (?, ?, ?, ?, ?, ?)
+            """, (
+                complex_no,
+                trade_type,
+                counts.get('deal_count', 0),
+                counts.get('lease_count', 0),
+                counts.get('rent_count', 0),
+                (checked_at or datetime.now()).isoformat()
+            ))
+            conn.commit()
+    
+    def get_crawl_schedule(self, complex_no: str, trade_type: str) -> Optional[Dict]:
+        """
+        단지의 재크롤링 일정 가져오기
+        
+        Args:
+            complex_no: 단지 번호
+            trade_type: 거래 유형
+            
+        Returns:
+            일정 딕셔너리 (rate_per_day, interval_hours, last_crawled_at, next_crawl_at), 없으면 None
+        """
+        with self._connect() as conn:
+            cursor = conn.cursor()
+            cursor.row_factory = sqlite3.Row
+            cursor.execute("""
+                SELECT rate_per_day, interval_hours, last_crawled_at, next_crawl_at
+                FROM crawl_schedule WHERE complex_no = ? AND trade_type = ?
+            """, (complex_no, trade_type))
+            row = cursor.fetchone()
+            return dict(row) if row else None
+    
+    def mark_complex_crawled(self, complex_no: str, trade_type: str, crawled_at: datetime):
+        """
+        단지를 크롤링했다고 기록 (정해진 간격이 있으면 다음 크롤링 시각도 갱신)
+        
+        Args:
+            complex_no: 단지 번호
+            trade_type: 거래 유형
+            crawled_at: 크롤링 시각
+        """
+        with self._connect() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                INSERT INTO crawl_schedule (complex_no, trade_type, last_crawled_at)
+                VALUES (?, ?, ?)
+                ON CONFLICT(complex_no, trade_type) DO UPDATE SET
+                    last_crawled_at = excluded.last_crawled_at
+            """, (complex_no, trade_type, crawled_at.isoformat()))
+            cursor.execute("""
+                UPDATE crawl_schedule
+                SET next_crawl_at = strftime('%Y-%m-%dT%H:%M:%f', last_crawled_at, '+' || (interval_hours * 3600) || ' seconds')
+                WHERE complex_no = ? AND trade_type = ? AND interval_hours IS NOT NULL
+            """, (complex_no, trade_type))
+            conn.commit()
+    
+    def get_passed_counts(self, trade_type: str, since: datetime) -> Dict[str, int]:
+        """
+        단지별로 저장된 매물 수 (저장된 매물은 모두 필터를 통과한 매물, 단지 우선순위 계산용)
+        
+        Args:
+            trade_type: 거래 유형
+            since: 이 시각 이후에 처음 발견된 매물만 셈
+            
+        Returns:
+            {단지 번호: 매물 수}
+        """
+        with self._connect() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT complex_no, COUNT(*) FROM properties
+                WHERE trade_type = ? AND first_seen > ?
+                GROUP BY complex_no
+            """, (trade_type, since.isoformat()))
+            return dict(cursor.fetchall())
+    
+    def get_arrival_history(self, since: datetime) -> List[Dict]:
+        """
+        단지/거래 유형별 신규 매물 발생 기록 (재크롤링 간격 추정용)
+        
+        처음 크롤링할 때 한꺼번에 저장된 기존 매물은 신규 발생이 아니므로,
+        단지의 첫 매물 시각(history_start)으로부터 1시간 안에 저장된 매물은 세지 않습니다.
+        
+        Args:
+            since: 이 시각 이후에 처음 발견된 매물만 셈
+            
+        Returns:
+            [{'complex_no', 'trade_type', 'history_start', 'arrivals'}] (일정이 있는 단지는 매물이 없어도 포함)
+        """
+        with self._connect() as conn:
+            cursor = conn.cursor()
+            cursor.row_factory = sqlite3.Row
+            cursor.execute("""
+                WITH starts AS (
+                    SELECT complex_no, trade_type, MIN(first_seen) AS history_start
+                    FROM properties GROUP BY complex_no, trade_type
+                ),
+                arrivals AS (
+                    SELECT p.complex_no, p.trade_type, COUNT(*) AS arrivals
+                    FROM properties p JOIN starts s
+                      ON p.complex_no = s.complex_no AND p.trade_type = s.trade_type
+                    WHERE p.first_seen > ?
+                      AND p.first_seen > strftime('%Y-%m-%dT%H:%M:%f', s.history_start, '+1 hour')
+                    GROUP BY p.complex_no, p.trade_type
+                ),
+                known AS (
+                    SELECT complex_no, trade_type FROM starts
+                    UNION
+                    SELECT complex_no, trade_type FROM crawl_schedule
+                )
+                SELECT k.complex_no, k.trade_type,
+                       COALESCE(s.history_start, c.last_crawled_at) AS history_start,
+                       COALESCE(a.arrivals, 0) AS arrivals
+                FROM known k
+                LEFT JOIN starts s ON k.complex_no = s.complex_no AND k.trade_type = s.trade_type
+                LEFT JOIN arrivals a ON k.complex_no = a.complex_no AND k.trade_type = a.trade_type
+                LEFT JOIN crawl_schedule c ON k.complex_no = c.complex_no AND k.trade_type = c.trade_type
+            """, (since.isoformat(),))
+            rows = [dict(row) for row in cursor.fetchall()]
+            return rows
+    
+    def save_crawl_intervals(self, intervals: List[Dict]):
+        """
+        단지별 재크롤링 간격 저장 (마지막 크롤링 시각 + 간격으로 다음 크롤링 시각 계산)
+        
+        Args:
+            intervals: [{'complex_no', 'trade_type', 'rate_per_day', 'interval_hours'}]
+        """
+        with self._connect() as conn:
+            cursor = conn.cursor()
+            cursor.executemany("""
+                INSERT INTO crawl_schedule (complex_no, trade_type, rate_per_day, interval_hours)
+                VALUES (:complex_no, :trade_type, :rate_per_day, :interval_hours)
+                ON CONFLICT(complex_no, trade_type) DO UPDATE SET
+                    rate_per_day = excluded.rate_per_day,
+                    interval_hours = excluded.interval_hours
+            """, intervals)
+            cursor.execute("""
+                UPDATE crawl_schedule
+                SET next_crawl_at = strftime('%Y-%m-%dT%H:%M:%f', last_crawled_at, '+' || (interval_hours * 3600) || ' seconds')
+                WHERE last_crawled_at IS NOT NULL AND interval_hours IS NOT NULL
+            """)
+            conn.commit()
+    
+    def get_frontier_page(self, region: str, trade_type: str, complex_no: str, page: int,
+                          max_age_minutes: float, now: Optional[datetime] = None) -> Optional[Dict]:
+        """
+        최근에 완료된 작업 항목(페이지) 가져오기
+        
+        Args:
+            region: 지역 코드
+            trade_type: 거래 유형
+            complex_no: 단지 번호 (단지 목록 페이지면 빈 문자열)
+            page: 페이지 번호
+            max_age_minutes: 이 시간 안에 완료된 항목만 사용 (분)
+            now: 기준 시각 (없으면 현재 시각)
+            
+        Returns:
+            {'items': 페이지 목록, 'has_more': 다음 페이지 존재 여부} (없거나 오래되었으면 None)
+        """
+        cutoff = ((now or datetime.now()) - timedelta(minutes=max_age_minutes)).isoformat()
+        
+        with self._connect() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT items, has_more FROM crawl_frontier
+                WHERE region = ? AND trade_type = ? AND complex_no = ? AND page = ?
+                  AND state = 'done' AND updated_at > ?
+            """, (region, trade_type, complex_no, page, cutoff))
+            row = cursor.fetchone()
+            if not row:
+                return None
+            return {'items': json.loads(row[0]), 'has_more': bool(row[1])}
+    
+    def save_frontier_page(self, region: str, trade_type: str, complex_no: str, page: int, state: str,
+                           items: Optional[List[Dict]] = None, has_more: bool = False,
+                           updated_at: Optional[datetime] = None):
+        """
+        작업 항목(페이지) 상태 저장 (있으면 덮어쓰기)
+        
+        Args:
+            region: 지역 코드
+            trade_type: 거래 유형
+            complex_no: 단지 번호 (단지 목록 페이지면 빈 문자열)
+            page: 페이지 번호
+            state: 'in_progress', 'done', 'failed'
+            items: 완료된 페이지 목록 (done일 때)
+            has_more: 다음 페이지 존재 여부
+            updated_at: 상태 변경 시각 (없으면 현재 시각)
+        """
+        with self._connect() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                INSERT OR REPLACE INTO crawl_frontier (
+                    region, trade_type, complex_no, page, state, items, has_more, updated_at
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """, (
+                region,
+                trade_type,
+                complex_no,
+                page,
+                state,
+                json.dumps(items, ensure_ascii=False) if items is not None else None,
+                has_more,
+                (updated_at or datetime.now()).isoformat()
+            ))
+            conn.commit()
+    
+    def prune_frontier(self, max_age_minutes: Optional[float] = None, now: Optional[datetime] = None) -> int:
+        """
+        작업 항목 정리
+        
+        Args:
+            max_age_minutes: 이 시간보다 오래된 항목만 삭제 (분, None이면 전체 삭제)
+            now: 기준 시각 (없으면 현재 시각)
+            
+        Returns:
+            삭제된 항목 수
+        """
+        with self._connect() as conn:
+            cursor = conn.cursor()
+            if max_age_minutes is None:
+                cursor.execute("DELETE FROM crawl_frontier")
+            else:
+                cutoff = ((now or datetime.now()) - timedelta(minutes=max_age_minutes)).isoformat()
+                cursor.execute("DELETE FROM crawl_frontier WHERE updated_at <= ?", (cutoff,))
+            conn.commit()
+            return cursor.rowcount
+    
+    def get_frontier_stats(self) -> Dict[str, int]:
+        """
+        작업 항목 상태별 개수
+        
+        Returns:
+            {상태: 개수}
+        """
+        with self._connect() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT state, COUNT(*) FROM crawl_frontier GROUP BY state")
+            return dict(cursor.fetchall())
+    
+    def merge_from(self, shard_path: str) -> Dict[str, int]:
+        """
+        샤드 데이터베이스를 이 데이터베이스에 합치기 (여러 작업이 나눠 크롤링한 결과 병합)
+        
+        매물은 id 기준으로 중복 제거하며, 이미 있으면 first_seen은 가장 이른 값, last_checked는
+        가장 늦은 값, notified는 어느 한쪽이라도 알림을 보냈으면 완료로 합칩니다.
+        받은 매물 ID는 first_seen은 가장 이른 값, last_seen은 가장 늦은 값으로 합칩니다.
+        단지 정보, 단지 목록 캐시, 단지 스냅샷, 재크롤링 일정, 작업 항목은 더 최근에 기록된 쪽을 사용합니다.
+        
+        Args:
+            shard_path: 샤드 데이터베이스 파일 경로
+            
+        Returns:
+            병합 통계 ({'properties': 샤드 매물 수, 'new_properties': 새로 추가된 매물 수})
+        """
+        if not os.path.exists(shard_path):
+            raise FileNotFoundError(f"샤드 데이터베이스가 없습니다: {shard_path}")
+        
+        # 예전 스키마로 만든 샤드도 합칠 수 있도록 테이블 보정 (컬럼 순서가 다를 수 있어 모든 테이블을 컬럼 이름으로 병합)
+        PropertyDatabase(shard_path)
+        
+        columns = ', '.join(self.PROPERTY_COLUMNS)
+        
+        with self._connect() as conn:
+            cursor = conn.cursor()
+            cursor.execute("ATTACH DATABASE ? AS shard", (shard_path,))
+            try:
+                cursor.execute("SELECT COUNT(*) FROM properties")
+                before_count = cursor.fetchone()[0]
+                cursor.execute("SELECT COUNT(*) FROM shard.properties")
+                shard_count = cursor.fetchone()[0]
+                
+                # WHERE true: INSERT ... SELECT 뒤의 ON CONFLICT를 조인 구문과 구분하기 위해 필요
+                cursor.execute(f"""
+                    INSERT INTO properties ({columns})
+                    SELECT {columns} FROM shard.properties WHERE true
+                    ON CONFLICT(id) DO UPDATE SET
+                        first_seen = min(properties.first_seen, excluded.first_seen),
+                        last_checked = max(properties.last_checked, excluded.last_checked),
+                        notified = (properties.notified OR excluded.notified)
+                """)
+                
+                cursor.execute("""
+                    INSERT INTO seen_articles (id, complex_no, first_seen, last_seen)
+                    SELECT id, complex_no, first_seen, last_seen FROM shard.seen_articles WHERE true
+                    ON CONFLICT(id) DO UPDATE SET
+                        first_seen = min(seen_articles.first_seen, excluded.first_seen),
+                        last_seen = max(seen_articles.last_seen, excluded.last_seen)
+                """)
+                
+                cursor.execute("""
+                    INSERT INTO complexes (
+                        complex_no, cortar_no, complex_name, max_floor, use_approve_ymd, household_count,
+                        latitude, longitude, data, updated_at
+                    )
+                    SELECT complex_no, cortar_no, complex_name, max_floor, use_approve_ymd, household_count,
+                           latitude, longitude, data, updated_at
+                    FROM shard.complexes WHERE true
+                    ON CONFLICT(complex_no) DO UPDATE SET
+                        cortar_no = excluded.cortar_no,
+                        complex_name = excluded.complex_name,
+                        max_floor = excluded.max_floor,
+                        use_approve_ymd = excluded.use_approve_ymd,
+                        household_count = excluded.household_count,
+                        latitude = excluded.latitude,
+                        longitude = excluded.longitude,
+                        data = excluded.data,
+                        updated_at = excluded.updated_at
+                    WHERE excluded.updated_at > complexes.updated_at
+                       OR complexes.updated_at IS NULL
+                """)
+                
+                cursor.execute("""
+                    INSERT INTO complex_lists (cortar_no, trade_type, query, complex_nos, fetched_at)
+                    SELECT cortar_no, trade_type, query, complex_nos, fetched_at
+                    FROM shard.complex_lists WHERE true
+                    ON CONFLICT(cortar_no, trade_type) DO UPDATE SET
+                        query = excluded.query,
+                        complex_nos = excluded.complex_nos,
+                        fetched_at = excluded.fetched_at
+                    WHERE excluded.fetched_at > complex_lists.fetched_at
+                """)
+                
+                cursor.execute("""
+                    INSERT INTO complex_snapshots (
+                        complex_no, trade_type, deal_count, lease_count, rent_count, checked_at
+                    )
+                    SELECT complex_no, trade_type, deal_count, lease_count, rent_count, checked_at
+                    FROM shard.complex_snapshots WHERE true
+                    ON CONFLICT(complex_no, trade_type) DO UPDATE SET
+                        deal_count = excluded.deal_count,
+                        lease_count = excluded.lease_count,
+                        rent_count = excluded.rent_count,
+                        checked_at = excluded.checked_at
+                    WHERE excluded.checked_at > complex_snapshots.checked_at
+                """)
+                
+                cursor.execute("""
+                    INSERT INTO crawl_schedule (
+                        complex_no, trade_type, rate_per_day, interval_hours, last_crawled_at, next_crawl_at
+                    )
+                    SELECT complex_no, trade_type, rate_per_day, interval_hours, last_crawled_at, next_crawl_at
+                    FROM shard.crawl_schedule WHERE true
+                    ON CONFLICT(complex_no, trade_type) DO UPDATE SET
+                        rate_per_day = excluded.rate_per_day,
+                        interval_hours = excluded.interval_hours,
+                        last_crawled_at = excluded.last_crawled_at,
+                        next_crawl_at = excluded.next_crawl_at
+                    WHERE excluded.last_crawled_at > crawl_schedule.last_crawled_at
+                       OR crawl_schedule.last_crawled_at IS NULL
+                """)
+                
+                cursor.execute("""
+                    INSERT INTO crawl_frontier (
+                        region, trade_type, complex_no, page, state, items, has_more, updated_at
+                    )
+                    SELECT region, trade_type, complex_no, page, state, items, has_more, updated_at
+                    FROM shard.crawl_frontier WHERE true
+                    ON CONFLICT(region, trade_type, complex_no, page) DO UPDATE SET
+                        state = excluded.state,
+                        items = excluded.items,
+                        has_more = excluded.has_more,
+                        updated_at = excluded.updated_at
+                    WHERE excluded.updated_at > crawl_frontier.updated_at
+                """)
+                
+                cursor.execute("SELECT COUNT(*) FROM properties")
+                after_count = cursor.fetchone()[0]
+                conn.commit()
+            finally:
+                # 트랜잭션이 열려 있으면 DETACH가 실패하므로 (오류 시) 먼저 롤백
+                if conn.in_transaction:
+                    conn.rollback()
+                cursor.execute("DETACH DATABASE shard")
+            
+            return {
+                'properties': shard_count,
+                'new_properties': after_count - before_count
+            }
+    
     def get_stats(self) -> Dict:
         """
         데이터베이스 통계 정보
@@ -197,7 +940,7 @@ class PropertyDatabase:
         Returns:
             통계 정보 딕셔너리
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             
             cursor.execute("SELECT COUNT(*) FROM properties")
@@ -59,6 +59,58 @@ class FilterManager:
             "options": []
         }
     
+    def to_query_params(self, trade_type: str, current_year: int) -> Dict:
+        """
+        필터 조건을 네이버 API 쿼리 파라미터로 변환 (서버에서 먼저 걸러 전송량/페이지 수 감소)
+        
+        서버 결과는 항상 필터 결과를 포함하도록 넉넉하게 변환하며, 정확한 판정은 apply_filters가 합니다.
+        - price_range → priceMin/priceMax (만원, 'B1:B2'처럼 여러 거래 유형이면 범위를 합침)
+        - area_range → areaMin (API 면적이 공급면적일 수 있어 전용면적 상한은 보내지 않음)
+        - household_count → minHouseHoldCount/maxHouseHoldCount
+        - approval_year → recentlyBuildYears(N년 이내)/oldBuildYears(N년 이상), 경계 연도를 포함하도록 1년 여유
+        
+        Args:
+            trade_type: 거래 유형 (예: 'B1', 'B1:B2')
+            current_year: 기준 연도 (크롤러 시계의 올해)
+            
+        Returns:
+            기본 쿼리 파라미터를 덮어쓸 딕셔너리 (제한이 없는 항목은 포함하지 않음)
+        """
+        params = {}
+        
+        # 1. 가격 (거래 유형 중 하나라도 범위가 없으면 제한 없음)
+        price_ranges = [self.filters.get('price_range', {}).get(t) for t in trade_type.split(':') if t]
+        if price_ranges and all(price_ranges):
+            price_min = min(r.get('min', 0) for r in price_ranges)
+            price_max = max(r.get('max', 999999) for r in price_ranges)
+            if price_min > 0:
+                params['priceMin'] = price_min
+            if price_max < 999999:
+                params['priceMax'] = price_max
+        
+        # 2. 면적 (공급면적 ≥ 전용면적이므로 최소값은 그대로 사용 가능)
+        area_min = self.filters.get('area_range', {}).get('min', 0)
+        if area_min > 0:
+            params['areaMin'] = area_min
+        
+        # 3. 세대수
+        household_filter = self.filters.get('household_count', {})
+        if household_filter.get('min', 0) > 0:
+            params['minHouseHoldCount'] = household_filter['min']
+        if household_filter.get('max', 999999) < 999999:
+            params['maxHouseHoldCount'] = household_filter['max']
+        
+        # 4. 사용승인연도 (N년 이내: 연도 ≥ 올해-N, N년 이상: 연도 ≤ 올해-N)
+        year_filter = self.filters.get('approval_year', {})
+        year_min = year_filter.get('min', 0)
+        year_max = year_filter.get('max', 9999)
+        if 0 < year_min <= current_year:
+            params['recentlyBuildYears'] = current_year - year_min + 1
+        if year_max < current_year - 1:
+            params['oldBuildYears'] = current_year - year_max - 1
+        
+        return params
+    
     def apply_filters(self, property_data: Dict) -> bool:
         """
         매물에 필터 적용
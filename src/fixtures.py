@@ -0,0 +1,160 @@
+"""
+기록/재생(record/replay) 픽스처 모듈
+실제 사이트 없이 크롤러를 실행·측정할 수 있도록 API 응답을 파일로 저장
+
+- record: _safe_request 응답과 브라우저 모드에서 가로챈 목록 API 응답(방문한 페이지 URL 기준)을 기록
+- replay: 기록된 응답을 순서대로 돌려줌 (네트워크 요청/대기 없음, 브라우저 없이 재생)
+
+아카이브는 gzip으로 압축한 JSON 파일 하나입니다.
+"""
+
+import gzip
+import json
+import os
+import threading
+import logging
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class FixtureArchive:
+    """API 응답 기록·재생 아카이브 클래스"""
+    
+    MODES = ('record', 'replay')
+    FORMAT_VERSION = 1
+    
+    def __init__(self, path: str, mode: str = 'replay'):
+        """
+        픽스처 아카이브 초기화
+        
+        Args:
+            path: 아카이브 파일 경로 (예: fixtures/crawl.json.gz)
+            mode: 'record' (기록) 또는 'replay' (재생)
+        """
+        if mode not in self.MODES:
+            raise ValueError(f"지원하지 않는 픽스처 모드: {mode}")
+        
+        self.path = path
+        self.mode = mode
+        
+        self.responses: Dict[str, List[Optional[Dict]]] = {}
+        
+        # 재생 위치 (같은 키가 여러 번 요청되면 기록된 순서대로 반환)
+        self._cursors: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        
+        self.replayed = 0
+        self.missing = 0
+        
+        if self.replaying:
+            self._load()
+    
+    @property
+    def recording(self) -> bool:
+        return self.mode == 'record'
+    
+    @property
+    def replaying(self) -> bool:
+        return self.mode == 'replay'
+    
+    def _load(self):
+        """아카이브 파일 읽기"""
+        if not os.path.exists(self.path):
+            raise FileNotFoundError(f"픽스처 파일이 없습니다: {self.path}")
+        
+        with gzip.open(self.path, 'rt', encoding='utf-8') as f:
+            archive = json.load(f)
+        
+        self.responses = archive.get('responses', {})
+        logger.info(f"📼 픽스처 로드: 응답 {len(self.responses)}개 ({self.path})")
+    
+    def save(self):
+        """아카이브 파일 저장 (record 모드)"""
+        if not self.recording:
+            return
+        
+        if os.path.dirname(self.path):
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        
+        with self._lock:
+            archive = {
+                'version': self.FORMAT_VERSION,
+                'responses': self.responses
+            }
+            with gzip.open(self.path, 'wt', encoding='utf-8') as f:
+                json.dump(archive, f, ensure_ascii=False, separators=(',', ':'))
+        
+        logger.info(f"📼 픽스처 저장: 응답 {len(self.responses)}개 ({self.path})")
+    
+    @staticmethod
+    def make_key(url: str, params: Optional[Dict] = None) -> str:
+        """
+        URL과 파라미터로 키 생성 (파라미터 순서 무관, 사람이 읽을 수 있는 형태)
+        
+        Args:
+            url: 요청 URL
+            params: 쿼리 파라미터
+        
+        Returns:
+            키 문자열
+        """
+        if not params:
+            return url
+        return url + '?' + json.dumps(params, sort_keys=True, ensure_ascii=False, default=str)
+    
+    def _next(self, store: Dict[str, list], key: str):
+        """기록된 값을 순서대로 꺼내기 (모두 소진하면 마지막 값 반복)"""
+        with self._lock:
+            entries = store.get(key)
+            if not entries:
+                self.missing += 1
+                return False, None
+            
+            index = self._cursors.get(key, 0)
+            self._cursors[key] = index + 1
+            self.replayed += 1
+            return True, entries[min(index, len(entries) - 1)]
+    
+    def record_response(self, url: str, params: Optional[Dict], data: Optional[Dict]):
+        """
+        API 응답 기록 (실패한 요청은 None으로 기록)
+        
+        Args:
+            url: 요청 URL
+            params: 쿼리 파라미터
+            data: JSON 응답 또는 None
+        """
+        with self._lock:
+            self.responses.setdefault(self.make_key(url, params), []).append(data)
+    
+    def replay_response(self, url: str, params: Optional[Dict] = None) -> Optional[Dict]:
+        """
+        기록된 API 응답 반환
+        
+        Args:
+            url: 요청 URL
+            params: 쿼리 파라미터
+        
+        Returns:
+            JSON 응답 (기록이 없으면 None)
+        """
+        found, data = self._next(self.responses, self.make_key(url, params))
+        if not found:
+            logger.warning(f"📼 기록된 응답 없음: {url}")
+        return data
+    
+    def get_stats(self) -> Dict:
+        """
+        픽스처 통계
+        
+        Returns:
+            통계 정보 딕셔너리
+        """
+        with self._lock:
+            return {
+                'mode': self.mode,
+                'responses': sum(len(entries) for entries in self.responses.values()),
+                'replayed': self.replayed,
+                'missing': self.missing
+            }
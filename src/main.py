@@ -4,15 +4,29 @@
 
 import os
 import sys
+import queue
+import shutil
+import signal
+import threading
+import argparse
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import List, Dict
+from typing import List, Dict, Optional, Iterator
 from dotenv import load_dotenv
 
 # 로컬 모듈 임포트
 from database import PropertyDatabase
 from scraper import NaverRealEstateScraper
+from rate_scheduler import RateScheduler
+from fixtures import FixtureArchive
+from clock import SystemClock, VirtualClock
+from resource_blocker import ResourceBlocker
+from session_state import SessionStateStore
 from filter_manager import FilterManager
+from pipeline import PropertyPipeline
+from recrawl_scheduler import RecrawlScheduler
+from complex_prioritizer import ComplexPrioritizer
 from telegram_bot import TelegramNotifierSync
 
 # 로깅 설정
@@ -27,22 +41,199 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+DB_PATH = 'data/properties.db'
+
+
+def shard_db_path(shard_index: int) -> str:
+    """
+    샤드 데이터베이스 경로
+    
+    Args:
+        shard_index: 샤드 번호
+        
+    Returns:
+        데이터베이스 파일 경로
+    """
+    root, ext = os.path.splitext(DB_PATH)
+    return f"{root}.shard{shard_index}{ext}"
+
+
+def select_shard_regions(regions: List[str], shard_index: int, shard_count: int) -> List[str]:
+    """
+    샤드가 맡을 지역 선택 (정렬 후 나눠 가지므로 입력 순서와 관계없이 항상 같은 결과)
+    
+    Args:
+        regions: 전체 지역 코드 리스트
+        shard_index: 샤드 번호 (0부터)
+        shard_count: 전체 샤드 수
+        
+    Returns:
+        이 샤드가 크롤링할 지역 코드 리스트
+    """
+    unique_regions = sorted({region.strip() for region in regions if region.strip()})
+    return unique_regions[shard_index::shard_count]
+
+
+def merge_shards(shard_paths: List[str], db_path: str = DB_PATH) -> Dict[str, int]:
+    """
+    샤드 데이터베이스들을 기본 데이터베이스로 병합
+    
+    Args:
+        shard_paths: 샤드 데이터베이스 파일 경로 리스트
+        db_path: 병합 결과를 저장할 기본 데이터베이스 경로
+        
+    Returns:
+        병합 통계 ({'shards', 'properties', 'new_properties'})
+    """
+    db = PropertyDatabase(db_path)
+    totals = {'shards': 0, 'properties': 0, 'new_properties': 0}
+    
+    for shard_path in shard_paths:
+        result = db.merge_from(shard_path)
+        logger.info(f"🧩 샤드 병합: {shard_path} → 매물 {result['properties']}개 (신규 {result['new_properties']}개)")
+        totals['shards'] += 1
+        totals['properties'] += result['properties']
+        totals['new_properties'] += result['new_properties']
+    
+    logger.info(f"🧩 병합 완료: {totals}, DB 통계: {db.get_stats()}")
+    return totals
+
+
 class RealEstateBot:
     """부동산 크롤링 봇 메인 클래스"""
     
-    def __init__(self):
-        """봇 초기화"""
+    # 실행 시간 제한 모드에서 크롤링을 먼저 끝내고 DB 저장/알림에 남겨둘 시간 (초)
+    DEADLINE_FLUSH_SECONDS = 300
+    
+    # 지역 작업 스레드가 넘긴 단지별 매물 리스트를 담아둘 최대 개수 (가득 차면 작업 스레드가 기다림)
+    REGION_QUEUE_SIZE = 8
+    
+    _REGION_DONE = object()  # 지역 작업 스레드 종료 신호
+    _STOP_POLL_SECONDS = 0.5  # 큐가 가득 찬 작업 스레드가 중단 신호를 확인하는 간격
+    
+    def __init__(self, deadline_minutes: Optional[float] = None,
+                 shard_index: Optional[int] = None, shard_count: Optional[int] = None,
+                 keep_alive: bool = False):
+        """
+        봇 초기화
+        
+        Args:
+            deadline_minutes: 실행 시간 제한 (분, 없으면 CRAWL_DEADLINE_MINUTES 환경 변수, 0이면 제한 없음)
+            shard_index: 이 작업이 맡을 샤드 번호 (0부터, 없으면 SHARD_INDEX 환경 변수)
+            shard_count: 전체 샤드 수 (없으면 SHARD_COUNT 환경 변수, 1이면 샤드 모드 아님)
+            keep_alive: 실행이 끝나도 브라우저/세션/DB 연결/작업 스레드를 유지 (데몬 모드)
+        """
         # 환경 변수 로드
         load_dotenv()
         
+        if deadline_minutes is None:
+            deadline_minutes = float(os.getenv('CRAWL_DEADLINE_MINUTES', '0') or 0)
+        self.deadline_minutes = deadline_minutes or None
+        
+        if shard_count is None:
+            shard_count = int(os.getenv('SHARD_COUNT', '1') or 1)
+        if shard_index is None:
+            shard_index = int(os.getenv('SHARD_INDEX', '0') or 0)
+        if shard_count > 1 and not 0 <= shard_index < shard_count:
+            raise ValueError(f"샤드 번호는 0 ~ {shard_count - 1} 사이여야 합니다: {shard_index}")
+        self.shard_index = shard_index if shard_count > 1 else None
+        self.shard_count = shard_count
+        
         # 설정 로드
         self.search_regions = os.getenv('SEARCH_REGIONS', '').split(',')
+        if self.shard_index is not None:
+            self.search_regions = select_shard_regions(self.search_regions, self.shard_index, self.shard_count)
+            logger.info(f"🧩 샤드 {self.shard_index + 1}/{self.shard_count}: 지역 {self.search_regions}")
         self.trade_types = os.getenv('TRADE_TYPES', 'A1,B1').split(',')
+        self.scraper_engine = os.getenv('SCRAPER_ENGINE', 'sync').strip().lower()
+        self.pacing_mode = os.getenv('PACING_MODE', 'scheduler').strip().lower()
+        
+        # 동시에 크롤링할 지역 수 (지역마다 세션/브라우저를 따로 사용, 1이면 차례로)
+        self.region_workers = max(1, int(os.getenv('REGION_WORKERS', '1') or 1))
+        self.failed_regions: List[str] = []
+        
+        # 데몬 모드: 크롤링 간격 (분), 실행 사이에 유지할 자원
+        self.interval_minutes = float(os.getenv('CRAWL_INTERVAL_MINUTES', '120') or 120)
+        self.keep_alive = keep_alive
+        self._region_executor: Optional[ThreadPoolExecutor] = None
+        self._worker_local = threading.local()  # 작업 스레드별 크롤러 (keep_alive일 때 재사용)
+        
+        # 접속 서버 (부하 테스트 시 mock_server.py 주소, 브라우저 없이 requests로 실행)
+        self.base_url = os.getenv('NAVER_BASE_URL', '').strip() or None
+        self.use_browser = os.getenv('USE_BROWSER', '1').strip().lower() not in ('0', 'false', 'no')
+        
+        # 브라우저 모드 리소스 차단 (이미지/미디어/폰트/지도 타일/트래커, 모든 크롤러가 통계 공유)
+        self.resource_blocker = ResourceBlocker(
+            blocked_types=[t.strip() for t in os.getenv(
+                'BLOCKED_RESOURCE_TYPES', ','.join(ResourceBlocker.DEFAULT_BLOCKED_TYPES)).split(',') if t.strip()],
+            enabled=os.getenv('BLOCK_RESOURCES', '1').strip().lower() not in ('0', 'false', 'no')
+        )
+        
+        # 브라우저 모드 페이지 풀 (단지 상세 페이지 동시 로딩 수, 페이지당 최대 이동 횟수)
+        self.browser_pages = int(os.getenv('BROWSER_PAGES', str(NaverRealEstateScraper.BROWSER_PAGES)))
+        self.browser_max_navigations = int(os.getenv(
+            'BROWSER_MAX_NAVIGATIONS', str(NaverRealEstateScraper.BROWSER_MAX_NAVIGATIONS)))
+        
+        # 가상 시계 (VIRTUAL_CLOCK=1이면 대기 없이 가상 시간만 진행, 시뮬레이션용)
+        virtual_clock = os.getenv('VIRTUAL_CLOCK', '0').strip().lower() in ('1', 'true', 'yes')
+        self.clock = VirtualClock() if virtual_clock else SystemClock()
+        
+        # 모든 요청이 공유하는 속도 조절기 (분당 요청 수)
+        target_rpm = float(os.getenv('TARGET_RPM', '4'))
+        max_rpm = float(os.getenv('MAX_RPM', '0')) or None
+        self.rate_scheduler = RateScheduler(requests_per_minute=target_rpm, max_requests_per_minute=max_rpm,
+                                            clock=self.clock)
+        
+        # 쿠키/storage_state 저장 (다음 실행과 작업 스레드가 검증 후 재사용, SESSION_STATE_PATH를 비우면 사용 안 함)
+        session_path = os.getenv('SESSION_STATE_PATH', 'data/session_state.json').strip()
+        self.session_store = SessionStateStore(session_path) if session_path else None
+        
+        # 기록/재생 픽스처 (FIXTURE_MODE=record|replay, 오프라인 벤치마크용)
+        fixture_mode = os.getenv('FIXTURE_MODE', '').strip().lower()
+        fixture_path = os.getenv('FIXTURE_PATH', 'fixtures/crawl.json.gz').strip()
+        self.fixtures = FixtureArchive(fixture_path, fixture_mode) if fixture_mode else None
+        
+        # 중단 후 재시작: 이 시간 안에 완료된 페이지는 요청 없이 재사용 (0이면 사용 안 함)
+        self.frontier_freshness_minutes = float(os.getenv(
+            'FRONTIER_FRESHNESS_MINUTES', str(NaverRealEstateScraper.FRONTIER_FRESHNESS_MINUTES)))
+        
+        # 단지 목록 캐시 유효 시간 (이 시간 안에는 단지 목록을 다시 요청하지 않음, 0이면 매번 요청)
+        self.complex_cache_hours = float(os.getenv(
+            'COMPLEX_CACHE_HOURS', str(NaverRealEstateScraper.COMPLEX_CACHE_HOURS)))
+        if self.complex_cache_hours * 60 >= self.interval_minutes:
+            logger.warning(f"⚠️  단지 목록 캐시({self.complex_cache_hours:g}시간)가 실행 간격({self.interval_minutes:g}분)보다 깁니다. "
+                           f"캐시된 매물 수로는 변경을 감지하지 못해 일부 실행에서 단지를 건너뜁니다")
+        
+        # 단지별 재크롤링 일정 (신규 매물이 자주 나오는 단지는 자주, 조용한 단지는 드물게)
+        self.adaptive_recrawl = os.getenv('ADAPTIVE_RECRAWL', '1').strip().lower() not in ('0', 'false', 'no')
+        
+        # 필터 조건을 API 쿼리 파라미터로 전달해 서버에서 먼저 거름 (최종 판정은 FilterManager)
+        self.filter_pushdown = os.getenv('FILTER_PUSHDOWN', '1').strip().lower() not in ('0', 'false', 'no')
+        
+        # 여러 거래 유형을 한 번에 요청 (tradeType='B1:B2', 거래 유형 전환 휴식 없음)
+        self.combine_trade_types = os.getenv('COMBINE_TRADE_TYPES', '0').strip().lower() in ('1', 'true', 'yes')
+        
+        # 지역/거래 유형마다 크롤링할 최대 단지 수 (알림 가능성이 큰 단지부터, 0이면 제한 없음)
+        self.max_complexes = int(os.getenv(
+            'MAX_COMPLEXES_PER_REGION', str(NaverRealEstateScraper.MAX_COMPLEXES_PER_REGION)))
         
         # 모듈 초기화
-        self.db = PropertyDatabase('data/properties.db')
-        self.scraper = NaverRealEstateScraper()
+        self.db = PropertyDatabase(self._prepare_db_path(), persistent=keep_alive)
         self.filter_manager = FilterManager('config/filters.json')
+        self.prioritizer = ComplexPrioritizer(self.filter_manager.filters, self.db)
+        # 지역을 차례로 크롤링할 때 쓰는 크롤러 (지역 병렬 크롤링이면 작업 스레드마다 만들므로 필요할 때만 생성)
+        self.scraper = self._create_scraper() if self.region_workers <= 1 else None
+        
+        # 실행 시간 제한 (clock.time() 기준 시각, 모든 크롤러가 공유)
+        self.deadline: Optional[float] = None
+        self.deadline_reached = False
+        self.recrawl_scheduler = RecrawlScheduler(
+            self.db,
+            budget_per_day=float(os.getenv('RECRAWL_BUDGET_PER_DAY', '0') or 0) or None,
+            min_interval_hours=float(os.getenv('RECRAWL_MIN_HOURS', '2')),
+            max_interval_hours=float(os.getenv('RECRAWL_MAX_HOURS', '168')),
+            default_interval_hours=NaverRealEstateScraper.SNAPSHOT_MAX_AGE_HOURS
+        ) if self.adaptive_recrawl else None
         
         # 텔레그램 봇 초기화 (선택적)
         try:
@@ -55,6 +246,217 @@ class RealEstateBot:
         
         logger.info("RealEstateBot 초기화 완료")
     
+    def _prepare_db_path(self) -> str:
+        """
+        사용할 데이터베이스 경로 결정
+        
+        샤드 모드에서는 기본 DB를 샤드 DB로 복사해 시작합니다. 이미 저장/알림한 매물을
+        알고 있어야 중복 알림이 없고, 실행 후 merge_shards로 기본 DB에 합칩니다.
+        
+        Returns:
+            데이터베이스 파일 경로
+        """
+        if self.shard_index is None:
+            return DB_PATH
+        
+        shard_path = shard_db_path(self.shard_index)
+        if os.path.exists(DB_PATH):
+            shutil.copyfile(DB_PATH, shard_path)
+        logger.info(f"🧩 샤드 데이터베이스: {shard_path}")
+        return shard_path
+    
+    def _create_scraper(self) -> NaverRealEstateScraper:
+        """
+        SCRAPER_ENGINE 설정에 따라 크롤러 생성 (지역 작업 스레드의 크롤러도 같은 설정 사용)
+        
+        - sync (기본값): NaverRealEstateScraper (Playwright/requests 순차 크롤링)
+        - async: AsyncNaverRealEstateScraper (requests 모드 API 동시 호출)
+        
+        Returns:
+            크롤러 인스턴스
+        """
+        scraper = self._new_scraper()
+        scraper.frontier_freshness_minutes = self.frontier_freshness_minutes
+        scraper.complex_cache_hours = self.complex_cache_hours
+        scraper.adaptive_recrawl = self.adaptive_recrawl
+        scraper.prioritizer = self.prioritizer
+        scraper.max_complexes = self.max_complexes
+        scraper.filter_manager = self.filter_manager if self.filter_pushdown else None
+        scraper.combine_trade_types = self.combine_trade_types
+        scraper.browser_pages = self.browser_pages
+        scraper.browser_max_navigations = self.browser_max_navigations
+        return scraper
+    
+    def _new_scraper(self) -> NaverRealEstateScraper:
+        """SCRAPER_ENGINE에 맞는 크롤러 인스턴스 생성 (_create_scraper 참고)"""
+        if self.scraper_engine == 'async':
+            try:
+                from async_scraper import AsyncNaverRealEstateScraper
+                logger.info("⚡ 비동기 크롤링 엔진 사용")
+                return AsyncNaverRealEstateScraper(
+                    rate_scheduler=self.rate_scheduler,
+                    fixtures=self.fixtures,
+                    base_url=self.base_url,
+                    clock=self.clock,
+                    session_store=self.session_store
+                )
+            except RuntimeError as e:
+                logger.warning(f"비동기 엔진 사용 불가, 기본 엔진으로 전환: {e}")
+        
+        return NaverRealEstateScraper(
+            use_browser=self.use_browser,
+            rate_scheduler=self.rate_scheduler,
+            pacing_mode=self.pacing_mode,
+            fixtures=self.fixtures,
+            base_url=self.base_url,
+            clock=self.clock,
+            resource_blocker=self.resource_blocker,
+            session_store=self.session_store
+        )
+    
+    def _crawl_region(self, scraper: NaverRealEstateScraper, region: str) -> Iterator[List[Dict]]:
+        """
+        지역 하나를 크롤링하며 단지별 매물 리스트를 반환 (실패해도 다른 지역은 계속 진행)
+        
+        Args:
+            scraper: 이 지역을 크롤링할 크롤러
+            region: 지역 코드 (cortarNo)
+            
+        Yields:
+            단지 하나의 매물 정보 리스트
+        """
+        if self.deadline_reached:
+            logger.warning(f"⏰ 실행 시간 제한 도달 → 남은 지역 건너뜀: {region}")
+            return
+        
+        logger.info(f"\n[지역 크롤링] cortarNo: {region}")
+        scraper.deadline = self.deadline
+        scraper.deadline_reached = False
+        
+        region_count = 0
+        try:
+            for properties in scraper.iter_region(
+                cortarNo=region,
+                trade_types=self.trade_types,
+                db=self.db
+            ):
+                region_count += len(properties)
+                yield properties
+        except Exception as e:
+            logger.error(f"❌ 지역 크롤링 실패 (cortarNo: {region}, {region_count}개 매물까지 처리): {e}", exc_info=True)
+            self.failed_regions.append(region)
+            return
+        finally:
+            # 크롤러 하나가 시간 제한에 걸리면 남은 지역도 모두 멈춤
+            if scraper.deadline_reached:
+                self.deadline_reached = True
+        
+        logger.info(f"크롤링 완료 (cortarNo: {region}): {region_count}개 매물")
+    
+    def _put_region_result(self, outbox: queue.Queue, item, stop: threading.Event) -> bool:
+        """
+        결과 큐에 넣기 (큐가 가득 차면 자리가 나거나 중단 신호가 올 때까지 대기)
+        
+        Args:
+            outbox: 결과 큐
+            item: 단지별 매물 리스트 또는 _REGION_DONE
+            stop: 결과를 받는 쪽이 멈췄다는 신호
+            
+        Returns:
+            넣었으면 True, 중단 신호로 포기했으면 False
+        """
+        while not stop.is_set():
+            try:
+                outbox.put(item, timeout=self._STOP_POLL_SECONDS)
+                return True
+            except queue.Full:
+                continue
+        return False
+    
+    def _region_worker(self, region: str, outbox: queue.Queue, stop: threading.Event):
+        """
+        지역별 작업 스레드 본체: 자기 세션/브라우저로 지역 하나를 크롤링해 결과를 큐에 넣음
+        
+        속도 조절기/DB는 모든 작업 스레드가 공유하므로 전체 요청 속도는 TARGET_RPM을 넘지 않습니다.
+        결과를 받는 쪽이 멈추면 (stop) 진행 중인 단지까지만 크롤링하고 끝냅니다.
+        
+        Args:
+            region: 지역 코드 (cortarNo)
+            outbox: 단지별 매물 리스트를 넣을 크기 제한 큐 (끝나면 _REGION_DONE)
+            stop: 결과를 받는 쪽이 멈췄다는 신호
+        """
+        scraper = getattr(self._worker_local, 'scraper', None)
+        try:
+            if scraper is None:
+                scraper = self._create_scraper()
+                if self.keep_alive:
+                    self._worker_local.scraper = scraper
+            
+            for properties in self._crawl_region(scraper, region):
+                if not self._put_region_result(outbox, properties, stop):
+                    logger.info(f"🛑 크롤링 중단 → 지역 작업 종료 (cortarNo: {region})")
+                    break
+        except Exception as e:
+            # 크롤러 생성 실패 (브라우저 실행/첫 방문 실패 등)
+            logger.error(f"❌ 지역 작업 시작 실패 (cortarNo: {region}): {e}", exc_info=True)
+            self.failed_regions.append(region)
+        finally:
+            if scraper is not None and not self.keep_alive:
+                scraper.close()
+            self._put_region_result(outbox, self._REGION_DONE, stop)
+    
+    def _iter_region_batches(self) -> Iterator[List[Dict]]:
+        """
+        모든 지역을 크롤링하며 단지별 매물 리스트를 반환 (파이프라인의 크롤링 단계)
+        
+        REGION_WORKERS가 1이면 지역을 차례로, 2 이상이면 지역마다 작업 스레드를 두고 동시에 크롤링합니다.
+        
+        Yields:
+            단지 하나의 매물 정보 리스트
+        """
+        regions = [region.strip() for region in self.search_regions if region.strip()]
+        
+        if self.region_workers <= 1 or len(regions) <= 1:
+            if self.scraper is None:
+                self.scraper = self._create_scraper()
+            for region in regions:
+                yield from self._crawl_region(self.scraper, region)
+            return
+        
+        workers = min(self.region_workers, len(regions))
+        logger.info(f"🧵 지역 병렬 크롤링: {len(regions)}개 지역, 작업 스레드 {workers}개 (공유 속도 {self.rate_scheduler.current_rpm:.1f}회/분)")
+        
+        # keep_alive면 작업 스레드(와 스레드별 크롤러)를 다음 실행에서도 재사용
+        if self.keep_alive:
+            if self._region_executor is None:
+                self._region_executor = ThreadPoolExecutor(max_workers=self.region_workers, thread_name_prefix='region')
+            executor = self._region_executor
+        else:
+            executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='region')
+        
+        # 받는 쪽(파이프라인)이 느리면 작업 스레드가 기다리도록 크기 제한
+        outbox = queue.Queue(maxsize=self.REGION_QUEUE_SIZE)
+        stop = threading.Event()
+        futures = []
+        try:
+            for region in regions:
+                futures.append(executor.submit(self._region_worker, region, outbox, stop))
+            
+            remaining = len(regions)
+            while remaining:
+                properties = outbox.get()
+                if properties is self._REGION_DONE:
+                    remaining -= 1
+                    continue
+                yield properties
+        finally:
+            # 받는 쪽이 오류로 멈췄으면 시작 전 지역은 취소하고, 진행 중인 작업은 큐에서 기다리지 않고 끝내도록 알림
+            stop.set()
+            for future in futures:
+                future.cancel()
+            if not self.keep_alive:
+                executor.shutdown(wait=True)
+    
     def run(self):
         """메인 실행 로직"""
         try:
@@ -63,48 +465,49 @@ class RealEstateBot:
             logger.info(f"실행 시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
             logger.info("=" * 60)
             
-            # 통계 초기화
-            total_crawled = 0
-            new_properties = 0
-            filtered_properties = 0
-            notified_properties = 0
+            # 이전 실행 상태 초기화 (데몬 모드에서 같은 크롤러로 반복 실행)
+            self.failed_regions = []
+            self.deadline = None
+            self.deadline_reached = False
+            self.prioritizer.reset()
             
-            # 각 지역별로 크롤링
-            for region in self.search_regions:
-                if not region.strip():
-                    continue
-                
-                logger.info(f"\n[지역 크롤링] cortarNo: {region}")
-                
-                # 1. 매물 크롤링
-                properties = self.scraper.scrape_region(
-                    cortarNo=region.strip(),
-                    trade_types=self.trade_types
-                )
-                total_crawled += len(properties)
-                logger.info(f"크롤링 완료: {len(properties)}개 매물")
-                
-                # 2. 필터 적용
-                filtered = self.filter_manager.filter_properties(properties)
-                filtered_properties += len(filtered)
-                logger.info(f"필터 통과: {len(filtered)}개 매물")
-                
-                # 3. 신규 매물 확인 및 저장
-                for prop in filtered:
-                    if self.db.add_property(prop):
-                        new_properties += 1
-                        logger.info(f"신규 매물 발견: {prop['complex_name']} - {prop['id']}")
-                        
-                        # 4. 텔레그램 알림 전송
-                        if self.use_telegram:
-                            try:
-                                success = self.telegram.send_property_notification(prop)
-                                if success:
-                                    notified_properties += 1
-                                    self.db.mark_as_notified(prop['id'])
-                                    logger.info("알림 전송 완료")
-                            except Exception as e:
-                                logger.error(f"알림 전송 실패: {e}")
+            # 중단된 이전 실행의 작업 항목 확인 (오래된 항목은 정리)
+            if self.frontier_freshness_minutes:
+                self.db.prune_frontier(self.frontier_freshness_minutes, now=self.clock.now())
+                frontier_stats = self.db.get_frontier_stats()
+                if frontier_stats:
+                    logger.info(f"♻️  중단된 실행의 작업 항목 발견 → 이어서 진행: {frontier_stats}")
+            
+            # 지난 실행까지의 신규 매물 기록으로 단지별 재크롤링 간격 갱신
+            if self.recrawl_scheduler:
+                schedule_stats = self.recrawl_scheduler.update(now=self.clock.now())
+                if schedule_stats['complexes']:
+                    logger.info(f"📅 단지별 재크롤링 일정 갱신: {schedule_stats}")
+            
+            # 실행 시간 제한: 저장/알림 시간을 남기고 크롤링 예산 설정
+            if self.deadline_minutes:
+                crawl_budget = max(0.0, self.deadline_minutes * 60 - self.DEADLINE_FLUSH_SECONDS)
+                self.deadline = self.clock.time() + crawl_budget
+                logger.info(f"⏰ 실행 시간 제한: {self.deadline_minutes:.0f}분 (크롤링 {crawl_budget / 60:.1f}분)")
+            
+            # 크롤링 → 필터 → 저장 → 알림 (단지 하나가 끝날 때마다 바로 처리)
+            pipeline = PropertyPipeline(
+                self.filter_manager,
+                self.db,
+                notifier=self.telegram if self.use_telegram else None,
+                clock=self.clock
+            )
+            batches = self._iter_region_batches()
+            try:
+                pipeline_stats = pipeline.run(batches)
+            finally:
+                # 파이프라인이 오류로 멈춰도 지역 작업 스레드를 바로 정리
+                batches.close()
+            
+            total_crawled = pipeline_stats['total_crawled']
+            filtered_properties = pipeline_stats['filtered_properties']
+            new_properties = pipeline_stats['new_properties']
+            notified_properties = pipeline_stats['notified_properties']
             
             # 5. 결과 요약
             logger.info("\n" + "=" * 60)
@@ -114,6 +517,13 @@ class RealEstateBot:
             logger.info(f"필터 통과 매물: {filtered_properties}개")
             logger.info(f"신규 매물: {new_properties}개")
             logger.info(f"알림 전송: {notified_properties}개")
+            if 'alert_latency_avg' in pipeline_stats:
+                logger.info(f"알림 지연 (크롤링 후): 평균 {pipeline_stats['alert_latency_avg']}초, "
+                            f"최대 {pipeline_stats['alert_latency_max']}초")
+            if self.failed_regions:
+                logger.warning(f"실패한 지역: {', '.join(self.failed_regions)} (다음 실행에서 다시 시도)")
+            if self.deadline_reached:
+                logger.info("⏰ 실행 시간 제한으로 일부만 크롤링 (나머지는 다음 실행에서 크롤링)")
             
             # 데이터베이스 통계
             db_stats = self.db.get_stats()
@@ -133,12 +543,20 @@ class RealEstateBot:
 📬 알림 전송: {notified_properties}개
 
 💾 DB 총 매물: {db_stats['total']}개
-⏰ 다음 실행: 2시간 후
+⏰ 다음 실행: {self.interval_minutes / 60:g}시간 후
 """
+                    if self.failed_regions:
+                        summary_msg += f"⚠️ 실패한 지역: {', '.join(self.failed_regions)}\n"
+                    if self.deadline_reached:
+                        summary_msg += "⏳ 실행 시간 제한으로 일부 단지만 크롤링\n"
                     self.telegram.send_message(summary_msg)
                 except Exception as e:
                     logger.error(f"요약 메시지 전송 실패: {e}")
             
+            # 모든 지역을 끝까지 처리했으면 작업 항목 정리 (시간 제한으로 멈췄으면 다음 실행에서 이어서 진행)
+            if not self.deadline_reached and not self.failed_regions:
+                self.db.prune_frontier()
+            
             logger.info("\n" + "=" * 60)
             logger.info("모든 작업 완료")
             logger.info("=" * 60)
@@ -148,7 +566,9 @@ class RealEstateBot:
                 'total_crawled': total_crawled,
                 'new_properties': new_properties,
                 'filtered_properties': filtered_properties,
-                'notified_properties': notified_properties
+                'notified_properties': notified_properties,
+                'deadline_reached': self.deadline_reached,
+                'failed_regions': list(self.failed_regions)
             }
             
         except Exception as e:
@@ -166,12 +586,90 @@ class RealEstateBot:
                 'success': False,
                 'error': str(e)
             }
+        
+        finally:
+            # 기록 모드: 오류로 끝나도 그때까지의 응답은 저장
+            if self.fixtures:
+                self.fixtures.save()
+
+
+    def run_daemon(self, max_runs: Optional[int] = None):
+        """
+        데몬 모드: 프로세스를 유지하며 interval_minutes마다 run 반복
+        
+        브라우저 실행, 첫 방문 쿠키, DB 연결 같은 시작 비용은 프로세스당 한 번만 듭니다.
+        실행이 간격보다 오래 걸리면 바로 다음 실행을 시작합니다.
+        
+        Args:
+            max_runs: 최대 실행 횟수 (없으면 중단될 때까지 반복)
+        """
+        logger.info(f"🔁 데몬 모드 시작: {self.interval_minutes:g}분 간격")
+        
+        run_count = 0
+        try:
+            while max_runs is None or run_count < max_runs:
+                started = self.clock.monotonic()
+                result = self.run()
+                run_count += 1
+                
+                if not result['success']:
+                    logger.warning(f"실행 {run_count}회차 실패 → 다음 간격에 다시 시도")
+                
+                if max_runs is not None and run_count >= max_runs:
+                    break
+                
+                wait = max(0.0, self.interval_minutes * 60 - (self.clock.monotonic() - started))
+                next_run = datetime.fromtimestamp(self.clock.time() + wait)
+                logger.info(f"💤 다음 실행까지 {wait / 60:.1f}분 대기 (예정: {next_run.strftime('%Y-%m-%d %H:%M:%S')})")
+                self.clock.sleep(wait)
+        finally:
+            logger.info(f"🔁 데몬 모드 종료 (총 {run_count}회 실행)")
+            self.close()
+    
+    def close(self):
+        """유지하던 작업 스레드, 브라우저, DB 연결 정리"""
+        if self._region_executor is not None:
+            self._region_executor.shutdown(wait=True)
+            self._region_executor = None
+        if self.scraper is not None:
+            self.scraper.close()
+        self.db.close()
 
 
 def main():
     """메인 함수"""
+    parser = argparse.ArgumentParser(description='네이버 부동산 크롤링 텔레그램 봇')
+    parser.add_argument('--deadline', type=float, default=None,
+                        help='실행 시간 제한 (분). 제한 전에 크롤링을 멈추고 그때까지의 결과를 저장/알림')
+    parser.add_argument('--shard-index', type=int, default=None,
+                        help='이 작업이 맡을 샤드 번호 (0부터). 지역 일부만 샤드 DB에 크롤링')
+    parser.add_argument('--shard-count', type=int, default=None, help='전체 샤드 수')
+    parser.add_argument('--merge', nargs='+', metavar='SHARD_DB',
+                        help='크롤링 대신 샤드 DB들을 기본 DB로 병합')
+    parser.add_argument('--daemon', action='store_true',
+                        help='프로세스를 유지하며 CRAWL_INTERVAL_MINUTES마다 반복 실행 (브라우저/세션/DB 연결 재사용)')
+    parser.add_argument('--max-runs', type=int, default=None, help='데몬 모드 최대 실행 횟수')
+    args = parser.parse_args()
+    
+    if args.merge:
+        try:
+            merge_shards(args.merge)
+            sys.exit(0)
+        except Exception as e:
+            logger.error(f"샤드 병합 실패: {e}", exc_info=True)
+            sys.exit(1)
+    
     try:
-        bot = RealEstateBot()
+        bot = RealEstateBot(deadline_minutes=args.deadline,
+                            shard_index=args.shard_index, shard_count=args.shard_count,
+                            keep_alive=args.daemon)
+        
+        if args.daemon:
+            # SIGTERM(서비스 종료)도 Ctrl+C처럼 정리 후 종료
+            signal.signal(signal.SIGTERM, signal.default_int_handler)
+            bot.run_daemon(max_runs=args.max_runs)
+            sys.exit(0)
+        
         result = bot.run()
         
         if result['success']:
@@ -0,0 +1,426 @@
+"""
+네이버 부동산 API 모의 서버 모듈
+부하 테스트/벤치마크용으로 네트워크 없이 로컬에서 실행하는 가짜 new.land.naver.com
+
+- /api/complexes                  단지 목록 (페이지네이션)
+- /api/articles/complex/{no}      단지 매물 목록 (페이지네이션)
+- /api/articles/{no}              매물 상세
+- /api/cortars                    좌표의 지역 정보 (세션 확인용 가벼운 요청)
+- /, /complexes, /articles        쿠키를 내려주는 랜딩 페이지
+- /__stats                        요청/응답 통계
+
+응답 내용은 지역 코드/단지 번호를 시드로 만든 가상 데이터라 같은 요청에는 항상 같은 응답을 줍니다.
+지연 시간, 403/429 발생 확률, 분당 요청 한도를 설정할 수 있습니다.
+가격/면적/세대수/사용승인연도 쿼리 파라미터로 목록을 거릅니다 (단지 목록의 매물 수는 거르지 않은 값).
+
+사용 예:
+    python mock_server.py --port 8080 --latency 0.2 --rpm-limit 30
+    NAVER_BASE_URL=http://127.0.0.1:8080 USE_BROWSER=0 python main.py
+"""
+
+import argparse
+import json
+import random
+import threading
+import time
+import logging
+from datetime import datetime
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlparse, parse_qs
+
+logger = logging.getLogger(__name__)
+
+
+class MockNaverLandServer:
+    """네이버 부동산 API 모의 서버 클래스"""
+    
+    COMPLEX_PAGE_SIZE = 20
+    ARTICLE_PAGE_SIZE = 20
+    
+    DIRECTIONS = ['남향', '남동향', '남서향', '동향', '서향', '북향']
+    TRADE_TYPE_NAMES = {'A1': '매매', 'B1': '전세', 'B2': '월세', 'B3': '단기임대'}
+    
+    def __init__(self, host: str = '127.0.0.1', port: int = 0,
+                 complexes_per_region: int = 30, max_articles_per_complex: int = 60,
+                 latency: float = 0.0, jitter: float = 0.0,
+                 error_429_rate: float = 0.0, error_403_rate: float = 0.0,
+                 rpm_limit: int = 0, seed: int = 0):
+        """
+        모의 서버 초기화
+        
+        Args:
+            host: 바인딩 주소
+            port: 포트 (0이면 빈 포트 자동 선택)
+            complexes_per_region: 지역당 단지 수
+            max_articles_per_complex: 단지·거래 유형당 최대 매물 수
+            latency: 응답 지연 (초)
+            jitter: 응답 지연 흔들림 (초, 0~jitter 사이 무작위 추가)
+            error_429_rate: 무작위 429 응답 확률
+            error_403_rate: 무작위 403 응답 확률
+            rpm_limit: 최근 60초 동안 허용할 API 요청 수 (초과 시 429, 0이면 제한 없음)
+            seed: 가상 데이터 시드
+        """
+        self.complexes_per_region = complexes_per_region
+        self.max_articles_per_complex = max_articles_per_complex
+        self.latency = latency
+        self.jitter = jitter
+        self.error_429_rate = error_429_rate
+        self.error_403_rate = error_403_rate
+        self.rpm_limit = rpm_limit
+        self.seed = seed
+        
+        self._lock = threading.Lock()
+        self._recent_requests = deque()  # 분당 한도 계산용 요청 시각
+        self._error_random = random.Random(seed)
+        self.stats: Dict[str, int] = {}
+        
+        self._httpd = ThreadingHTTPServer((host, port), self._make_handler())
+        self._thread: Optional[threading.Thread] = None
+    
+    @property
+    def url(self) -> str:
+        """서버 기본 URL (NaverRealEstateScraper의 base_url로 사용)"""
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+    
+    def start(self):
+        """백그라운드 스레드에서 서버 시작"""
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        logger.info(f"🧪 모의 서버 시작: {self.url}")
+    
+    def stop(self):
+        """서버 종료"""
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread:
+            self._thread.join()
+        logger.info("🧪 모의 서버 종료")
+    
+    def serve_forever(self):
+        """현재 스레드에서 서버 실행 (Ctrl+C로 종료)"""
+        logger.info(f"🧪 모의 서버 실행 중: {self.url}")
+        try:
+            self._httpd.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self._httpd.server_close()
+    
+    def _count(self, key: str):
+        """통계 카운트 증가"""
+        with self._lock:
+            self.stats[key] = self.stats.get(key, 0) + 1
+    
+    def get_stats(self) -> Dict:
+        """
+        요청/응답 통계
+        
+        Returns:
+            통계 정보 딕셔너리
+        """
+        with self._lock:
+            return dict(self.stats)
+    
+    def _injected_error(self) -> Optional[int]:
+        """
+        분당 한도/무작위 오류 주입 판단
+        
+        Returns:
+            오류 응답 코드 (없으면 None)
+        """
+        now = time.monotonic()
+        with self._lock:
+            if self.rpm_limit:
+                while self._recent_requests and now - self._recent_requests[0] > 60:
+                    self._recent_requests.popleft()
+                if len(self._recent_requests) >= self.rpm_limit:
+                    return 429
+                self._recent_requests.append(now)
+            
+            roll = self._error_random.random()
+        
+        if roll < self.error_429_rate:
+            return 429
+        if roll < self.error_429_rate + self.error_403_rate:
+            return 403
+        return None
+    
+    def _rng(self, *parts) -> random.Random:
+        """요청 내용으로 시드를 정한 난수 생성기 (같은 요청 → 같은 데이터)"""
+        return random.Random(f"{self.seed}:" + ':'.join(str(part) for part in parts))
+    
+    @staticmethod
+    def _format_price(price: int) -> str:
+        """만원 단위 가격을 네이버 표기로 변환 (예: 35000 → '3억 5,000')"""
+        eok, man = divmod(price, 10000)
+        if eok and man:
+            return f"{eok}억 {man:,}"
+        if eok:
+            return f"{eok}억"
+        return f"{man:,}"
+    
+    @staticmethod
+    def _parse_price(text: str) -> int:
+        """네이버 가격 표기를 만원 단위로 변환 (예: '3억 5,000' → 35000)"""
+        eok, _, man = text.partition('억')
+        if not man and '억' not in text:
+            eok, man = '', text
+        return int(eok.strip() or 0) * 10000 + int(man.replace(',', '').strip() or 0)
+    
+    @staticmethod
+    def _in_range(value: float, low: str, high: str) -> bool:
+        """쿼리 파라미터 범위 확인 (빈 값은 제한 없음)"""
+        return (not low or value >= float(low)) and (not high or value <= float(high))
+    
+    def _match_complex(self, complex_info: Dict, param) -> bool:
+        """단지 검색 필터 파라미터 적용 (세대수, 사용승인연도)"""
+        if not self._in_range(complex_info['totalHouseholdCount'],
+                              param('minHouseHoldCount'), param('maxHouseHoldCount')):
+            return False
+        
+        year = int(complex_info['useApproveYmd'][:4])
+        current_year = datetime.now().year
+        recently, old = param('recentlyBuildYears'), param('oldBuildYears')
+        if recently and year < current_year - int(recently):
+            return False
+        if old and year > current_year - int(old):
+            return False
+        return True
+    
+    def _match_article(self, article: Dict, param) -> bool:
+        """매물 목록 필터 파라미터 적용 (가격: 매매가/보증금, 면적: 공급면적)"""
+        return self._in_range(self._parse_price(article['dealOrWarrantPrc']), param('priceMin'), param('priceMax')) and \
+            self._in_range(article['area1'], param('areaMin'), param('areaMax'))
+    
+    def _paginate(self, items: List[Dict], page: int, page_size: int) -> Tuple[List[Dict], bool]:
+        """목록을 페이지 단위로 자르기"""
+        start = (page - 1) * page_size
+        return items[start:start + page_size], start + page_size < len(items)
+    
+    def _complex(self, cortar_no: str, index: int) -> Dict:
+        """가상 단지 정보 생성"""
+        rng = self._rng('complex', cortar_no, index)
+        complex_no = f"{int(cortar_no[-6:] or 0) * 100 + index + 1}"
+        min_area = rng.choice([49, 59, 66, 74, 84])
+        return {
+            'complexNo': complex_no,
+            'complexName': f"모의{cortar_no[-4:]}단지{index + 1}",
+            'cortarNo': cortar_no,
+            'realEstateTypeCode': 'APT',
+            'realEstateTypeName': '아파트',
+            'detailAddress': f"{rng.randint(1, 999)}",
+            'latitude': round(37.4 + rng.random() * 0.3, 6),
+            'longitude': round(126.8 + rng.random() * 0.4, 6),
+            'totalHouseholdCount': rng.randint(50, 3000),
+            'totalBuildingCount': rng.randint(1, 40),
+            'highFloor': rng.randint(5, 45),
+            'lowFloor': rng.randint(1, 5),
+            'useApproveYmd': f"{rng.randint(1985, 2024)}{rng.randint(1, 12):02d}{rng.randint(1, 28):02d}",
+            'dealCount': self._article_count(complex_no, 'A1'),
+            'leaseCount': self._article_count(complex_no, 'B1'),
+            'rentCount': self._article_count(complex_no, 'B2'),
+            'shortTermRentCount': 0,
+            'minArea': min_area,
+            'maxArea': min_area + rng.choice([0, 25, 50]),
+        }
+    
+    def _article_count(self, complex_no: str, trade_type: str) -> int:
+        """단지·거래 유형별 매물 수 (단지 목록의 dealCount 등과 매물 목록 길이가 일치)"""
+        return self._rng('count', complex_no, trade_type).randint(0, self.max_articles_per_complex)
+    
+    def _complexes(self, cortar_no: str) -> List[Dict]:
+        """지역의 가상 단지 목록"""
+        return [self._complex(cortar_no, index) for index in range(self.complexes_per_region)]
+    
+    def _article(self, complex_no: str, trade_type: str, index: int) -> Dict:
+        """가상 매물 정보 생성 (단지 매물 목록 API 형식)"""
+        rng = self._rng('article', complex_no, trade_type, index)
+        total_floor = rng.randint(10, 35)
+        area2 = rng.choice([59, 74, 84, 101, 114])
+        
+        if trade_type == 'A1':
+            price = rng.randint(30, 200) * 1000
+        elif trade_type == 'B1':
+            price = rng.randint(15, 100) * 1000
+        else:
+            price = rng.randint(1, 50) * 500
+        
+        article = {
+            'articleNo': f"{complex_no}{ord(trade_type[0])}{trade_type[1]}{index:04d}",
+            'articleName': f"모의단지{complex_no}",
+            'realEstateTypeCode': 'APT',
+            'realEstateTypeName': '아파트',
+            'tradeTypeCode': trade_type,
+            'tradeTypeName': self.TRADE_TYPE_NAMES.get(trade_type, trade_type),
+            'floorInfo': f"{rng.randint(1, total_floor)}/{total_floor}",
+            'dealOrWarrantPrc': self._format_price(price),
+            'area1': round(area2 * rng.uniform(1.25, 1.4)),
+            'area2': area2,
+            'direction': rng.choice(self.DIRECTIONS),
+            'articleConfirmYmd': f"2026{rng.randint(1, 12):02d}{rng.randint(1, 28):02d}",
+            'tagList': rng.sample(['25년이상', '대단지', '역세권', '올수리', '남향', '방세개'], 2),
+            'buildingName': f"{rng.randint(101, 120)}동",
+            'sameAddrCnt': rng.randint(1, 5),
+        }
+        if trade_type == 'B2':
+            article['rentPrc'] = str(rng.randint(50, 300))
+        return article
+    
+    def _articles(self, complex_no: str, trade_types: List[str]) -> List[Dict]:
+        """단지의 가상 매물 목록 (여러 거래 유형이면 합쳐서 반환)"""
+        articles = []
+        for trade_type in trade_types:
+            count = self._article_count(complex_no, trade_type)
+            articles.extend(self._article(complex_no, trade_type, index) for index in range(count))
+        return articles
+    
+    def _article_detail(self, article_no: str) -> Dict:
+        """가상 매물 상세 정보 (매물 상세 API 형식)"""
+        rng = self._rng('detail', article_no)
+        return {
+            'articleDetail': {
+                'articleNo': article_no,
+                'roomCount': str(rng.randint(1, 4)),
+                'bathroomCount': str(rng.randint(1, 2)),
+                'moveInTypeName': rng.choice(['즉시입주', '협의가능']),
+                'articleFeatureDescription': '모의 서버에서 생성한 매물입니다.',
+            },
+            'articlePrice': {
+                'financePrice': rng.choice([0, 0, 0, 5000, 10000]),
+            },
+        }
+    
+    def handle(self, path: str, query: Dict[str, List[str]]) -> Tuple[int, Dict, Optional[Dict]]:
+        """
+        요청 처리
+        
+        Args:
+            path: 요청 경로
+            query: 쿼리 파라미터
+        
+        Returns:
+            (응답 코드, 추가 헤더, JSON 본문 또는 None)
+        """
+        def param(name: str, default: str = '') -> str:
+            return query.get(name, [default])[0]
+        
+        if path in ('/', '/complexes', '/articles'):
+            self._count('landing')
+            return 200, {'Set-Cookie': 'NNB=MOCKNNB; Path=/'}, None
+        
+        if path == '/__stats':
+            return 200, {}, self.get_stats()
+        
+        if not path.startswith('/api/'):
+            self._count('404')
+            return 404, {}, {'error': 'not found'}
+        
+        error = self._injected_error()
+        if error:
+            self._count(str(error))
+            return error, {}, {'error': 'injected'}
+        
+        page = max(1, int(param('page', '1') or 1))
+        trade_types = [t for t in param('tradeType', 'A1').split(':') if t]
+        
+        if path == '/api/complexes':
+            self._count('complexes')
+            complexes = [c for c in self._complexes(param('cortarNo', '0000000000')) if self._match_complex(c, param)]
+            items, more = self._paginate(complexes, page, self.COMPLEX_PAGE_SIZE)
+            return 200, {}, {'complexList': items, 'isMoreData': more}
+        
+        if path == '/api/cortars':
+            self._count('cortars')
+            return 200, {}, {'cortarNo': '1168010100', 'cortarName': '역삼동', 'cortarType': 'sec',
+                             'centerLat': float(param('centerLat', '37.4979')),
+                             'centerLon': float(param('centerLon', '127.0276'))}
+        
+        if path.startswith('/api/articles/complex/'):
+            self._count('articles')
+            complex_no = path.rsplit('/', 1)[-1]
+            articles = [a for a in self._articles(complex_no, trade_types) if self._match_article(a, param)]
+            items, more = self._paginate(articles, page, self.ARTICLE_PAGE_SIZE)
+            return 200, {}, {'articleList': items, 'isMoreData': more}
+        
+        if path.startswith('/api/articles/'):
+            self._count('detail')
+            return 200, {}, self._article_detail(path.rsplit('/', 1)[-1])
+        
+        self._count('404')
+        return 404, {}, {'error': 'not found'}
+    
+    def _make_handler(self):
+        """BaseHTTPRequestHandler 클래스 생성 (서버 인스턴스 연결)"""
+        server = self
+        
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                parsed = urlparse(self.path)
+                
+                delay = server.latency + (random.uniform(0, server.jitter) if server.jitter else 0)
+                if delay > 0:
+                    time.sleep(delay)
+                
+                status, headers, body = server.handle(parsed.path, parse_qs(parsed.query))
+                
+                if body is None:
+                    payload = b'<html><body>mock new.land.naver.com</body></html>'
+                    content_type = 'text/html; charset=utf-8'
+                else:
+                    payload = json.dumps(body, ensure_ascii=False).encode('utf-8')
+                    content_type = 'application/json; charset=utf-8'
+                
+                self.send_response(status)
+                self.send_header('Content-Type', content_type)
+                self.send_header('Content-Length', str(len(payload)))
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(payload)
+            
+            def log_message(self, format, *args):
+                logger.debug(format % args)
+        
+        return Handler
+
+
+def main():
+    """명령줄 실행"""
+    parser = argparse.ArgumentParser(description='네이버 부동산 API 모의 서버')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8080)
+    parser.add_argument('--complexes', type=int, default=30, help='지역당 단지 수')
+    parser.add_argument('--articles', type=int, default=60, help='단지·거래 유형당 최대 매물 수')
+    parser.add_argument('--latency', type=float, default=0.0, help='응답 지연 (초)')
+    parser.add_argument('--jitter', type=float, default=0.0, help='응답 지연 흔들림 (초)')
+    parser.add_argument('--rate-429', type=float, default=0.0, help='무작위 429 응답 확률')
+    parser.add_argument('--rate-403', type=float, default=0.0, help='무작위 403 응답 확률')
+    parser.add_argument('--rpm-limit', type=int, default=0, help='분당 API 요청 한도 (초과 시 429)')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+    
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    
+    server = MockNaverLandServer(
+        host=args.host,
+        port=args.port,
+        complexes_per_region=args.complexes,
+        max_articles_per_complex=args.articles,
+        latency=args.latency,
+        jitter=args.jitter,
+        error_429_rate=args.rate_429,
+        error_403_rate=args.rate_403,
+        rpm_limit=args.rpm_limit,
+        seed=args.seed
+    )
+    server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+"""
+페이지 준비 대기 모듈
+고정 대기(time.sleep) 대신 실제 준비 신호가 올 때까지만 기다리고, 방문마다 실제로 기다린 시간을 기록
+
+- 안정 대기: 값(목록 요소 수, 쿠키 수 등)이 0보다 크고 settle_ms 동안 바뀌지 않으면 준비 완료
+- 응답 대기: 목록 API 응답이 도착할 때까지 걸린 시간을 기록 (NaverRealEstateScraper._capture_api_response)
+- 통계: 대기 종류별 횟수, 평균/최대 대기 시간, 시간 초과 횟수
+"""
+
+import threading
+import time
+import logging
+from typing import Callable, Dict, List
+
+logger = logging.getLogger(__name__)
+
+
+class PageWaits:
+    """준비 신호 기반 페이지 대기 및 대기 시간 기록 클래스"""
+    
+    DEFAULT_TIMEOUT_MS = 10000  # 준비 신호를 기다리는 최대 시간
+    DEFAULT_SETTLE_MS = 500     # 값이 이 시간 동안 그대로면 준비 완료
+    POLL_MS = 100               # 확인 간격
+    
+    def __init__(self):
+        """대기 기록 초기화"""
+        self._lock = threading.Lock()
+        self._waits: Dict[str, List[float]] = {}
+        self._timeouts: Dict[str, int] = {}
+    
+    def record(self, label: str, seconds: float, ready: bool = True):
+        """
+        대기 시간 기록
+        
+        Args:
+            label: 대기 종류 (예: 'article_list', 'homepage')
+            seconds: 실제로 기다린 시간 (초)
+            ready: 준비 신호를 받았는지 (False면 시간 초과)
+        """
+        with self._lock:
+            self._waits.setdefault(label, []).append(seconds)
+            if not ready:
+                self._timeouts[label] = self._timeouts.get(label, 0) + 1
+        
+        if ready:
+            logger.debug(f"⏳ {label} 준비 완료: {seconds:.2f}초")
+        else:
+            logger.warning(f"⏳ {label} 준비 신호 없음 ({seconds:.1f}초 대기 후 진행)")
+    
+    def wait_until_stable(self, page, probe: Callable[[], int], label: str,
+                          timeout_ms: int = DEFAULT_TIMEOUT_MS, settle_ms: int = DEFAULT_SETTLE_MS) -> int:
+        """
+        probe 값이 0보다 크고 settle_ms 동안 그대로일 때까지 대기
+        
+        확인 사이에는 page.wait_for_timeout으로 기다려 그동안 브라우저 이벤트가 계속 처리됩니다.
+        
+        Args:
+            page: playwright Page
+            probe: 현재 값을 돌려주는 함수 (예: 목록 요소 수)
+            label: 대기 종류 (기록용)
+            timeout_ms: 최대 대기 시간 (밀리초)
+            settle_ms: 값이 바뀌지 않아야 하는 시간 (밀리초)
+        
+        Returns:
+            마지막으로 확인한 값 (시간 초과여도 그때까지의 값)
+        """
+        started = time.perf_counter()
+        deadline = started + timeout_ms / 1000
+        last_value, last_change = probe(), started
+        
+        while True:
+            now = time.perf_counter()
+            if last_value > 0 and now - last_change >= settle_ms / 1000:
+                self.record(label, now - started)
+                return last_value
+            if now >= deadline:
+                self.record(label, now - started, ready=False)
+                return last_value
+            
+            page.wait_for_timeout(self.POLL_MS)
+            value = probe()
+            if value != last_value:
+                last_value, last_change = value, time.perf_counter()
+    
+    def wait_for_selector_count(self, page, selector: str, label: str,
+                                timeout_ms: int = DEFAULT_TIMEOUT_MS, settle_ms: int = DEFAULT_SETTLE_MS) -> int:
+        """
+        selector에 해당하는 요소 수가 안정될 때까지 대기 (목록 렌더링 완료)
+        
+        Args:
+            page: playwright Page
+            selector: 목록 항목 CSS 선택자
+            label: 대기 종류 (기록용)
+            timeout_ms: 최대 대기 시간 (밀리초)
+            settle_ms: 요소 수가 바뀌지 않아야 하는 시간 (밀리초)
+        
+        Returns:
+            요소 수
+        """
+        return self.wait_until_stable(page, lambda: page.locator(selector).count(), label, timeout_ms, settle_ms)
+    
+    def wait_for_cookies(self, page, label: str,
+                         timeout_ms: int = DEFAULT_TIMEOUT_MS, settle_ms: int = DEFAULT_SETTLE_MS) -> int:
+        """
+        브라우저 쿠키 수가 안정될 때까지 대기 (세션 쿠키 발급 완료)
+        
+        Args:
+            page: playwright Page
+            label: 대기 종류 (기록용)
+            timeout_ms: 최대 대기 시간 (밀리초)
+            settle_ms: 쿠키 수가 바뀌지 않아야 하는 시간 (밀리초)
+        
+        Returns:
+            쿠키 수
+        """
+        return self.wait_until_stable(page, lambda: len(page.context.cookies()), label, timeout_ms, settle_ms)
+    
+    def get_stats(self) -> Dict[str, Dict]:
+        """
+        대기 통계
+        
+        Returns:
+            대기 종류별 {'count': 횟수, 'avg': 평균(초), 'max': 최대(초), 'timeouts': 시간 초과 횟수}
+        """
+        with self._lock:
+            return {
+                label: {
+                    'count': len(waits),
+                    'avg': round(sum(waits) / len(waits), 2),
+                    'max': round(max(waits), 2),
+                    'timeouts': self._timeouts.get(label, 0),
+                }
+                for label, waits in self._waits.items()
+            }
@@ -0,0 +1,158 @@
+"""
+매물 처리 파이프라인 모듈
+크롤링 → 필터 → 저장 → 알림 단계를 크기 제한 큐로 연결해 단지 하나가 끝날 때마다 바로 처리
+
+- 크롤링: 호출한 스레드에서 단지별 매물 리스트를 큐에 넣음 (NaverRealEstateScraper.iter_region)
+- 필터/저장/알림: 단계마다 스레드 하나
+- 큐가 가득 차면 앞 단계가 기다림 (메모리 사용량 제한)
+"""
+
+import queue
+import threading
+import time
+import logging
+from typing import Callable, Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class PropertyPipeline:
+    """크롤링 → 필터 → 저장 → 알림 스트리밍 파이프라인 클래스"""
+    
+    _DONE = object()  # 단계 종료 신호
+    
+    def __init__(self, filter_manager, db, notifier=None, queue_size: int = 8, clock=None):
+        """
+        파이프라인 초기화
+        
+        Args:
+            filter_manager: FilterManager
+            db: PropertyDatabase
+            notifier: TelegramNotifierSync (없으면 알림 단계 생략)
+            queue_size: 단계 사이 큐의 최대 크기
+            clock: 신규 매물 발견 시각에 쓸 시계 (없으면 현재 시각, 가상 시계를 쓰면 크롤러와 같은 시계)
+        """
+        self.filter_manager = filter_manager
+        self.db = db
+        self.notifier = notifier
+        self.queue_size = queue_size
+        self.clock = clock
+        
+        self._lock = threading.Lock()
+        self.stats = {
+            'total_crawled': 0,
+            'filtered_properties': 0,
+            'new_properties': 0,
+            'notified_properties': 0,
+        }
+        self._alert_latencies: List[float] = []
+    
+    def _count(self, key: str, amount: int = 1):
+        with self._lock:
+            self.stats[key] += amount
+    
+    def _filter(self, item) -> List:
+        """필터 단계: (크롤링 시각, 매물 리스트) → (크롤링 시각, 통과한 매물 리스트)"""
+        fetched_at, properties = item
+        filtered = self.filter_manager.filter_properties(properties)
+        self._count('filtered_properties', len(filtered))
+        return [(fetched_at, filtered)] if filtered else []
+    
+    def _store(self, item) -> List:
+        """저장 단계: 신규 매물만 다음 단계로 (매물 하나씩)"""
+        fetched_at, properties = item
+        new_items = []
+        for prop in properties:
+            if self.db.add_property(prop, self.clock.now() if self.clock else None):
+                self._count('new_properties')
+                logger.info(f"신규 매물 발견: {prop['complex_name']} - {prop['id']}")
+                new_items.append((fetched_at, prop))
+        return new_items
+    
+    def _notify(self, item) -> List:
+        """알림 단계: 텔레그램 전송 후 알림 완료 표시"""
+        fetched_at, prop = item
+        if self.notifier.send_property_notification(prop):
+            self._count('notified_properties')
+            self.db.mark_as_notified(prop['id'])
+            latency = time.monotonic() - fetched_at
+            with self._lock:
+                self._alert_latencies.append(latency)
+            logger.info(f"알림 전송 완료 (크롤링 후 {latency:.1f}초)")
+        return []
+    
+    def _run_stage(self, name: str, inbox: queue.Queue, outbox: Optional[queue.Queue],
+                   handler: Callable[[object], List]):
+        """단계 스레드 본체: 종료 신호가 올 때까지 처리 (항목별 오류는 기록 후 계속)"""
+        while True:
+            item = inbox.get()
+            if item is self._DONE:
+                if outbox is not None:
+                    outbox.put(self._DONE)
+                return
+            
+            try:
+                outputs = handler(item)
+            except Exception as e:
+                logger.error(f"{name} 단계 처리 실패: {e}")
+                continue
+            
+            if outbox is not None:
+                for output in outputs:
+                    outbox.put(output)
+    
+    def run(self, batches: Iterable[List[Dict]]) -> Dict:
+        """
+        파이프라인 실행 (모든 단계가 끝날 때까지 대기)
+        
+        Args:
+            batches: 단지별 매물 리스트를 차례로 내주는 이터러블 (크롤링 단계)
+        
+        Returns:
+            처리 통계 딕셔너리
+        """
+        filter_queue = queue.Queue(self.queue_size)
+        store_queue = queue.Queue(self.queue_size)
+        notify_queue = queue.Queue(self.queue_size) if self.notifier else None
+        
+        stages = [
+            ('필터', filter_queue, store_queue, self._filter),
+            ('저장', store_queue, notify_queue, self._store),
+        ]
+        if self.notifier:
+            stages.append(('알림', notify_queue, None, self._notify))
+        
+        threads = [
+            threading.Thread(target=self._run_stage, args=stage, name=f"pipeline-{stage[0]}", daemon=True)
+            for stage in stages
+        ]
+        for thread in threads:
+            thread.start()
+        
+        try:
+            for properties in batches:
+                if not properties:
+                    continue
+                self._count('total_crawled', len(properties))
+                filter_queue.put((time.monotonic(), properties))
+        finally:
+            # 크롤링이 오류로 끝나도 이미 넘긴 매물은 끝까지 저장/알림
+            filter_queue.put(self._DONE)
+            for thread in threads:
+                thread.join()
+        
+        return self.get_stats()
+    
+    def get_stats(self) -> Dict:
+        """
+        처리 통계
+        
+        Returns:
+            통계 정보 딕셔너리 (알림 지연: 크롤링 후 알림까지 걸린 시간, 초)
+        """
+        with self._lock:
+            stats = dict(self.stats)
+            if self._alert_latencies:
+                stats['alert_latency_avg'] = round(sum(self._alert_latencies) / len(self._alert_latencies), 1)
+                stats['alert_latency_max'] = round(max(self._alert_latencies), 1)
+            return stats
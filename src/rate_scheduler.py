@@ -0,0 +1,203 @@
+"""
+요청 속도 조절 모듈
+토큰 버킷 + AIMD(가산 증가 / 곱셈 감소) 방식으로 모든 외부 요청의 속도를 관리
+
+- 모든 요청은 전송 전에 acquire() (비동기: acquire_async()) 로 토큰을 받아야 함
+- 응답 코드를 record_response()로 알려주면 속도가 자동 조절됨
+  - 200: 최대 속도(기본값: 목표 속도의 DEFAULT_CEILING_FACTOR배)까지 조금씩 증가
+  - 403/429: 즉시 절반으로 감소 (429는 추가로 일정 시간 전체 정지)
+"""
+
+import random
+import threading
+import logging
+from typing import Dict, Optional
+
+from clock import SystemClock
+
+logger = logging.getLogger(__name__)
+
+
+class RateScheduler:
+    """토큰 버킷 기반 요청 속도 조절 클래스 (스레드/코루틴 공용)"""
+    
+    # 최대 속도를 지정하지 않았을 때 목표 속도에 곱할 값 (같으면 가산 증가가 목표 속도를 넘지 못해 감소만 동작)
+    DEFAULT_CEILING_FACTOR = 1.5
+    
+    def __init__(self, requests_per_minute: float = 4.0,
+                 max_requests_per_minute: Optional[float] = None,
+                 min_requests_per_minute: float = 0.5,
+                 burst: int = 1,
+                 increase_step: float = 0.25,
+                 decrease_factor: float = 0.5,
+                 penalty_seconds: float = 60.0,
+                 max_penalty_seconds: float = 1800.0,
+                 jitter: float = 0.2,
+                 clock: Optional[SystemClock] = None):
+        """
+        속도 조절기 초기화
+        
+        Args:
+            requests_per_minute: 목표 분당 요청 수 (시작 속도)
+            max_requests_per_minute: 성공이 이어질 때 올라갈 수 있는 최대 속도
+                (기본값: 목표 속도 × DEFAULT_CEILING_FACTOR, 목표 속도보다 낮으면 ValueError)
+            min_requests_per_minute: 차단 신호가 이어져도 내려가지 않는 최저 속도
+            burst: 버킷 크기 (연속으로 바로 보낼 수 있는 요청 수)
+            increase_step: 200 응답마다 올릴 분당 요청 수 (가산 증가)
+            decrease_factor: 403/429 응답 시 곱할 값 (곱셈 감소)
+            penalty_seconds: 429 응답 시 전체 정지 시간 (연속 429마다 2배)
+            max_penalty_seconds: 429 정지 시간 상한
+            jitter: 대기 시간 흔들림 비율 (기계적인 간격 방지)
+            clock: 시간 읽기/대기에 사용할 시계 (없으면 실제 시계, 시뮬레이션 시 VirtualClock)
+        """
+        if max_requests_per_minute and max_requests_per_minute < requests_per_minute:
+            raise ValueError(f"최대 속도({max_requests_per_minute})가 목표 속도({requests_per_minute})보다 낮습니다")
+        
+        self.target_rpm = requests_per_minute
+        self.max_rpm = max_requests_per_minute or requests_per_minute * self.DEFAULT_CEILING_FACTOR
+        self.min_rpm = min(min_requests_per_minute, self.target_rpm)
+        self.burst = max(1, burst)
+        self.increase_step = increase_step
+        self.decrease_factor = decrease_factor
+        self.penalty_seconds = penalty_seconds
+        self.max_penalty_seconds = max_penalty_seconds
+        self.jitter = jitter
+        
+        self.current_rpm = self.target_rpm
+        self.clock = clock or SystemClock()
+        
+        self._lock = threading.Lock()
+        self._tokens = float(self.burst)
+        self._last = self.clock.monotonic()  # 토큰 계산 기준 시각 (정지 중이면 미래 시각)
+        self._consecutive_throttles = 0
+        
+        # 통계
+        self.total_requests = 0
+        self.total_wait = 0.0
+        self.status_counts: Dict[int, int] = {}
+    
+    def _refill(self, now: float):
+        """경과 시간만큼 토큰 충전 (잠금 상태에서 호출)"""
+        if now > self._last:
+            self._tokens = min(self.burst, self._tokens + (now - self._last) * self.current_rpm / 60)
+            self._last = now
+    
+    def reserve(self) -> float:
+        """
+        토큰 하나를 예약하고 요청 전에 기다려야 할 시간을 반환
+        
+        Returns:
+            대기 시간 (초)
+        """
+        with self._lock:
+            now = self.clock.monotonic()
+            self._refill(now)
+            self._tokens -= 1
+            
+            if self._tokens >= 0:
+                ready = max(now, self._last)
+            else:
+                # 부족한 토큰이 충전되는 시각까지 대기 (앞선 예약 뒤로 줄 서기)
+                ready = self._last + (-self._tokens) * 60 / self.current_rpm
+            
+            wait = max(0.0, ready - now)
+            if wait > 0 and self.jitter:
+                wait *= random.uniform(1 - self.jitter, 1 + self.jitter)
+            
+            self.total_requests += 1
+            self.total_wait += wait
+            return wait
+    
+    def acquire(self, max_wait: Optional[float] = None) -> float:
+        """
+        토큰을 받을 때까지 대기 (동기)
+        
+        Args:
+            max_wait: 최대 대기 시간 (초, 넘으면 대기하지 않고 TimeoutError)
+        
+        Returns:
+            실제 대기한 시간 (초)
+        """
+        wait = self.reserve()
+        if max_wait is not None and wait > max_wait:
+            raise TimeoutError(f"요청 대기 {wait:.0f}초가 남은 시간 {max(0.0, max_wait):.0f}초를 초과")
+        if wait > 0:
+            logger.debug(f"⏳ 요청 대기 {wait:.1f}초 (현재 {self.current_rpm:.2f}회/분)")
+            self.clock.sleep(wait)
+        return wait
+    
+    async def acquire_async(self, max_wait: Optional[float] = None) -> float:
+        """
+        토큰을 받을 때까지 대기 (비동기)
+        
+        Args:
+            max_wait: 최대 대기 시간 (초, 넘으면 대기하지 않고 TimeoutError)
+        
+        Returns:
+            실제 대기한 시간 (초)
+        """
+        wait = self.reserve()
+        if max_wait is not None and wait > max_wait:
+            raise TimeoutError(f"요청 대기 {wait:.0f}초가 남은 시간 {max(0.0, max_wait):.0f}초를 초과")
+        if wait > 0:
+            await self.clock.sleep_async(wait)
+        return wait
+    
+    def pause(self, seconds: float):
+        """
+        모든 요청을 일정 시간 정지
+        
+        Args:
+            seconds: 정지 시간 (초)
+        """
+        with self._lock:
+            resume_at = self.clock.monotonic() + seconds
+            if resume_at > self._last:
+                self._last = resume_at
+                self._tokens = min(self._tokens, 0.0)
+    
+    def record_response(self, status_code: int):
+        """
+        응답 코드로 속도 조절 (AIMD)
+        
+        Args:
+            status_code: HTTP 응답 코드
+        """
+        penalty = 0.0
+        
+        with self._lock:
+            self.status_counts[status_code] = self.status_counts.get(status_code, 0) + 1
+            
+            if status_code == 200:
+                self._consecutive_throttles = 0
+                self.current_rpm = min(self.max_rpm, self.current_rpm + self.increase_step)
+            
+            elif status_code in (403, 429):
+                previous = self.current_rpm
+                self.current_rpm = max(self.min_rpm, self.current_rpm * self.decrease_factor)
+                logger.warning(f"🐢 요청 속도 감소 ({status_code}): {previous:.2f} → {self.current_rpm:.2f}회/분")
+                
+                if status_code == 429:
+                    penalty = min(self.max_penalty_seconds,
+                                  self.penalty_seconds * (2 ** self._consecutive_throttles))
+                    self._consecutive_throttles += 1
+        
+        if penalty:
+            logger.info(f"🚨 429 수신 - 모든 요청 {penalty / 60:.1f}분 정지")
+            self.pause(penalty)
+    
+    def get_stats(self) -> Dict:
+        """
+        속도 조절 통계
+        
+        Returns:
+            통계 정보 딕셔너리
+        """
+        with self._lock:
+            return {
+                'current_rpm': round(self.current_rpm, 2),
+                'target_rpm': self.target_rpm,
+                'requests': self.total_requests,
+                'total_wait_seconds': round(self.total_wait, 1),
+                'status_counts': dict(self.status_counts)
+            }
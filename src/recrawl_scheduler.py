@@ -0,0 +1,125 @@
+"""
+단지별 재크롤링 일정 모듈
+properties 테이블의 first_seen 기록으로 단지마다 신규 매물 발생률을 추정하고,
+하루 크롤링 예산 안에서 자주 바뀌는 단지는 자주, 조용한 단지는 드물게 다시 크롤링하도록 간격을 정합니다.
+
+- 발생률: (기간 내 신규 매물 수 + 0.5) / (관찰 일수 + 1) (매물이 없던 단지도 간격이 무한히 늘지 않도록 보정)
+- 간격: 평균 알림 지연(발생률 × 간격 / 2의 합)을 예산 안에서 최소화하는 √발생률 비례 배분
+  (크롤링 빈도 = 예산 × √λ / Σ√λ)
+"""
+
+import math
+import logging
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class RecrawlScheduler:
+    """신규 매물 발생률 기반 단지별 재크롤링 간격 계산 클래스"""
+    
+    PRIOR_ARRIVALS = 0.5  # 발생률 보정: 가상의 신규 매물 수
+    PRIOR_DAYS = 1.0      # 발생률 보정: 가상의 관찰 일수
+    
+    def __init__(self, db, budget_per_day: Optional[float] = None, history_days: float = 30,
+                 min_interval_hours: float = 2, max_interval_hours: float = 168,
+                 default_interval_hours: float = 24):
+        """
+        재크롤링 일정 초기화
+        
+        Args:
+            db: PropertyDatabase
+            budget_per_day: 하루 단지 크롤링 횟수 예산 (없으면 모든 단지를 default_interval_hours마다 크롤링하는 만큼)
+            history_days: 발생률 추정에 사용할 기간 (일)
+            min_interval_hours: 최소 재크롤링 간격 (시간)
+            max_interval_hours: 최대 재크롤링 간격 (시간)
+            default_interval_hours: 예산을 정하지 않았을 때 기준 간격 (시간, 기존 고정 주기)
+        """
+        self.db = db
+        self.budget_per_day = budget_per_day
+        self.history_days = history_days
+        self.min_interval_hours = min_interval_hours
+        self.max_interval_hours = max_interval_hours
+        self.default_interval_hours = default_interval_hours
+    
+    def estimate_rate(self, arrivals: int, observed_days: float) -> float:
+        """
+        하루 신규 매물 발생률 추정
+        
+        Args:
+            arrivals: 관찰 기간 동안의 신규 매물 수
+            observed_days: 관찰 일수
+        
+        Returns:
+            하루 평균 신규 매물 수
+        """
+        return (arrivals + self.PRIOR_ARRIVALS) / (max(0.0, observed_days) + self.PRIOR_DAYS)
+    
+    def allocate(self, rates: List[float], budget_per_day: float) -> List[float]:
+        """
+        발생률에 따라 예산을 나눠 단지별 재크롤링 간격 계산
+        
+        Args:
+            rates: 단지별 하루 신규 매물 발생률
+            budget_per_day: 하루 단지 크롤링 횟수 예산
+        
+        Returns:
+            단지별 재크롤링 간격 (시간, 최소/최대 간격으로 제한)
+        """
+        total = sum(math.sqrt(rate) for rate in rates)
+        if total <= 0 or budget_per_day <= 0:
+            return [self.max_interval_hours for _ in rates]
+        
+        intervals = []
+        for rate in rates:
+            crawls_per_day = budget_per_day * math.sqrt(rate) / total
+            hours = 24 / crawls_per_day
+            intervals.append(min(self.max_interval_hours, max(self.min_interval_hours, hours)))
+        return intervals
+    
+    def update(self, now: Optional[datetime] = None) -> Dict:
+        """
+        모든 단지의 발생률과 재크롤링 간격을 다시 계산해 저장
+        
+        Args:
+            now: 기준 시각 (없으면 현재 시각)
+        
+        Returns:
+            통계 딕셔너리 (단지 수, 예산, 간격 최소/중앙/최대)
+        """
+        now = now or datetime.now()
+        since = now - timedelta(days=self.history_days)
+        
+        history = self.db.get_arrival_history(since)
+        if not history:
+            return {'complexes': 0}
+        
+        rates = []
+        for row in history:
+            start = datetime.fromisoformat(row['history_start']) if row['history_start'] else now
+            observed_days = (now - max(start, since)).total_seconds() / 86400
+            rates.append(self.estimate_rate(row['arrivals'], observed_days))
+        
+        budget = self.budget_per_day or len(history) * 24 / self.default_interval_hours
+        intervals = self.allocate(rates, budget)
+        
+        self.db.save_crawl_intervals([
+            {
+                'complex_no': row['complex_no'],
+                'trade_type': row['trade_type'],
+                'rate_per_day': round(rate, 4),
+                'interval_hours': round(hours, 2)
+            }
+            for row, rate, hours in zip(history, rates, intervals)
+        ])
+        
+        ordered = sorted(intervals)
+        return {
+            'complexes': len(history),
+            'budget_per_day': round(budget, 1),
+            'planned_per_day': round(sum(24 / hours for hours in intervals), 1),
+            'interval_min_hours': round(ordered[0], 1),
+            'interval_median_hours': round(ordered[len(ordered) // 2], 1),
+            'interval_max_hours': round(ordered[-1], 1)
+        }
@@ -0,0 +1,220 @@
+"""
+브라우저 리소스 차단 모듈
+Playwright 컨텍스트의 요청을 가로채 크롤링에 필요 없는 리소스(이미지, 미디어, 폰트, 지도 타일, 트래커)를 받지 않음
+
+- 차단: 리소스 유형(image/media/font) 또는 호스트(지도 타일, 분석/광고 트래커)가 일치하는 요청은 abort
+- 허용: 문서, 스크립트, 스타일시트, XHR/fetch(목록 API) 등 나머지 요청
+- 통계: 차단한 요청 수(이유별), 받은 바이트 수, 페이지 로딩 시간
+- 비교: 명령줄로 실행하면 같은 페이지를 차단 없이/차단하고 각각 열어 바이트 수와 로딩 시간을 비교
+"""
+
+import argparse
+import threading
+import time
+import logging
+from typing import Dict, Iterable, List, Optional
+from urllib.parse import urlparse
+
+logger = logging.getLogger(__name__)
+
+
+class ResourceBlocker:
+    """Playwright 요청 차단 정책 클래스"""
+    
+    # 차단할 리소스 유형 (Playwright request.resource_type)
+    DEFAULT_BLOCKED_TYPES = ('image', 'media', 'font')
+    
+    # 지도 타일 서버 (지도 SDK 스크립트는 허용해야 목록 API가 호출되므로 타일만 차단)
+    MAP_TILE_HOSTS = ('map.pstatic.net', 'nrbe.map.naver.net')
+    
+    # 분석/광고 트래커 (하위 도메인 포함)
+    TRACKER_HOSTS = (
+        'wcs.naver.net', 'lcs.naver.com', 'ntm.pstatic.net',
+        'google-analytics.com', 'googletagmanager.com', 'doubleclick.net',
+        'facebook.net', 'facebook.com',
+    )
+    
+    def __init__(self, blocked_types: Optional[Iterable[str]] = None,
+                 map_tile_hosts: Optional[Iterable[str]] = None,
+                 tracker_hosts: Optional[Iterable[str]] = None,
+                 enabled: bool = True):
+        """
+        차단 정책 초기화
+        
+        Args:
+            blocked_types: 차단할 리소스 유형 (없으면 DEFAULT_BLOCKED_TYPES)
+            map_tile_hosts: 차단할 지도 타일 호스트 (없으면 MAP_TILE_HOSTS)
+            tracker_hosts: 차단할 트래커 호스트 (없으면 TRACKER_HOSTS)
+            enabled: False면 차단하지 않고 통계만 수집 (비교 측정용)
+        """
+        self.blocked_types = set(self.DEFAULT_BLOCKED_TYPES if blocked_types is None else blocked_types)
+        self.map_tile_hosts = tuple(self.MAP_TILE_HOSTS if map_tile_hosts is None else map_tile_hosts)
+        self.tracker_hosts = tuple(self.TRACKER_HOSTS if tracker_hosts is None else tracker_hosts)
+        self.enabled = enabled
+        
+        self._lock = threading.Lock()
+        self.reset_stats()
+    
+    @staticmethod
+    def _match_host(host: str, hosts: Iterable[str]) -> bool:
+        """호스트가 목록의 도메인이거나 그 하위 도메인인지 확인"""
+        return any(host == h or host.endswith('.' + h) for h in hosts)
+    
+    def classify(self, url: str, resource_type: str) -> Optional[str]:
+        """
+        요청을 차단할 이유 확인
+        
+        Args:
+            url: 요청 URL
+            resource_type: Playwright 리소스 유형 (document, script, image, xhr 등)
+        
+        Returns:
+            차단 이유 ('tracker', 'map_tile' 또는 리소스 유형, 허용이면 None)
+        """
+        host = (urlparse(url).hostname or '').lower()
+        if self._match_host(host, self.tracker_hosts):
+            return 'tracker'
+        if self._match_host(host, self.map_tile_hosts):
+            return 'map_tile'
+        if resource_type in self.blocked_types:
+            return resource_type
+        return None
+    
+    def install(self, context):
+        """
+        Playwright 브라우저 컨텍스트에 차단 정책과 통계 수집 등록 (컨텍스트의 모든 페이지에 적용)
+        
+        Args:
+            context: playwright BrowserContext
+        """
+        if self.enabled:
+            context.route('**/*', self._handle_route)
+        context.on('requestfinished', self._on_request_finished)
+        
+        logger.info(f"🧱 리소스 차단 {'사용' if self.enabled else '안 함'}: "
+                    f"유형 {sorted(self.blocked_types)}, 호스트 {len(self.map_tile_hosts) + len(self.tracker_hosts)}개")
+    
+    def _handle_route(self, route):
+        """route 핸들러: 차단 대상이면 abort, 아니면 그대로 진행"""
+        request = route.request
+        reason = self.classify(request.url, request.resource_type)
+        if reason is None:
+            route.continue_()
+            return
+        
+        with self._lock:
+            self.blocked[reason] = self.blocked.get(reason, 0) + 1
+        route.abort('blockedbyclient')
+    
+    def _on_request_finished(self, request):
+        """requestfinished 핸들러: 받은 응답 크기 기록 (압축된 전송 크기)"""
+        try:
+            sizes = request.sizes()
+            received = sizes.get('responseBodySize', 0) + sizes.get('responseHeadersSize', 0)
+        except Exception:
+            received = 0
+        
+        with self._lock:
+            self.requests += 1
+            self.bytes_received += max(0, received)
+    
+    def record_page_load(self, seconds: float):
+        """
+        페이지 로딩 시간 기록 (page.goto 소요 시간)
+        
+        Args:
+            seconds: 로딩 시간 (초)
+        """
+        with self._lock:
+            self.page_loads.append(seconds)
+    
+    def reset_stats(self):
+        """통계 초기화"""
+        with self._lock:
+            self.blocked: Dict[str, int] = {}
+            self.requests = 0
+            self.bytes_received = 0
+            self.page_loads: List[float] = []
+    
+    def get_stats(self) -> Dict:
+        """
+        차단/전송 통계
+        
+        Returns:
+            통계 딕셔너리 (차단 요청 수와 이유별 수, 받은 요청 수/바이트, 페이지 로딩 시간 평균/최대)
+        """
+        with self._lock:
+            stats = {
+                'blocked': sum(self.blocked.values()),
+                'blocked_by_reason': dict(self.blocked),
+                'requests': self.requests,
+                'bytes_received': self.bytes_received,
+                'page_loads': len(self.page_loads),
+            }
+            if self.page_loads:
+                stats['page_load_avg'] = round(sum(self.page_loads) / len(self.page_loads), 2)
+                stats['page_load_max'] = round(max(self.page_loads), 2)
+            return stats
+
+
+def measure(url: str, blocker: ResourceBlocker, wait_until: str = 'networkidle', headless: bool = True) -> Dict:
+    """
+    새 브라우저로 페이지를 한 번 열어 받은 바이트 수와 로딩 시간 측정
+    
+    Args:
+        url: 측정할 페이지 URL
+        blocker: 적용할 차단 정책 (enabled=False면 차단 없이 측정)
+        wait_until: 로딩 완료 기준
+        headless: 헤드리스 모드 여부
+    
+    Returns:
+        blocker.get_stats() 결과
+    """
+    from playwright.sync_api import sync_playwright
+    
+    with sync_playwright() as playwright:
+        browser = playwright.chromium.launch(headless=headless)
+        try:
+            context = browser.new_context(locale='ko-KR')
+            blocker.install(context)
+            page = context.new_page()
+            
+            started = time.perf_counter()
+            page.goto(url, wait_until=wait_until, timeout=60000)
+            blocker.record_page_load(time.perf_counter() - started)
+            context.close()
+        finally:
+            browser.close()
+    
+    return blocker.get_stats()
+
+
+def main():
+    """명령줄 실행: 같은 페이지를 차단 없이/차단하고 열어 비교"""
+    parser = argparse.ArgumentParser(description='브라우저 리소스 차단 효과 측정')
+    parser.add_argument('--url', default='https://new.land.naver.com/complexes', help='측정할 페이지')
+    parser.add_argument('--types', default=','.join(ResourceBlocker.DEFAULT_BLOCKED_TYPES),
+                        help='차단할 리소스 유형 (쉼표로 구분)')
+    parser.add_argument('--wait-until', default='networkidle', choices=['load', 'domcontentloaded', 'networkidle'])
+    parser.add_argument('--headful', action='store_true', help='브라우저 창 표시')
+    args = parser.parse_args()
+    
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    
+    blocked_types = [t.strip() for t in args.types.split(',') if t.strip()]
+    before = measure(args.url, ResourceBlocker(blocked_types, enabled=False), args.wait_until, not args.headful)
+    after = measure(args.url, ResourceBlocker(blocked_types), args.wait_until, not args.headful)
+    
+    saved = before['bytes_received'] - after['bytes_received']
+    ratio = saved / before['bytes_received'] * 100 if before['bytes_received'] else 0.0
+    logger.info(f"📦 받은 바이트: {before['bytes_received']:,} → {after['bytes_received']:,} "
+                f"({saved:,} 바이트, {ratio:.1f}% 절감)")
+    logger.info(f"⏱️  페이지 로딩: {before['page_load_avg']}초 → {after['page_load_avg']}초")
+    logger.info(f"🧱 차단한 요청: {after['blocked']}개 {after['blocked_by_reason']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -9,15 +9,26 @@ API를 통해 매물 정보 수집
 
 import requests
 import random
+import json
 import time
-from typing import List, Dict, Optional
+from urllib.parse import urlparse, urlunparse, parse_qsl, urlencode
+from typing import List, Dict, Optional, Iterator
 import logging
-from datetime import datetime
+from datetime import datetime, timedelta
 import numpy as np
 
+from rate_scheduler import RateScheduler
+from fixtures import FixtureArchive
+from clock import SystemClock, VirtualClock
+from resource_blocker import ResourceBlocker
+from page_waits import PageWaits
+from browser_pool import BrowserPagePool, PooledPage
+from session_state import SessionStateStore
+
 # Playwright 관련 임포트 (Selenium 대체)
 try:
     from playwright.sync_api import sync_playwright
+    from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
     PLAYWRIGHT_AVAILABLE = True
 except ImportError:
     PLAYWRIGHT_AVAILABLE = False
@@ -31,6 +42,11 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+class DeadlineExceeded(Exception):
+    """다음 대기/요청이 실행 시간 제한을 넘기게 되어 크롤링을 멈출 때 발생"""
+    pass
+
+
 class NaverRealEstateScraper:
     """네이버 부동산 크롤러 클래스"""
     
@@ -108,28 +124,122 @@ class NaverRealEstateScraper:
     
     BASE_URL = "https://new.land.naver.com"
     
-    def __init__(self, use_browser: bool = True):
+    # 요청 간격 조절 방식
+    # - scheduler: RateScheduler(토큰 버킷 + AIMD)만으로 간격 조절 (기본값)
+    # - human: 기존 사람 흉내 대기(생각/읽기/휴식)를 RateScheduler 위에 추가
+    PACING_MODES = ('scheduler', 'human')
+    
+    # 목록 API 페이지네이션 안전 상한 (isMoreData가 계속 true여도 여기서 중단)
+    MAX_PAGES = 50
+    
+    # 브라우저 모드: 페이지가 목록 API를 호출할 때까지 기다리는 최대 시간 (밀리초)
+    BROWSER_RESPONSE_TIMEOUT_MS = 15000
+    
+    # 브라우저 모드: 매물 목록 요소 (마지막 항목으로 스크롤하면 다음 페이지를 불러옴)
+    BROWSER_ARTICLE_LIST_SELECTOR = '.item_list--article'
+    
+    # 브라우저 모드: 단지 상세 페이지를 동시에 불러올 페이지 수 (1이면 메인 페이지 하나로 순서대로, scheduler 모드에서만)
+    BROWSER_PAGES = 1
+    
+    # 브라우저 모드: 페이지 하나로 이동할 최대 횟수 (도달하면 페이지를 새로 만들어 장시간 실행 시 메모리 누수 방지)
+    BROWSER_MAX_NAVIGATIONS = 50
+    
+    # complexList의 거래 유형별 매물 수 필드 (변경 없는 단지 건너뛰기용)
+    COMPLEX_COUNT_FIELDS = {
+        'deal_count': 'dealCount',
+        'lease_count': 'leaseCount',
+        'rent_count': 'rentCount',
+    }
+    TRADE_TYPE_COUNT_KEYS = {'A1': 'deal_count', 'B1': 'lease_count', 'B2': 'rent_count'}
+    
+    # 매물 수가 그대로여도 이 시간이 지나면 다시 확인 (같은 수의 매물 교체 감지용)
+    SNAPSHOT_MAX_AGE_HOURS = 24
+    
+    # 중단 후 재시작 시 이 시간 안에 완료된 페이지는 요청 없이 저장된 결과 사용 (분, 0이면 사용 안 함)
+    FRONTIER_FRESHNESS_MINUTES = 60
+    
+    # 단지 목록을 이 시간 동안 다시 요청하지 않고 DB(complexes)에 저장된 목록 사용 (시간, 0이면 사용 안 함)
+    # 단지별 매물 수(변경 감지용)는 단지 목록 요청에만 있으므로 실행 간격보다 짧게 두어 예약 실행마다 새로 받음
+    # (중단 후 재실행처럼 짧은 시간 안에 다시 실행할 때만 요청 생략)
+    COMPLEX_CACHE_HOURS = 1
+    
+    # 저장된 세션이 아직 유효한지 확인하는 가벼운 API 요청 (좌표로 지역 코드 조회, 실패하면 메인 페이지 방문)
+    SESSION_CHECK_PATH = '/api/cortars'
+    SESSION_CHECK_PARAMS = {'zoom': 16, 'centerLat': 37.4979, 'centerLon': 127.0276}
+    
+    # 지역/거래 유형마다 실제로 크롤링할 최대 단지 수 (건너뛴 단지는 세지 않음, 0이면 제한 없음)
+    MAX_COMPLEXES_PER_REGION = 10
+    
+    def __init__(self, use_browser: bool = True, rate_scheduler: Optional[RateScheduler] = None,
+                 pacing_mode: str = 'scheduler', fixtures: Optional[FixtureArchive] = None, base_url: Optional[str] = None,
+                 clock: Optional[SystemClock] = None, resource_blocker: Optional[ResourceBlocker] = None,
+                 session_store: Optional[SessionStateStore] = None):
         """
         크롤러 초기화
         
         Args:
             use_browser: Playwright 브라우저 사용 여부 (True: 실제 브라우저, False: requests만)
+            rate_scheduler: 모든 요청이 공유할 속도 조절기 (없으면 기본 설정으로 생성)
+            pacing_mode: 요청 간격 조절 방식 ('scheduler' 또는 'human')
+            fixtures: 기록/재생 픽스처 (replay 모드면 네트워크 요청과 대기 없이 기록을 재생)
+            base_url: 접속할 서버 주소 (없으면 new.land.naver.com, 부하 테스트 시 mock_server 주소)
+            clock: 시간 읽기/대기에 사용할 시계 (없으면 실제 시계, VirtualClock이면 대기 없이 가상 시간만 진행)
+            resource_blocker: 브라우저 리소스 차단 정책 (없으면 기본 정책: 이미지/미디어/폰트/지도 타일/트래커 차단)
+            session_store: 쿠키/storage_state 저장소 (있으면 저장된 세션을 검증 후 재사용해 메인 페이지 방문 생략)
         """
+        if pacing_mode not in self.PACING_MODES:
+            raise ValueError(f"지원하지 않는 pacing_mode: {pacing_mode}")
+        
+        if base_url:
+            self.BASE_URL = base_url.rstrip('/')
+        
+        self.clock = clock or SystemClock()
         self.session = requests.Session()
         self.use_browser = use_browser and PLAYWRIGHT_AVAILABLE
+        self.rate_scheduler = rate_scheduler or RateScheduler(clock=self.clock)
+        self.pacing_mode = pacing_mode
+        self.last_response_cached = False  # 마지막 응답을 요청 없이 얻었는지 (저장된 페이지 재사용)
+        self.fixtures = fixtures
+        self.replaying = bool(fixtures and fixtures.replaying)
+        self.resource_blocker = resource_blocker or ResourceBlocker()
+        self.page_waits = PageWaits()  # 브라우저 모드 준비 신호 대기 (방문별 실제 대기 시간 기록)
+        self.session_store = session_store
+        self.saved_session = session_store.load() if session_store and not self.replaying else None
+        self.browser_pages = self.BROWSER_PAGES
+        self.browser_max_navigations = self.BROWSER_MAX_NAVIGATIONS
+        
+        self.frontier_freshness_minutes = self.FRONTIER_FRESHNESS_MINUTES
+        self.adaptive_recrawl = True  # 단지별 재크롤링 일정(crawl_schedule)에 따라 건너뛰기
+        self.prioritizer = None  # ComplexPrioritizer (없으면 무작위 순서)
+        self.filter_manager = None  # FilterManager (있으면 필터 조건을 API 쿼리 파라미터로 전달)
+        self.max_complexes = self.MAX_COMPLEXES_PER_REGION
+        self.complex_cache_hours = self.COMPLEX_CACHE_HOURS
+        self.combine_trade_types = False  # 여러 거래 유형을 한 번에 요청 (tradeType='B1:B2') 후 tradeTypeCode로 나눔
+        
+        # 실행 시간 제한 (set_deadline으로 설정, clock.time() 기준 시각)
+        self.deadline: Optional[float] = None
+        self.deadline_reached = False
+        self.simulating = isinstance(self.clock, VirtualClock)  # 재생 중에도 대기 시간을 가상으로 기록
         
         # Playwright 관련
         self.playwright = None
         self.browser = None
         self.context = None
         self.page = None
+        self.page_navigations = 0  # 메인 페이지 이동 횟수 (browser_max_navigations에 도달하면 새 페이지로 교체)
+        self.page_pool: Optional[BrowserPagePool] = None  # 단지 상세 페이지 동시 로딩용 (_page_pool에서 생성)
         
         # ✅ 개선: 세션 시작 시 브라우저 프로필을 한 번만 선택 (핵심!)
         # 실제 사용자는 한 세션에서 브라우저를 바꾸지 않음!
-        self.browser_profile = random.choice(self.BROWSER_PROFILES)
+        # 저장된 세션을 재사용하면 그 쿠키를 받은 프로필(같은 User-Agent)을 그대로 사용
+        saved_profile = self._saved_browser_profile()
+        if self.saved_session and saved_profile is None:
+            logger.info("🍪 저장된 세션의 User-Agent와 같은 브라우저 프로필이 없음 → 저장된 세션 사용 안 함")
+            self.saved_session = None
+        self.browser_profile = saved_profile or random.choice(self.BROWSER_PROFILES)
         
         self.cookies_received = False  # 쿠키 수신 여부
-        self.last_cookie_refresh = time.time()  # 마지막 쿠키 갱신 시간
+        self.last_cookie_refresh = self.clock.time()  # 마지막 쿠키 갱신 시간
         
         self._set_fixed_headers()  # 헤더를 한 번만 설정
         
@@ -137,12 +247,16 @@ class NaverRealEstateScraper:
         if self.use_browser:
             self._init_playwright()
         
-        self._visit_homepage()  # 초기 방문으로 쿠키 받기
+        if self.replaying:
+            logger.info("📼 픽스처 재생 모드: 네트워크 요청 없이 기록된 응답 사용")
+            self.cookies_received = True
+        elif not self._restore_session():
+            self._visit_homepage()  # 초기 방문으로 쿠키 받기
         
         # 사람처럼 행동하기 위한 상태 관리
         self.request_count = 0  # 총 요청 횟수
         self.last_break_count = 0  # 마지막 휴식 시점
-        self.session_start_time = time.time()  # 세션 시작 시간
+        self.session_start_time = self.clock.time()  # 세션 시작 시간
         self.fatigue_level = 0.0  # 피로도 (0.0 ~ 1.0)
     
     def _init_playwright(self):
@@ -167,12 +281,15 @@ class NaverRealEstateScraper:
                 ]
             )
             
-            # 브라우저 컨텍스트 생성 (쿠키 격리)
-            self.context = self.browser.new_context(
-                user_agent=self.browser_profile['user_agent'],
-                viewport={'width': 1920, 'height': 1080},
-                locale='ko-KR'
-            )
+            # 브라우저 컨텍스트 생성 (쿠키 격리, 저장된 세션이 있으면 쿠키/localStorage 복원)
+            storage_state = self.saved_session['storage_state'] if self.saved_session else None
+            self.context = self.browser.new_context(storage_state=storage_state, **self._context_options())
+            
+            # 필요 없는 리소스(이미지, 폰트, 지도 타일, 트래커) 차단 - 컨텍스트의 모든 페이지에 적용
+            self.resource_blocker.install(self.context)
+            
+            # 페이지가 보내는 목록 API 요청에 필터 조건 덧붙이기 (FILTER_PUSHDOWN)
+            self._install_filter_pushdown(self.context)
             
             # 페이지 생성
             self.page = self.context.new_page()
@@ -188,6 +305,120 @@ class NaverRealEstateScraper:
             self.context = None
             self.page = None
     
+    def _context_options(self) -> Dict:
+        """브라우저 컨텍스트 설정 (세션 내내 같은 브라우저 프로필)"""
+        return {
+            'user_agent': self.browser_profile['user_agent'],
+            'viewport': {'width': 1920, 'height': 1080},
+            'locale': 'ko-KR',
+        }
+    
+    def _new_pool_context(self):
+        """
+        페이지 풀용 브라우저 컨텍스트 생성
+        
+        메인 컨텍스트의 쿠키를 그대로 가져가고, 리소스 차단 정책도 똑같이 적용합니다.
+        
+        Returns:
+            playwright BrowserContext
+        """
+        context = self.browser.new_context(storage_state=self.context.storage_state(), **self._context_options())
+        self.resource_blocker.install(context)
+        self._install_filter_pushdown(context)
+        return context
+    
+    def _page_pool(self) -> Optional[BrowserPagePool]:
+        """
+        단지 상세 페이지 동시 로딩용 페이지 풀 (처음 호출할 때 생성)
+        
+        human 모드는 사람처럼 한 페이지씩 보는 것이 목적이므로 풀을 쓰지 않습니다.
+        
+        Returns:
+            페이지 풀 (browser_pages가 1 이하, human 모드, 재생 중, 브라우저가 없으면 None)
+        """
+        if self.browser_pages <= 1 or self.pacing_mode != 'scheduler' or self.replaying or not self.browser:
+            return None
+        
+        if self.page_pool is None:
+            self.page_pool = BrowserPagePool(self._new_pool_context, self.browser_pages, self.browser_max_navigations)
+            logger.info(f"🗂️  브라우저 페이지 풀: {self.browser_pages}개 페이지로 단지 상세 동시 로딩 "
+                        f"(페이지당 최대 {self.browser_max_navigations}회 이동)")
+        return self.page_pool
+    
+    def _saved_browser_profile(self) -> Optional[Dict]:
+        """저장된 세션의 쿠키를 받은 브라우저 프로필 (User-Agent가 같은 프로필, 없으면 None)"""
+        if not self.saved_session:
+            return None
+        for profile in self.BROWSER_PROFILES:
+            if profile['user_agent'] == self.saved_session['user_agent']:
+                return profile
+        return None
+    
+    def _restore_session(self) -> bool:
+        """
+        저장된 세션을 requests.Session에 적용하고 가벼운 API 요청으로 검증
+        
+        브라우저 모드는 _init_playwright에서 이미 컨텍스트에 복원했습니다.
+        
+        Returns:
+            재사용 가능 여부 (False면 메인 페이지를 방문해 새로 쿠키를 받아야 함)
+        """
+        if not self.saved_session:
+            return False
+        
+        storage_state = self.saved_session['storage_state']
+        cookie_count = SessionStateStore.apply_to_session(storage_state, self.session)
+        if not cookie_count or not self._validate_session():
+            logger.info("🍪 저장된 세션 만료 → 메인 페이지 방문")
+            return False
+        
+        self.cookies_received = True
+        self.last_cookie_refresh = self.clock.time()
+        age_hours = (time.time() - self.saved_session['saved_at']) / 3600
+        logger.info(f"🍪 저장된 세션 재사용: 쿠키 {cookie_count}개 ({age_hours:.1f}시간 전 저장) → 메인 페이지 방문 생략")
+        return True
+    
+    def _validate_session(self) -> bool:
+        """
+        현재 쿠키로 가벼운 API 요청(SESSION_CHECK_PATH)을 보내 세션이 유효한지 확인
+        
+        Returns:
+            200 JSON 응답을 받았는지
+        """
+        self._acquire_token()
+        try:
+            response = self.session.get(
+                f"{self.BASE_URL}{self.SESSION_CHECK_PATH}", params=self.SESSION_CHECK_PARAMS,
+                headers={'Referer': f"{self.BASE_URL}/complexes"}, timeout=10
+            )
+            self.rate_scheduler.record_response(response.status_code)
+            if response.status_code != 200:
+                logger.info(f"🍪 세션 확인 요청 실패: HTTP {response.status_code}")
+                return False
+            response.json()
+            return True
+        except (requests.RequestException, ValueError) as e:
+            logger.info(f"🍪 세션 확인 요청 실패: {e}")
+            return False
+    
+    def _save_session(self):
+        """현재 쿠키/storage_state를 세션 저장소에 저장 (브라우저 모드는 컨텍스트, requests 모드는 세션 쿠키)"""
+        if not self.session_store or self.replaying:
+            return
+        
+        if self.use_browser:
+            if not self.context:
+                return
+            storage_state = self.context.storage_state()
+        else:
+            storage_state = {
+                'cookies': SessionStateStore.cookies_from_session(self.session, urlparse(self.BASE_URL).hostname),
+                'origins': [],
+            }
+        
+        if storage_state.get('cookies'):
+            self.session_store.save(storage_state, self.browser_profile['user_agent'])
+    
     def _visit_homepage(self):
         """
         ✅ 네이버 부동산 홈페이지 방문 (쿠키 받기)
@@ -200,8 +431,9 @@ class NaverRealEstateScraper:
             try:
                 logger.info("🌐 Playwright로 네이버 부동산 메인 페이지 방문 중...")
                 
-                # 페이지 방문 (네트워크 완전 로딩 대기)
-                self.page.goto(self.BASE_URL, wait_until='networkidle', timeout=30000)
+                # 페이지 방문 후 쿠키 발급이 끝날 때까지만 대기 (networkidle 대신 쿠키 수 안정)
+                self._goto(self.BASE_URL, wait_until='domcontentloaded', timeout=30000)
+                self.page_waits.wait_for_cookies(self.page, 'homepage')
                 
                 # 쿠키 획득 및 requests Session에 전달
                 playwright_cookies = self.context.cookies()
@@ -211,7 +443,7 @@ class NaverRealEstateScraper:
                         self.session.cookies.set(cookie['name'], cookie['value'])
                     
                     self.cookies_received = True
-                    self.last_cookie_refresh = time.time()
+                    self.last_cookie_refresh = self.clock.time()
                     logger.info(f"✅ 쿠키 수신 성공: {len(playwright_cookies)}개")
                     
                     # 주요 쿠키 로깅
@@ -220,12 +452,15 @@ class NaverRealEstateScraper:
                     found_cookies = [key for key in important_cookies if key in cookie_names]
                     if found_cookies:
                         logger.info(f"🍪 주요 쿠키 확인: {', '.join(found_cookies)}")
+                    
+                    self._save_session()
                 else:
                     logger.warning("⚠️  쿠키를 받지 못했습니다.")
                 
-                time.sleep(random.uniform(2, 4))
                 logger.info("✅ Playwright 초기 방문 완료 (세션 준비됨)")
                 
+            except DeadlineExceeded:
+                raise
             except Exception as e:
                 logger.error(f"❌ Playwright 방문 실패: {e}")
                 logger.warning("⚠️  requests 모드로 전환합니다.")
@@ -241,14 +476,16 @@ class NaverRealEstateScraper:
                 self.session.headers['Accept'] = 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7'
                 
                 # 메인 페이지 방문
+                self._acquire_token()
                 response = self.session.get(self.BASE_URL, timeout=10)
                 
                 # 쿠키 수신 확인
                 cookies = self.session.cookies.get_dict()
                 if cookies:
                     self.cookies_received = True
-                    self.last_cookie_refresh = time.time()
+                    self.last_cookie_refresh = self.clock.time()
                     logger.info(f"✅ 쿠키 수신 성공: {len(cookies)}개")
+                    self._save_session()
                 else:
                     logger.warning("⚠️  쿠키를 받지 못했습니다. 차단될 가능성 높음!")
                 
@@ -256,9 +493,10 @@ class NaverRealEstateScraper:
                 if original_accept:
                     self.session.headers['Accept'] = original_accept
                 
-                time.sleep(random.uniform(2, 4))
                 logger.info("✅ 초기 방문 완료 (세션 준비됨)")
                 
+            except DeadlineExceeded:
+                raise
             except Exception as e:
                 logger.warning(f"❌ 초기 방문 실패: {e}")
     
@@ -275,13 +513,13 @@ class NaverRealEstateScraper:
         
         # 기본 헤더 (모든 브라우저 공통)
         headers = {
-            'Host': 'new.land.naver.com',  # 명시적 설정 (중요!)
+            'Host': urlparse(self.BASE_URL).netloc,  # 명시적 설정 (중요!)
             'User-Agent': profile['user_agent'],
             'Accept': profile['accept'],
             'Accept-Language': profile['accept_language'],
             'Accept-Encoding': 'gzip, deflate, br',
-            'Referer': 'https://new.land.naver.com/',
-            'Origin': 'https://new.land.naver.com',
+            'Referer': f"{self.BASE_URL}/",
+            'Origin': self.BASE_URL,
             'Connection': 'keep-alive',
             'DNT': '1',  # Do Not Track
             'Upgrade-Insecure-Requests': '1',
@@ -342,7 +580,7 @@ class NaverRealEstateScraper:
         delay_minutes *= (1 + self.fatigue_level * 0.5)
         
         # 활동 시간대 반영 (낮 시간 vs 밤 시간)
-        hour = datetime.now().hour
+        hour = self.clock.now().hour
         if 9 <= hour <= 18:  # 오전 9시 ~ 오후 6시 (활발)
             delay_minutes *= 0.8
         elif hour >= 22 or hour <= 6:  # 밤 10시 ~ 새벽 6시 (느림)
@@ -387,7 +625,7 @@ class NaverRealEstateScraper:
         logger.info(f"☕ 장시간 휴식 (커피/간식): {break_minutes:.1f}분 ({break_seconds:.0f}초) 대기...")
         logger.info(f"   (총 {self.request_count}개 요청 완료, 피로도: {self.fatigue_level:.2f})")
         
-        time.sleep(break_seconds)
+        self._sleep(break_seconds)
         
         # 휴식 후 피로도 감소
         self.fatigue_level = max(0, self.fatigue_level - 0.2)
@@ -405,27 +643,122 @@ class NaverRealEstateScraper:
         reading_minutes = reading_seconds / 60
         
         logger.info(f"📖 페이지 읽는 중... {reading_minutes:.1f}분 ({reading_seconds:.0f}초)")
-        time.sleep(reading_seconds)
+        self._sleep(reading_seconds)
+    
+    def set_deadline(self, seconds: Optional[float]):
+        """
+        실행 시간 제한 설정
+        
+        제한이 있으면 모든 대기/요청 전에 남은 시간을 확인하고,
+        넘기게 되면 DeadlineExceeded로 크롤링을 멈춥니다 (scrape_region은 그때까지의 결과를 반환).
+        
+        Args:
+            seconds: 지금부터 남은 시간 (초, None이면 제한 없음)
+        """
+        self.deadline = None if seconds is None else self.clock.time() + seconds
+        self.deadline_reached = False
+    
+    def remaining_time(self) -> Optional[float]:
+        """
+        실행 시간 제한까지 남은 시간
+        
+        Returns:
+            남은 시간 (초, 제한이 없으면 None)
+        """
+        if self.deadline is None:
+            return None
+        return self.deadline - self.clock.time()
+    
+    def _check_deadline(self, seconds: float, reason: str):
+        """
+        대기 전에 남은 시간 확인
+        
+        Args:
+            seconds: 대기하려는 시간 (초)
+            reason: 로그용 대기 이유
+        """
+        remaining = self.remaining_time()
+        if remaining is not None and (self.deadline_reached or seconds > remaining):
+            self.deadline_reached = True
+            raise DeadlineExceeded(f"{reason} {seconds:.0f}초가 남은 시간 {max(0.0, remaining):.0f}초를 초과")
+    
+    def _sleep(self, seconds: float):
+        """
+        대기 (모든 고정 대기는 이 메서드를 거침)
+        
+        Args:
+            seconds: 대기 시간 (초)
+        """
+        if seconds > 0 and (self.simulating or not self.replaying):
+            self._check_deadline(seconds, "대기")
+            self.clock.sleep(seconds)
+    
+    def _acquire_token(self) -> float:
+        """
+        외부 요청 전에 RateScheduler 토큰 받기 (재생 모드에서는 대기 없음)
+        
+        Returns:
+            실제 대기 시간 (초)
+        """
+        if self.replaying and not self.simulating:
+            return 0.0
+        
+        self._check_deadline(0.0, "요청")
+        try:
+            return self.rate_scheduler.acquire(max_wait=self.remaining_time())
+        except TimeoutError as e:
+            self.deadline_reached = True
+            raise DeadlineExceeded(str(e))
+    
+    def _pace(self, base_min_minutes: float, base_max_minutes: float, message: str) -> float:
+        """
+        human 모드에서만 사람처럼 대기
+        
+        scheduler 모드에서는 요청 간격을 RateScheduler가 전담하므로 대기하지 않습니다.
+        
+        Args:
+            base_min_minutes: 최소 대기 시간 (분)
+            base_max_minutes: 최대 대기 시간 (분)
+            message: 대기 로그 메시지
+            
+        Returns:
+            실제 대기 시간 (초)
+        """
+        if self.pacing_mode != 'human':
+            return 0.0
+        
+        delay = self._human_like_delay(base_min_minutes, base_max_minutes)
+        logger.info(f"{message} {delay / 60:.1f}분 ({delay:.0f}초)")
+        self._sleep(delay)
+        return delay
     
     def _update_fatigue(self):
         """
         피로도 업데이트 (시간이 지날수록 증가)
         """
-        session_duration = (time.time() - self.session_start_time) / 3600  # 시간 단위
+        session_duration = (self.clock.time() - self.session_start_time) / 3600  # 시간 단위
         self.fatigue_level = min(1.0, session_duration * 0.1)  # 10시간 후 최대
     
     def _check_and_refresh_cookies(self):
         """
         쿠키 유효성 검사 및 필요시 재방문
         
-        네이버 쿠키는 시간이 지나면 만료될 수 있으므로,
-        일정 시간(30분)마다 메인 페이지를 다시 방문하여 쿠키를 갱신합니다.
+        네이버 쿠키는 시간이 지나면 만료될 수 있으므로, 일정 시간(30분)마다 가벼운 API 요청으로 확인하고
+        실패할 때만 메인 페이지를 다시 방문하여 쿠키를 갱신합니다.
         """
+        if self.replaying:
+            return
+        
         # 30분(1800초)마다 쿠키 갱신
         cookie_lifetime = 1800  # 30분
-        current_time = time.time()
+        current_time = self.clock.time()
         
         if not self.cookies_received or (current_time - self.last_cookie_refresh) > cookie_lifetime:
+            if self.cookies_received and self._validate_session():
+                logger.info("🍪 쿠키 유효 확인 → 메인 페이지 재방문 생략")
+                self.last_cookie_refresh = current_time
+                return
+            
             logger.info("🔄 쿠키 만료 또는 미수신 → 메인 페이지 재방문...")
             self._visit_homepage()
     
@@ -440,27 +773,30 @@ class NaverRealEstateScraper:
             page_type: 'complexes' (단지 목록), 'complex' (단지 상세), 'articles' (매물 목록)
         """
         landing_urls = {
-            'complexes': 'https://new.land.naver.com/complexes',
-            'complex': 'https://new.land.naver.com/complexes',
-            'articles': 'https://new.land.naver.com/articles',
+            'complexes': f"{self.BASE_URL}/complexes",
+            'complex': f"{self.BASE_URL}/complexes",
+            'articles': f"{self.BASE_URL}/articles",
         }
         
         landing_url = landing_urls.get(page_type, self.BASE_URL)
         
+        if self.replaying:
+            return
+        
         if self.use_browser and self.page:
             # ✅ Playwright로 페이지 방문 (쿠키 갱신)
             try:
                 logger.info(f"🚪 Playwright로 랜딩 페이지 방문: {landing_url}")
                 
-                self.page.goto(landing_url, wait_until='domcontentloaded', timeout=10000)
+                self._goto(landing_url, wait_until='domcontentloaded', timeout=10000)
                 
                 # 쿠키 갱신
                 playwright_cookies = self.context.cookies()
                 for cookie in playwright_cookies:
                     self.session.cookies.set(cookie['name'], cookie['value'])
                 
-                time.sleep(random.uniform(0.5, 1.5))
-                
+            except DeadlineExceeded:
+                raise
             except Exception as e:
                 logger.warning(f"⚠️  Playwright 랜딩 페이지 방문 실패: {e}")
         
@@ -474,15 +810,15 @@ class NaverRealEstateScraper:
                 self.session.headers['Accept'] = 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8'
                 
                 # 페이지 방문
+                self._acquire_token()
                 self.session.get(landing_url, timeout=10)
                 
                 # Accept 헤더 복원 (API 요청용)
                 if original_accept:
                     self.session.headers['Accept'] = original_accept
                 
-                # 짧은 대기 (0.5-1.5초)
-                time.sleep(random.uniform(0.5, 1.5))
-                
+            except DeadlineExceeded:
+                raise
             except Exception as e:
                 logger.warning(f"⚠️  랜딩 페이지 방문 실패: {e}")
     
@@ -498,20 +834,46 @@ class NaverRealEstateScraper:
         """
         if '/api/complexes' in url:
             # 단지 검색 API → 메인 페이지에서 온 것처럼
-            return 'https://new.land.naver.com/'
+            return f"{self.BASE_URL}/"
         elif '/api/articles/complex/' in url:
             # 매물 목록 API → 단지 페이지에서 온 것처럼
-            return 'https://new.land.naver.com/complexes'
+            return f"{self.BASE_URL}/complexes"
         elif '/api/articles/' in url:
             # 매물 상세 API → 매물 목록에서 온 것처럼
-            return 'https://new.land.naver.com/articles'
+            return f"{self.BASE_URL}/articles"
         else:
             # 기본값
-            return 'https://new.land.naver.com/'
+            return f"{self.BASE_URL}/"
     
     def _safe_request(self, url: str, params: Dict = None, retry: int = 3) -> Optional[Dict]:
         """
-        안전한 HTTP 요청 (재시도 포함, 429 에러 특별 처리, 사람처럼 행동)
+        안전한 HTTP 요청 (재시도 포함, 응답 코드를 RateScheduler에 전달해 속도 자동 조절)
+        
+        Args:
+            url: 요청 URL
+            params: 쿼리 파라미터
+            retry: 재시도 횟수
+            
+        Returns:
+            JSON 응답 또는 None
+        """
+        self.last_response_cached = False
+        
+        # 픽스처 재생 모드: 기록된 응답 그대로 반환 (가상 시계면 요청 간격만 가상으로 기록)
+        if self.replaying:
+            self._acquire_token()
+            return self.fixtures.replay_response(url, params)
+        
+        data = self._send_request(url, params, retry)
+        
+        if self.fixtures and self.fixtures.recording:
+            self.fixtures.record_response(url, params, data)
+        
+        return data
+    
+    def _send_request(self, url: str, params: Dict = None, retry: int = 3) -> Optional[Dict]:
+        """
+        실제 HTTP 요청 (쿠키 갱신, 휴식, RateScheduler 대기, 재시도 포함)
         
         Args:
             url: 요청 URL
@@ -524,8 +886,8 @@ class NaverRealEstateScraper:
         # 쿠키 유효성 검사 및 갱신
         self._check_and_refresh_cookies()
         
-        # 요청 전 휴식 필요 여부 확인
-        if self._should_take_break():
+        # 요청 전 휴식 필요 여부 확인 (human 모드)
+        if self.pacing_mode == 'human' and self._should_take_break():
             self._take_break()
         
         for attempt in range(retry):
@@ -540,154 +902,376 @@ class NaverRealEstateScraper:
                     cookies_count = len(self.session.cookies.get_dict())
                     logger.info(f"🍪 현재 쿠키 수: {cookies_count}개")
                 
-                # ✅ 개선: 2배 빠른 대기 시간 (1-3분 → 0.5-1.5분)
                 if attempt == 0:
-                    delay = self._human_like_delay(0.5, 1.5)  # 0.5-1.5분 (2배 빠름!)
-                    delay_minutes = delay / 60
-                    logger.info(f"🤔 생각하는 중... {delay_minutes:.1f}분 ({delay:.0f}초)")
-                    time.sleep(delay)
+                    self._pace(0.5, 1.5, "🤔 생각하는 중...")
+                
+                # 모든 요청은 RateScheduler에서 토큰을 받은 뒤 전송
+                self._acquire_token()
                 
                 # 요청 카운트 증가 및 피로도 업데이트
                 self.request_count += 1
                 self._update_fatigue()
                 
                 response = self.session.get(url, params=params, timeout=30)
+                self.rate_scheduler.record_response(response.status_code)
                 
                 if response.status_code == 200:
-                    # 성공 시 페이지 읽기 시뮬레이션 (30% 확률)
-                    if random.random() < 0.3:
+                    data = response.json()
+                    
+                    # 성공 시 페이지 읽기 시뮬레이션 (human 모드, 30% 확률)
+                    if self.pacing_mode == 'human' and random.random() < 0.3:
                         self._simulate_reading()
-                    return response.json()
+                    return data
                 
                 elif response.status_code == 429:
-                    # 429 Too Many Requests - 30분 대기!
-                    wait_minutes = 30
-                    wait_seconds = wait_minutes * 60
-                    
+                    # 429 Too Many Requests - RateScheduler가 속도를 낮추고 전체 요청을 정지시킴
                     logger.warning(f"⚠️  429 에러 (Too Many Requests) 발생!")
-                    logger.info(f"🚨 크롤링 차단 감지 - {wait_minutes}분 ({wait_seconds}초) 대기...")
-                    logger.info(f"   현재 시각: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-                    logger.info(f"   재개 예정: {(datetime.now().timestamp() + wait_seconds)}")
                     
                     if attempt < retry - 1:
-                        logger.info(f"🕐 {wait_minutes}분 휴식 후 재시도 예정 ({attempt + 2}/{retry})")
-                        time.sleep(wait_seconds)
-                        self._update_headers()  # User-Agent 변경
-                        logger.info("✅ 휴식 완료. 크롤링 재개...")
+                        logger.info(f"🕐 속도 조절 후 재시도 예정 ({attempt + 2}/{retry})")
                     else:
                         logger.error("❌ 최대 재시도 횟수 초과. 프로그램을 나중에 다시 실행하세요.")
                         return None
                 
                 elif response.status_code == 403:
-                    # 403 Forbidden
-                    logger.warning(f"접근 거부 (403). 헤더 변경 후 재시도... ({attempt + 1}/{retry})")
-                    self._update_headers()
-                    delay = random.uniform(5, 10)
-                    time.sleep(delay)
+                    # 403 Forbidden - 헤더 복원 후 (감소된 속도로) 재시도
+                    logger.warning(f"접근 거부 (403). 헤더 재설정 후 재시도... ({attempt + 1}/{retry})")
+                    self._set_fixed_headers()
                 
                 else:
                     logger.warning(f"응답 코드 {response.status_code}")
                     if attempt < retry - 1:
                         delay = random.uniform(3, 7)
-                        time.sleep(delay)
+                        self._sleep(delay)
                 
             except requests.exceptions.RequestException as e:
                 logger.error(f"요청 오류: {e}")
                 if attempt < retry - 1:
                     delay = random.uniform(5, 10)
                     logger.info(f"오류 후 {delay:.1f}초 대기...")
-                    time.sleep(delay)
+                    self._sleep(delay)
         
         return None
     
+    def _main_page(self):
+        """
+        메인 페이지 (이동 횟수가 browser_max_navigations에 도달했으면 같은 컨텍스트의 새 페이지로 교체)
+        
+        Returns:
+            playwright Page
+        """
+        if self.browser_max_navigations and self.page_navigations >= self.browser_max_navigations:
+            logger.info(f"♻️  메인 페이지 {self.page_navigations}회 이동 → 새 페이지로 교체")
+            self.page.close()
+            self.page = self.context.new_page()
+            self.page_navigations = 0
+        return self.page
+    
+    def _goto(self, url: str, wait_until: str = 'networkidle', timeout: int = 30000,
+              slot: Optional[PooledPage] = None):
+        """
+        Playwright 페이지 이동 (로딩 시간은 리소스 차단 통계에 기록)
+        
+        Args:
+            url: 방문할 URL
+            wait_until: 로딩 완료 기준
+            timeout: 타임아웃 (밀리초)
+            slot: 이동할 풀 페이지 (없으면 메인 페이지)
+        """
+        self._acquire_token()
+        
+        if slot is None:
+            page = self._main_page()
+            self.page_navigations += 1
+        else:
+            slot.navigations += 1
+            page = slot.page
+        
+        started = time.perf_counter()
+        page.goto(url, wait_until=wait_until, timeout=timeout)
+        self.resource_blocker.record_page_load(time.perf_counter() - started)
+    
+    def _capture_api_response(self, url: str, api_path: str, page: int = 1,
+                              more_selector: Optional[str] = None, label: str = 'api',
+                              slot: Optional[PooledPage] = None) -> Optional[Dict]:
+        """
+        페이지가 직접 호출하는 목록 API의 JSON 응답을 가로채 반환 (고정 대기 없음)
+        
+        1페이지는 url을 방문하며, 다음 페이지는 목록 마지막 항목으로 스크롤해 페이지가 더 불러오게 합니다.
+        record 모드에서는 응답을 기록하고, replay 모드에서는 브라우저 없이 기록된 응답을 돌려줍니다.
+        응답까지 걸린 시간은 page_waits에 기록합니다.
+        
+        Args:
+            url: 방문할 페이지 URL (픽스처 키)
+            api_path: 기다릴 API 경로 (예: '/api/complexes')
+            page: 목록 페이지 번호
+            more_selector: 다음 페이지를 불러오기 위해 스크롤할 목록 요소의 CSS 선택자
+            label: 대기 종류 (대기 시간 기록용)
+            slot: 사용할 풀 페이지 (없으면 메인 페이지)
+            
+        Returns:
+            JSON 응답 (시간 안에 응답이 없으면 None)
+        """
+        if self.replaying:
+            return self.fixtures.replay_response(url, {'page': page})
+        
+        # 1페이지는 이동하므로 교체할 때가 된 메인 페이지는 응답을 기다리기 전에 바꿈
+        if slot:
+            tab = slot.page
+        else:
+            tab = self._main_page() if page == 1 else self.page
+        
+        started = time.perf_counter()
+        try:
+            with tab.expect_response(self._api_response_matcher(api_path),
+                                     timeout=self.BROWSER_RESPONSE_TIMEOUT_MS) as response_info:
+                if page == 1:
+                    # 응답만 기다리면 되므로 networkidle까지 기다리지 않음
+                    self._goto(url, wait_until='domcontentloaded', slot=slot)
+                else:
+                    self._acquire_token()
+                    tab.evaluate(
+                        "(selector) => document.querySelector(selector)?.lastElementChild?.scrollIntoView()",
+                        more_selector
+                    )
+            data = response_info.value.json()
+        except PlaywrightTimeoutError:
+            self.page_waits.record(label, time.perf_counter() - started, ready=False)
+            logger.warning(f"⚠️  {self.BROWSER_RESPONSE_TIMEOUT_MS / 1000:.0f}초 안에 API 응답 없음: {api_path} (page={page})")
+            return None
+        
+        self.page_waits.record(label, time.perf_counter() - started)
+        return self._accept_api_response(url, page, data)
+    
+    @staticmethod
+    def _api_response_matcher(api_path: str):
+        """api_path로 온 정상(200) 응답인지 확인하는 함수"""
+        def is_api_response(response) -> bool:
+            return urlparse(response.url).path == api_path and response.status == 200
+        return is_api_response
+    
+    def _accept_api_response(self, url: str, page: int, data: Dict) -> Dict:
+        """
+        가로챈 API 응답 하나를 요청으로 집계하고 record 모드면 기록
+        
+        Args:
+            url: 방문한 페이지 URL (픽스처 키)
+            page: 목록 페이지 번호
+            data: JSON 응답
+            
+        Returns:
+            data 그대로
+        """
+        self.request_count += 1
+        self._update_fatigue()
+        
+        if self.fixtures and self.fixtures.recording:
+            self.fixtures.record_response(url, {'page': page}, data)
+        return data
+    
+    def _capture_api_pages(self, url: str, api_path: str, list_key: str,
+                           more_selector: Optional[str] = None, slot: Optional[PooledPage] = None,
+                           first_page: Optional[Dict] = None) -> List[Dict]:
+        """
+        페이지가 불러오는 목록 API 응답을 isMoreData가 false가 될 때까지 모아 반환
+        
+        Args:
+            url: 방문할 페이지 URL
+            api_path: 기다릴 API 경로
+            list_key: 응답에서 목록이 담긴 키
+            more_selector: 다음 페이지를 불러오기 위해 스크롤할 목록 요소 (없으면 1페이지만)
+            slot: 사용할 풀 페이지 (없으면 메인 페이지)
+            first_page: 이미 받은 1페이지 응답 (있으면 방문 없이 2페이지부터 스크롤)
+            
+        Returns:
+            목록 항목 리스트 (API 원본)
+        """
+        items = []
+        for page in range(1, self.MAX_PAGES + 1):
+            if page == 1 and first_page is not None:
+                data = first_page
+            else:
+                data = self._capture_api_response(url, api_path, page, more_selector, label=list_key, slot=slot)
+            if not data or list_key not in data:
+                return items
+            
+            items.extend(data[list_key])
+            if not data[list_key] or not data.get('isMoreData') or not more_selector:
+                return items
+            
+            self._pace(0.2, 0.5, "📜 목록 스크롤...")
+        
+        logger.warning(f"⚠️  최대 페이지 수({self.MAX_PAGES}) 도달, 나머지 페이지 생략: {url}")
+        return items
+    
     def search_complexes_browser(self, cortarNo: str, trade_type: str = "B1") -> List[Dict]:
         """
-        ✅ Playwright로 단지 목록 페이지를 직접 스크래핑 (API 호출 없음!)
+        ✅ Playwright로 단지 목록 페이지를 방문하고, 페이지가 불러오는 단지 목록 API 응답을 그대로 사용
         
         Args:
             cortarNo: 지역 코드
             trade_type: 거래 유형 (A1: 매매, B1: 전세, B2: 월세)
             
         Returns:
-            단지 목록
+            단지 목록 (requests 모드와 같은 complexList 항목)
         """
-        if not self.use_browser or not self.page:
+        if not self.replaying and (not self.use_browser or not self.page):
             logger.warning("⚠️  Playwright가 초기화되지 않았습니다. 빈 목록을 반환합니다.")
             return []
         
         try:
             # 단지 검색 페이지 URL
-            url = f"https://new.land.naver.com/complexes?cortarNo={cortarNo}&tradeType={trade_type}"
+            url = f"{self.BASE_URL}/complexes?cortarNo={cortarNo}&tradeType={trade_type}"
             
             logger.info(f"🌐 Playwright로 단지 목록 페이지 방문: {url}")
-            
-            # 페이지 방문
-            self.page.goto(url, wait_until='networkidle', timeout=30000)
-            
-            # 페이지 로딩 대기 (React 렌더링 완료까지)
-            time.sleep(5)
-            
-            # ✅ 올바른 선택자로 단지 목록 추출!
-            logger.info("📊 단지 데이터 추출 중...")
-            
-            complex_data = self.page.evaluate("""
-                () => {
-                    // 실제 네이버 부동산 클래스 사용!
-                    const items = document.querySelectorAll('.complex_data');
-                    
-                    return Array.from(items).map(item => {
-                        const titleEl = item.querySelector('.complex_title');
-                        const name = titleEl?.textContent?.trim();
-                        
-                        // 링크에서 complexNo 추출
-                        const link = item.querySelector('a') || titleEl?.closest('a');
-                        const complexNo = link?.href?.match(/complexes\\/(\\d+)/)?.[1];
-                        
-                        // 가격 정보
-                        const priceEl = item.querySelector('.complex_price');
-                        const price = priceEl?.textContent?.trim();
-                        
-                        // 크기 정보
-                        const sizeEl = item.querySelector('.complex_size');
-                        const size = sizeEl?.textContent?.trim();
-                        
-                        return {
-                            complexNo: complexNo,
-                            complexName: name,
-                            price: price,
-                            size: size
-                        };
-                    }).filter(item => item.complexNo && item.complexName);
-                }
-            """)
+            complex_data = self._capture_api_pages(url, '/api/complexes', 'complexList')
             
             logger.info(f"✅ Playwright로 {len(complex_data)}개 단지 발견!")
             
             return complex_data
             
+        except DeadlineExceeded:
+            raise
         except Exception as e:
             logger.error(f"❌ Playwright 단지 검색 실패: {e}")
             import traceback
             traceback.print_exc()
             return []
     
-    def search_complexes(self, cortarNo: str, trade_type: str = "A1") -> List[Dict]:
+    def search_complexes(self, cortarNo: str, trade_type: str = "A1", db=None) -> List[Dict]:
         """
-        지역별 단지 검색
+        지역별 단지 검색 (모든 페이지)
         
         Args:
             cortarNo: 지역 코드 (예: 1168010600 - 강남구 대치동)
             trade_type: 거래 유형 (A1: 매매, B1: 전세, B2: 월세, B3: 단기임대)
+            db: 완료된 페이지를 기록/재사용할 PropertyDatabase (선택)
             
         Returns:
             단지 정보 리스트
         """
-        # API 호출 전 랜딩 페이지 먼저 방문 (중요!)
-        self._visit_landing_page('complexes')
+        complexes = list(self.iter_complexes(cortarNo, trade_type, db=db))
+        logger.info(f"검색된 단지 수: {len(complexes)}")
+        return complexes
+    
+    def iter_complexes(self, cortarNo: str, trade_type: str = "A1", db=None) -> Iterator[Dict]:
+        """
+        지역별 단지를 페이지 단위로 가져오며 하나씩 반환하는 제너레이터
         
+        Args:
+            cortarNo: 지역 코드
+            trade_type: 거래 유형
+            db: 완료된 페이지를 기록/재사용할 PropertyDatabase (선택)
+            
+        Yields:
+            단지 정보
+        """
         url = f"{self.BASE_URL}/api/complexes"
+        params = self._complex_search_params(cortarNo, trade_type)
+        checkpoint = self._checkpoint(db, cortarNo, trade_type)
         
-        params = {
+        # API 호출 전 랜딩 페이지 먼저 방문 (중요!) - 저장된 응답을 쓸 때는 생략
+        if not self._load_checkpoint(checkpoint, 1):
+            self._visit_landing_page('complexes')
+        
+        logger.info(f"단지 검색: cortarNo={cortarNo}, tradeType={trade_type}")
+        for complexes in self._iter_pages(url, params, 'complexList', checkpoint):
+            yield from complexes
+    
+    def _checkpoint(self, db, region: str, trade_type: str, complex_no: str = '') -> Optional[tuple]:
+        """
+        작업 항목 키 생성 (db가 없거나 재시작 기능을 끄면 None)
+        
+        Args:
+            db: PropertyDatabase
+            region: 지역 코드
+            trade_type: 거래 유형
+            complex_no: 단지 번호 (단지 목록이면 빈 문자열)
+            
+        Returns:
+            (db, 지역, 거래 유형, 단지 번호) 또는 None
+        """
+        if db is None or not self.frontier_freshness_minutes:
+            return None
+        return (db, region, trade_type, complex_no)
+    
+    def _load_checkpoint(self, checkpoint: Optional[tuple], page: int) -> Optional[Dict]:
+        """
+        최근에 완료된 페이지 결과 가져오기
+        
+        Returns:
+            {'items', 'has_more'} (없으면 None)
+        """
+        if checkpoint is None:
+            return None
+        db, region, trade_type, complex_no = checkpoint
+        return db.get_frontier_page(region, trade_type, complex_no, page, self.frontier_freshness_minutes,
+                                    self.clock.now())
+    
+    def _save_checkpoint(self, checkpoint: Optional[tuple], page: int, state: str,
+                         items: Optional[List[Dict]] = None, has_more: bool = False):
+        """작업 항목(페이지) 상태 저장"""
+        if checkpoint is None:
+            return
+        db, region, trade_type, complex_no = checkpoint
+        db.save_frontier_page(region, trade_type, complex_no, page, state, items, has_more, self.clock.now())
+    
+    def _iter_pages(self, url: str, params: Dict, list_key: str,
+                    checkpoint: Optional[tuple] = None) -> Iterator[List[Dict]]:
+        """
+        목록 API를 isMoreData가 false가 될 때까지 페이지 단위로 요청
+        
+        checkpoint가 있으면 페이지마다 진행 상태를 저장하고,
+        최근에 완료된 페이지는 요청 없이 저장된 결과를 사용합니다 (중단 후 재시작).
+        
+        Args:
+            url: 요청 URL
+            params: 쿼리 파라미터 ('page'는 자동으로 설정)
+            list_key: 응답에서 목록이 담긴 키 ('complexList', 'articleList')
+            checkpoint: 작업 항목 키 (_checkpoint, 선택)
+            
+        Yields:
+            페이지별 목록
+        """
+        for page in range(1, self.MAX_PAGES + 1):
+            saved = self._load_checkpoint(checkpoint, page)
+            
+            if saved is not None:
+                # 저장된 결과는 요청 없이 사용 (요청하지 않았으므로 대기 생략)
+                self.last_response_cached = True
+                items, has_more = saved['items'], saved['has_more']
+            else:
+                self._save_checkpoint(checkpoint, page, 'in_progress')
+                data = self._safe_request(url, dict(params, page=page))
+                
+                if not data or list_key not in data:
+                    self._save_checkpoint(checkpoint, page, 'failed')
+                    logger.warning(f"목록 조회 실패: {url} (page={page})")
+                    return
+                
+                items = data[list_key]
+                has_more = bool(items and data.get('isMoreData'))
+                self._save_checkpoint(checkpoint, page, 'done', items, has_more)
+            
+            yield items
+            
+            if not has_more:
+                return
+        
+        logger.warning(f"⚠️  최대 페이지 수({self.MAX_PAGES}) 도달, 나머지 페이지 생략: {url}")
+    
+    def _complex_search_params(self, cortarNo: str, trade_type: str) -> Dict:
+        """
+        단지 검색 API 쿼리 파라미터 생성
+        
+        Args:
+            cortarNo: 지역 코드
+            trade_type: 거래 유형
+            
+        Returns:
+            쿼리 파라미터
+        """
+        return {
             'cortarNo': cortarNo,
             'realEstateType': 'APT:OPST',  # 아파트, 오피스텔
             'tradeType': trade_type,
@@ -706,98 +1290,269 @@ class NaverRealEstateScraper:
             'sameAddressGroup': 'true',
             'page': 1,
             'complexNo': '',
-            'buildingNo': ''
+            'buildingNo': '',
+            **self._filter_query_params(trade_type)
         }
+    
+    def _cached_complexes(self, cortarNo: str, trade_type: str, db=None) -> Optional[List[Dict]]:
+        """
+        DB에 캐시된 단지 목록 (complex_cache_hours 안에 같은 요청 파라미터로 받은 목록)
         
-        logger.info(f"단지 검색: cortarNo={cortarNo}, tradeType={trade_type}")
-        data = self._safe_request(url, params)
+        Args:
+            cortarNo: 지역 코드
+            trade_type: 거래 유형
+            db: PropertyDatabase (선택)
+            
+        Returns:
+            단지 정보 리스트 (캐시가 없으면 None)
+        """
+        if db is None or not self.complex_cache_hours:
+            return None
+        
+        query = json.dumps(self._complex_search_params(cortarNo, trade_type), sort_keys=True)
+        complexes = db.get_cached_complexes(cortarNo, trade_type, query, self.complex_cache_hours, self.clock.now())
+        if complexes is not None:
+            logger.info(f"🗂️  캐시된 단지 목록 사용: cortarNo={cortarNo}, tradeType={trade_type} ({len(complexes)}개)")
+        return complexes
+    
+    def _cache_complexes(self, cortarNo: str, trade_type: str, complexes: List[Dict], db=None):
+        """
+        받은 단지 목록을 DB에 저장 (빈 목록은 요청 실패일 수 있으므로 저장하지 않음)
+        
+        Args:
+            cortarNo: 지역 코드
+            trade_type: 거래 유형
+            complexes: 단지 정보 리스트
+            db: PropertyDatabase (선택)
+        """
+        if db is None or not complexes:
+            return
+        
+        query = json.dumps(self._complex_search_params(cortarNo, trade_type), sort_keys=True)
+        db.save_complexes(cortarNo, trade_type, query, complexes, self.clock.now())
+    
+    def _filter_query_params(self, trade_type: str) -> Dict:
+        """
+        필터 조건을 서버에 넘길 쿼리 파라미터 (filter_manager가 없으면 빈 딕셔너리)
+        
+        Args:
+            trade_type: 거래 유형
+            
+        Returns:
+            기본 쿼리 파라미터를 덮어쓸 딕셔너리
+        """
+        if self.filter_manager is None:
+            return {}
+        return self.filter_manager.to_query_params(trade_type, self.clock.now().year)
+    
+    def _install_filter_pushdown(self, context):
+        """
+        브라우저 컨텍스트의 목록 API 요청에 필터 쿼리 파라미터를 덧붙이도록 등록
+        
+        브라우저 모드는 페이지가 직접 목록 API를 호출하므로, 요청을 가로채 쿼리를 바꿉니다.
+        리소스 차단보다 나중에 등록해야 먼저 처리됩니다 (목록 API는 차단 대상이 아님).
+        
+        Args:
+            context: playwright BrowserContext
+        """
+        context.route('**/api/**', self._handle_pushdown_route)
+    
+    def _handle_pushdown_route(self, route):
+        """route 핸들러: 목록 API면 필터 파라미터를 덧붙여 진행, 아니면 다음 핸들러(리소스 차단)로 넘김"""
+        url = self._pushdown_url(route.request.url)
+        if url is None:
+            route.fallback()
+        else:
+            route.continue_(url=url)
+    
+    def _pushdown_url(self, url: str) -> Optional[str]:
+        """
+        목록 API 요청 URL에 요청의 tradeType 기준 필터 쿼리 파라미터 적용
+        
+        Args:
+            url: 브라우저 페이지가 보낸 요청 URL
+            
+        Returns:
+            필터 파라미터를 덮어쓴 URL (목록 API가 아니거나 덮어쓸 파라미터가 없으면 None)
+        """
+        parsed = urlparse(url)
+        if parsed.path != '/api/complexes' and not parsed.path.startswith('/api/articles/complex/'):
+            return None
         
-        if data and 'complexList' in data:
-            complexes = data['complexList']
-            logger.info(f"검색된 단지 수: {len(complexes)}")
-            return complexes
+        query = dict(parse_qsl(parsed.query, keep_blank_values=True))
+        filter_params = self._filter_query_params(query.get('tradeType', ''))
+        if not filter_params:
+            return None
         
-        logger.warning("단지 검색 실패")
-        return []
+        query.update({key: str(value) for key, value in filter_params.items()})
+        return urlunparse(parsed._replace(query=urlencode(query)))
     
     def get_complex_articles_browser(self, complex_no: str, trade_type: str = "B1") -> List[Dict]:
         """
-        ✅ Playwright로 단지의 매물 목록을 직접 스크래핑 (API 호출 없음!)
+        ✅ Playwright로 단지 상세 페이지를 방문하고, 페이지가 불러오는 매물 목록 API 응답을 그대로 사용
         
         Args:
             complex_no: 단지 번호
             trade_type: 거래 유형
             
         Returns:
-            매물 목록
+            매물 목록 (requests 모드와 같은 articleList 항목, _parse_article로 가공)
         """
-        if not self.use_browser or not self.page:
+        if not self.replaying and (not self.use_browser or not self.page):
             logger.warning("⚠️  Playwright가 초기화되지 않았습니다. 빈 목록을 반환합니다.")
             return []
         
         try:
             # 단지 상세 페이지 URL
-            url = f"https://new.land.naver.com/complexes/{complex_no}?tradeType={trade_type}"
+            url = f"{self.BASE_URL}/complexes/{complex_no}?tradeType={trade_type}"
             
             logger.info(f"🌐 Playwright로 단지 상세 페이지 방문: {url}")
-            
-            # 페이지 방문
-            self.page.goto(url, wait_until='networkidle', timeout=30000)
-            
-            # React 렌더링 대기
-            time.sleep(5)
-            
-            # ✅ 매물 목록 추출 (실제 구조 기반)
-            logger.info("📊 매물 데이터 추출 중...")
-            
-            article_data = self.page.evaluate("""
-                () => {
-                    // 매물 관련 모든 요소 찾기
-                    const articleElements = document.querySelectorAll('[class*="article"]');
-                    
-                    const articles = [];
-                    articleElements.forEach(el => {
-                        // articleNo 찾기
-                        const link = el.querySelector('a');
-                        const articleNo = link?.href?.match(/articles\\/(\\d+)/)?.[1];
-                        
-                        if (articleNo) {
-                            const priceEl = el.querySelector('[class*="price"]');
-                            const areaEl = el.querySelector('[class*="area"]');
-                            const floorEl = el.querySelector('[class*="floor"]');
-                            
-                            articles.push({
-                                articleNo: articleNo,
-                                price: priceEl?.textContent?.trim() || '',
-                                area: areaEl?.textContent?.trim() || '',
-                                floor: floorEl?.textContent?.trim() || ''
-                            });
-                        }
-                    });
-                    
-                    return articles;
-                }
-            """)
+            article_data = self._capture_api_pages(
+                url, f'/api/articles/complex/{complex_no}', 'articleList',
+                more_selector=self.BROWSER_ARTICLE_LIST_SELECTOR
+            )
             
             logger.info(f"✅ Playwright로 {len(article_data)}개 매물 발견!")
             
             # 매물이 없으면 스크린샷 저장 (디버깅용)
-            if len(article_data) == 0:
+            if len(article_data) == 0 and not self.replaying:
                 screenshot_path = f'debug_complex_{complex_no}.png'
                 self.page.screenshot(path=screenshot_path)
                 logger.warning(f"⚠️  매물이 없습니다. 스크린샷 저장: {screenshot_path}")
             
             return article_data
             
+        except DeadlineExceeded:
+            raise
         except Exception as e:
             logger.error(f"❌ Playwright 매물 검색 실패: {e}")
             import traceback
             traceback.print_exc()
             return []
     
+    def get_complex_articles_browser_many(self, complex_nos: List[str], trade_type: str = "B1") -> Dict[str, List[Dict]]:
+        """
+        여러 단지 상세 페이지를 페이지 풀로 동시에 불러와 매물 목록 반환
+        
+        단지마다 풀 페이지를 하나씩 빌려 RateScheduler 토큰을 받은 뒤 이동만 시작하고(wait_until='commit'),
+        매물 목록 API 응답은 모든 페이지에서 함께 기다립니다. 다음 페이지(isMoreData)는 같은 풀 페이지에서
+        이어서 스크롤합니다. 풀을 쓸 수 없으면 get_complex_articles_browser로 하나씩 불러옵니다.
+        
+        Args:
+            complex_nos: 단지 번호 리스트 (풀 크기를 넘는 단지는 무시)
+            trade_type: 거래 유형
+            
+        Returns:
+            {단지 번호: 매물 목록} (실패한 단지는 빈 목록이거나 빠짐)
+        """
+        pool = self._page_pool()
+        if pool is None or len(complex_nos) <= 1:
+            return {complex_no: self.get_complex_articles_browser(complex_no, trade_type) for complex_no in complex_nos}
+        
+        loads = []
+        results = {}
+        try:
+            # 1. 페이지마다 이동 시작 (요청 속도 제한은 _goto의 토큰으로 그대로 적용)
+            for complex_no in complex_nos[:pool.size]:
+                load = {
+                    'complex_no': complex_no,
+                    'url': f"{self.BASE_URL}/complexes/{complex_no}?tradeType={trade_type}",
+                    'api_path': f'/api/articles/complex/{complex_no}',
+                    'slot': pool.checkout(),
+                    'response': None,
+                    'healthy': True,
+                }
+                load['listener'] = self._response_listener(load)
+                loads.append(load)
+                load['slot'].page.on('response', load['listener'])
+                
+                logger.info(f"🌐 Playwright로 단지 상세 페이지 방문 ({len(loads)}/{min(len(complex_nos), pool.size)}): {load['url']}")
+                load['started'] = time.perf_counter()
+                try:
+                    self._goto(load['url'], wait_until='commit', slot=load['slot'])
+                except DeadlineExceeded:
+                    raise
+                except Exception as e:
+                    logger.error(f"❌ 단지 상세 페이지 이동 실패 ({complex_no}): {e}")
+                    load['healthy'] = False
+            
+            # 2. 모든 페이지의 1페이지 응답 대기 (한 페이지에서 기다리는 동안 다른 페이지의 이벤트도 처리됨)
+            deadline = time.perf_counter() + self.BROWSER_RESPONSE_TIMEOUT_MS / 1000
+            while time.perf_counter() < deadline:
+                waiting = [load for load in loads if load['healthy'] and load['response'] is None]
+                if not waiting:
+                    break
+                waiting[0]['slot'].page.wait_for_timeout(PageWaits.POLL_MS)
+            
+            # 3. 단지별로 나머지 페이지를 이어서 받음
+            for load in loads:
+                results[load['complex_no']] = self._finish_article_load(load)
+        
+        except DeadlineExceeded:
+            raise
+        except Exception as e:
+            logger.error(f"❌ Playwright 동시 매물 검색 실패: {e}")
+            import traceback
+            traceback.print_exc()
+        
+        finally:
+            for load in loads:
+                try:
+                    load['slot'].page.remove_listener('response', load['listener'])
+                except Exception:
+                    load['healthy'] = False
+                pool.checkin(load['slot'], healthy=load['healthy'])
+        
+        return results
+    
+    def _response_listener(self, load: Dict):
+        """풀 페이지의 첫 매물 목록 API 응답을 load['response']에 담는 response 이벤트 핸들러"""
+        is_api_response = self._api_response_matcher(load['api_path'])
+        
+        def on_response(response):
+            if load['response'] is None and is_api_response(response):
+                load['response'] = response
+                load['waited'] = time.perf_counter() - load['started']
+        return on_response
+    
+    def _finish_article_load(self, load: Dict) -> List[Dict]:
+        """
+        동시 로딩한 단지 하나의 1페이지 응답을 받아 나머지 페이지까지 모음
+        
+        Args:
+            load: get_complex_articles_browser_many의 로딩 상태
+            
+        Returns:
+            매물 목록 (응답이 없거나 실패하면 빈 목록)
+        """
+        if not load['healthy']:
+            return []
+        
+        if load['response'] is None:
+            self.page_waits.record('articleList', time.perf_counter() - load['started'], ready=False)
+            logger.warning(f"⚠️  {self.BROWSER_RESPONSE_TIMEOUT_MS / 1000:.0f}초 안에 API 응답 없음: {load['api_path']} (page=1)")
+            return []
+        self.page_waits.record('articleList', load['waited'])
+        
+        try:
+            first_page = self._accept_api_response(load['url'], 1, load['response'].json())
+            article_data = self._capture_api_pages(
+                load['url'], load['api_path'], 'articleList',
+                more_selector=self.BROWSER_ARTICLE_LIST_SELECTOR, slot=load['slot'], first_page=first_page
+            )
+        except DeadlineExceeded:
+            raise
+        except Exception as e:
+            logger.error(f"❌ Playwright 매물 검색 실패 ({load['complex_no']}): {e}")
+            load['healthy'] = False
+            return []
+        
+        logger.info(f"✅ Playwright로 {len(article_data)}개 매물 발견! ({load['complex_no']})")
+        return article_data
+    
     def get_complex_articles(self, complex_no: str, trade_type: str = "A1") -> List[Dict]:
         """
-        특정 단지의 매물 목록 가져오기
+        특정 단지의 매물 목록 가져오기 (모든 페이지)
         
         Args:
             complex_no: 단지 번호
@@ -806,12 +1561,64 @@ class NaverRealEstateScraper:
         Returns:
             매물 정보 리스트
         """
-        # API 호출 전 랜딩 페이지 먼저 방문 (중요!)
-        self._visit_landing_page('complex')
+        return list(self.iter_complex_articles(complex_no, trade_type))
+    
+    def iter_complex_articles(self, complex_no: str, trade_type: str = "A1", db=None,
+                              cortarNo: str = '') -> Iterator[Dict]:
+        """
+        특정 단지의 매물을 페이지 단위로 가져오며 하나씩 반환하는 제너레이터
+        
+        db를 넘기면 한 페이지의 매물이 모두 이전 크롤링에서 받은 매물(seen_articles, 필터에서 걸러진 매물 포함)일 때
+        다음 페이지를 요청하지 않고,
+        페이지마다 진행 상태를 저장합니다 (중단 후 재시작 시 완료된 페이지는 요청 생략).
+        (매물은 최신순으로 요청하므로 이후 페이지는 더 오래된 매물)
         
+        Args:
+            complex_no: 단지 번호
+            trade_type: 거래 유형
+            db: 조기 종료 판단/진행 상태 저장에 사용할 PropertyDatabase (선택)
+            cortarNo: 작업 항목 키에 쓸 지역 코드 (선택)
+            
+        Yields:
+            매물 정보 (API 원본)
+        """
         url = f"{self.BASE_URL}/api/articles/complex/{complex_no}"
+        params = self._article_list_params(trade_type)
+        checkpoint = self._checkpoint(db, cortarNo, trade_type, complex_no)
+        
+        # API 호출 전 랜딩 페이지 먼저 방문 (중요!) - 저장된 결과를 쓸 때는 생략
+        if not self._load_checkpoint(checkpoint, 1):
+            self._visit_landing_page('complex')
         
-        params = {
+        logger.info(f"매물 검색: complexNo={complex_no}")
+        for page, articles in enumerate(self._iter_pages(url, params, 'articleList', checkpoint), 1):
+            logger.info(f"검색된 매물 수: {len(articles)} (page {page})")
+            
+            if not self.last_response_cached:
+                self._pace(1.0, 2.5, "🕒 매물 목록 확인 중...")
+            
+            all_known = False
+            if db is not None and articles:
+                page_ids = [f"{complex_no}_{article.get('articleNo', '')}" for article in articles]
+                all_known = len(db.filter_seen_ids(page_ids)) == len(set(page_ids))
+            
+            yield from articles
+            
+            if all_known:
+                logger.info(f"⏹️  page {page}의 매물이 모두 기존 매물 → 이후 페이지 생략 (complexNo={complex_no})")
+                return
+    
+    def _article_list_params(self, trade_type: str) -> Dict:
+        """
+        단지 매물 목록 API 쿼리 파라미터 생성
+        
+        Args:
+            trade_type: 거래 유형
+            
+        Returns:
+            쿼리 파라미터
+        """
+        return {
             'realEstateType': 'APT:OPST',
             'tradeType': trade_type,
             'tag': '::::::::',
@@ -829,26 +1636,10 @@ class NaverRealEstateScraper:
             'sameAddressGroup': 'false',
             'minMoveInMonth': '',
             'maxMoveInMonth': '',
-            'page': 1
+            'order': 'dateDesc',  # 최신순 (페이지 조기 종료 판단 기준)
+            'page': 1,
+            **self._filter_query_params(trade_type)
         }
-        
-        logger.info(f"매물 검색: complexNo={complex_no}")
-        data = self._safe_request(url, params)
-        
-        if data and 'articleList' in data:
-            articles = data['articleList']
-            logger.info(f"검색된 매물 수: {len(articles)}")
-            
-            # ✅ 개선: 2배 빠른 대기 시간 (2-5분 → 1-2.5분)
-            delay = self._human_like_delay(1.0, 2.5)  # 1-2.5분 (2배 빠름!)
-            delay_minutes = delay / 60
-            logger.info(f"🕒 매물 목록 확인 중... {delay_minutes:.1f}분 ({delay:.0f}초)")
-            time.sleep(delay)
-            
-            return articles
-        
-        logger.warning(f"매물 검색 실패: complexNo={complex_no}")
-        return []
     
     def get_article_detail(self, article_no: str) -> Optional[Dict]:
         """
@@ -865,89 +1656,418 @@ class NaverRealEstateScraper:
         logger.info(f"매물 상세 정보: articleNo={article_no}")
         data = self._safe_request(url)
         
-        # ✅ 개선: 2배 빠른 대기 시간 (1-3분 → 0.5-1.5분)
-        delay = self._human_like_delay(0.5, 1.5)  # 0.5-1.5분 (2배 빠름!)
-        delay_minutes = delay / 60
-        logger.info(f"📄 상세 정보 읽는 중... {delay_minutes:.1f}분 ({delay:.0f}초)")
-        time.sleep(delay)
+        if not self.last_response_cached:
+            self._pace(0.5, 1.5, "📄 상세 정보 읽는 중...")
         
         return data
     
-    def scrape_region(self, cortarNo: str, trade_types: List[str] = ["A1"]) -> List[Dict]:
+    def _complex_counts(self, complex_info: Dict) -> Optional[Dict]:
+        """
+        complexList 항목에서 거래 유형별 매물 수 추출
+        
+        Args:
+            complex_info: 단지 정보
+            
+        Returns:
+            매물 수 딕셔너리 (브라우저 모드처럼 정보가 없으면 None)
+        """
+        if not any(field in complex_info for field in self.COMPLEX_COUNT_FIELDS.values()):
+            return None
+        
+        return {
+            key: int(complex_info.get(field) or 0)
+            for key, field in self.COMPLEX_COUNT_FIELDS.items()
+        }
+    
+    def _trade_type_groups(self, trade_types: List[str]) -> List[str]:
+        """
+        한 번에 요청할 거래 유형 묶음
+        
+        combine_trade_types가 켜져 있으면 모든 거래 유형을 ':'로 이어 하나로 요청합니다
+        (realEstateType='APT:OPST'와 같은 방식, 단지/매물 목록 요청 수가 거래 유형 수만큼 줄어듦).
+        
+        Args:
+            trade_types: 거래 유형 리스트
+            
+        Returns:
+            요청 단위 거래 유형 리스트 (예: ['B1:B2'])
+        """
+        if self.combine_trade_types and len(trade_types) > 1:
+            return [':'.join(trade_types)]
+        return list(trade_types)
+    
+    def _listed_count(self, counts: Dict[str, int], trade_type: str) -> int:
+        """
+        단지 목록의 매물 수 중 거래 유형(묶음)에 해당하는 매물 수
+        
+        Args:
+            counts: _complex_counts 결과
+            trade_type: 거래 유형 (예: 'B1', 'B1:B2')
+            
+        Returns:
+            매물 수 (거래 유형에 맞는 항목이 없으면 전체 합계)
+        """
+        keys = [self.TRADE_TYPE_COUNT_KEYS[t] for t in trade_type.split(':') if t in self.TRADE_TYPE_COUNT_KEYS]
+        return sum(counts.get(key, 0) for key in keys) if keys else sum(counts.values())
+    
+    def _should_crawl_complex(self, complex_info: Dict, trade_type: str, db=None) -> bool:
+        """
+        단지의 매물 목록을 다시 가져와야 하는지 판단
+        
+        마지막 스냅샷과 비교해 해당 거래 유형의 매물 수가 바뀌었으면 바로 크롤링하고,
+        그대로면 재크롤링 일정(RecrawlScheduler)의 다음 크롤링 시각이 지났을 때만 크롤링합니다.
+        일정이 없으면 SNAPSHOT_MAX_AGE_HOURS 안에 확인한 단지는 건너뜁니다.
+        브라우저 모드처럼 매물 수를 모르면 일정만으로 판단합니다.
+        거래 유형 묶음('B1:B2')은 하나라도 크롤링이 필요하면 크롤링합니다.
+        
+        Args:
+            complex_info: 단지 정보
+            trade_type: 거래 유형
+            db: PropertyDatabase (없으면 항상 크롤링)
+            
+        Returns:
+            크롤링 필요 여부
+        """
+        if db is None:
+            return True
+        
+        if ':' in trade_type:
+            return any(self._should_crawl_complex(complex_info, t, db) for t in trade_type.split(':') if t)
+        
+        complex_no = complex_info.get('complexNo')
+        counts = self._complex_counts(complex_info)
+        snapshot = db.get_complex_snapshot(complex_no, trade_type) if counts is not None else None
+        
+        if snapshot is not None:
+            count_key = self.TRADE_TYPE_COUNT_KEYS.get(trade_type)
+            compare_keys = [count_key] if count_key else list(counts)
+            if any(snapshot[key] != counts[key] for key in compare_keys):
+                return True
+        
+        schedule = db.get_crawl_schedule(complex_no, trade_type) if self.adaptive_recrawl else None
+        if schedule and schedule['next_crawl_at']:
+            return self.clock.now() >= datetime.fromisoformat(schedule['next_crawl_at'])
+        
+        if snapshot is None:
+            return True
+        
+        checked_at = datetime.fromisoformat(snapshot['checked_at'])
+        return self.clock.now() - checked_at > timedelta(hours=self.SNAPSHOT_MAX_AGE_HOURS)
+    
+    def _needs_crawl(self, complex_info: Dict, trade_type: str, db=None, cortarNo: str = '') -> bool:
+        """
+        단지에 요청이 필요한지 (크롤링할 때가 되었거나, 중단된 실행이 저장한 결과가 있어 이어서 진행)
+        
+        Args:
+            complex_info: 단지 정보
+            trade_type: 거래 유형
+            db: PropertyDatabase (선택)
+            cortarNo: 작업 항목 키에 쓸 지역 코드 (선택)
+            
+        Returns:
+            크롤링 필요 여부
+        """
+        if self._should_crawl_complex(complex_info, trade_type, db):
+            return True
+        checkpoint = self._checkpoint(db, cortarNo, trade_type, complex_info.get('complexNo'))
+        return self._load_checkpoint(checkpoint, 1) is not None
+    
+    def _expected_new_articles(self, complex_info: Dict, trade_type: str, db=None) -> int:
+        """
+        단지를 크롤링했을 때 기대되는 신규/변경 매물 수 (시간 제한 모드의 우선순위)
+        
+        처음 보는 단지는 해당 거래 유형의 매물 수 전체, 스냅샷이 있으면 매물 수 변화량입니다.
+        거래 유형 묶음('B1:B2')은 거래 유형별 기대값의 합입니다.
+        
+        Args:
+            complex_info: 단지 정보
+            trade_type: 거래 유형
+            db: PropertyDatabase (선택)
+            
+        Returns:
+            기대 매물 수
+        """
+        if ':' in trade_type:
+            return sum(self._expected_new_articles(complex_info, t, db) for t in trade_type.split(':') if t)
+        
+        counts = self._complex_counts(complex_info)
+        if counts is None:
+            return 0
+        
+        count_key = self.TRADE_TYPE_COUNT_KEYS.get(trade_type)
+        keys = [count_key] if count_key else list(counts)
+        
+        snapshot = db.get_complex_snapshot(complex_info.get('complexNo'), trade_type) if db is not None else None
+        if snapshot is None:
+            return sum(counts[key] for key in keys)
+        return sum(abs(counts[key] - snapshot[key]) for key in keys)
+    
+    def _plan_complexes(self, complexes: List[Dict], trade_type: str, db=None, cortarNo: str = '') -> List[Dict]:
+        """
+        단지 크롤링 순서 결정
+        
+        우선순위 계산기(prioritizer)가 있으면 필터를 통과할 수 없는 단지를 빼고 알림 가능성이 큰 단지부터,
+        없으면 사람처럼 무작위 순서로 크롤링합니다. 실행 시간 제한만 있으면
+        시간 안에 가장 많은 신규 매물을 얻도록 기대 매물 수가 큰 단지부터 크롤링합니다.
+        중단된 실행이 저장한 결과가 있는 단지는 맨 앞에 둡니다 (요청 없이 이어서 진행).
+        
+        Args:
+            complexes: 단지 리스트
+            trade_type: 거래 유형
+            db: PropertyDatabase (선택)
+            cortarNo: 작업 항목 키에 쓸 지역 코드 (선택)
+            
+        Returns:
+            순서가 정해진 단지 리스트
+        """
+        planned = list(complexes)
+        random.shuffle(planned)
+        
+        if self.prioritizer is not None:
+            compatible = []
+            for complex_info in planned:
+                reason = self.prioritizer.incompatibility(complex_info, trade_type)
+                if reason:
+                    logger.debug(f"🚫 필터 조건 불일치로 제외: {complex_info.get('complexName', '알 수 없음')} ({reason})")
+                else:
+                    compatible.append(complex_info)
+            if len(compatible) < len(planned):
+                logger.info(f"🚫 필터 조건을 만족할 수 없는 단지 {len(planned) - len(compatible)}개 요청 없이 제외")
+            planned = compatible
+            
+            # 안정 정렬이므로 점수가 같은 단지끼리는 무작위 순서 유지
+            now = self.clock.now()
+            
+            def priority(complex_info: Dict) -> float:
+                listed = self._listed_count(self._complex_counts(complex_info) or {}, trade_type)
+                expected_new = self._expected_new_articles(complex_info, trade_type, db)
+                return self.prioritizer.score(complex_info, trade_type, expected_new, listed, now)
+            
+            planned.sort(key=priority, reverse=True)
+            logger.info(f"🎯 알림 가능성 순으로 단지 정렬 (총 {len(planned)}개)")
+        elif self.deadline is not None:
+            # 안정 정렬이므로 기대값이 같은 단지끼리는 무작위 순서 유지
+            planned.sort(key=lambda c: self._expected_new_articles(c, trade_type, db), reverse=True)
+            logger.info(f"🎯 기대 신규 매물 순으로 단지 정렬 (총 {len(planned)}개)")
+        elif planned:
+            logger.info(f"🔀 단지 순서 무작위화 완료 (총 {len(planned)}개)")
+        
+        if self._checkpoint(db, cortarNo, trade_type) is not None:
+            planned.sort(key=lambda c: self._load_checkpoint(
+                self._checkpoint(db, cortarNo, trade_type, c.get('complexNo')), 1) is None)
+        
+        return planned
+    
+    def _record_complex_snapshots(self, complex_info: Dict, trade_type: str, properties: List[Dict], db=None):
+        """
+        크롤링한 단지의 스냅샷을 거래 유형별로 저장 (묶음 요청은 매물의 거래 유형으로 나눠 기록)
+        
+        받은 매물 ID도 모두 기록해 다음 크롤링에서 기존 매물만 있는 페이지를 알아봅니다 (조기 종료).
+        
+        Args:
+            complex_info: 단지 정보
+            trade_type: 요청한 거래 유형 (예: 'B1', 'B1:B2')
+            properties: 파싱된 매물 리스트
+            db: PropertyDatabase (없으면 저장하지 않음)
+        """
+        if db is not None:
+            db.mark_articles_seen(complex_info.get('complexNo'), [p['id'] for p in properties], self.clock.now())
+        
+        for single_type in trade_type.split(':'):
+            article_nos = [str(p['article_no']) for p in properties if p['trade_type'] == single_type]
+            self._record_complex_snapshot(complex_info, single_type, article_nos, db)
+    
+    def _record_complex_snapshot(self, complex_info: Dict, trade_type: str, article_nos: List[str], db=None):
+        """
+        크롤링한 단지의 매물 수와 크롤링 시각 저장
+        
+        Args:
+            complex_info: 단지 정보
+            trade_type: 거래 유형
+            article_nos: 이번에 확인한 매물 번호 리스트
+            db: PropertyDatabase (없으면 저장하지 않음)
+        """
+        if db is None:
+            return
+        
+        complex_no = complex_info.get('complexNo')
+        counts = self._complex_counts(complex_info)
+        
+        # 매물이 있어야 하는데 하나도 못 받았으면 요청 실패로 보고 저장하지 않음 (다음 실행에서 재확인)
+        # 필터 조건을 서버에 넘겼으면 조건에 맞는 매물이 없어 빈 목록일 수 있으므로 그대로 기록
+        if counts is not None and not article_nos and sum(counts.values()) > 0 and \
+                not self._filter_query_params(trade_type):
+            return
+        
+        # 재크롤링 일정의 기준 시각 (매물 수를 모르는 브라우저 모드도 기록)
+        db.mark_complex_crawled(complex_no, trade_type, self.clock.now())
+        
+        if counts is None:
+            return
+        
+        db.save_complex_snapshot(complex_no, trade_type, counts, self.clock.now())
+    
+    def scrape_region(self, cortarNo: str, trade_types: List[str] = ["A1"], db=None) -> List[Dict]:
         """
         특정 지역의 모든 매물 크롤링
         
         Args:
             cortarNo: 지역 코드
             trade_types: 거래 유형 리스트
+            db: 페이지 조기 종료 및 변경 없는 단지 건너뛰기에 사용할 PropertyDatabase (선택)
             
         Returns:
             모든 매물 정보 리스트
         """
         all_properties = []
+        for properties in self.iter_region(cortarNo, trade_types, db=db):
+            all_properties.extend(properties)
+        return all_properties
+    
+    def _prefetch_complex_articles(self, complexes: List[Dict], trade_type: str, db=None, cortarNo: str = '',
+                                   limit: Optional[int] = None) -> Dict[str, List[Dict]]:
+        """
+        첫 단지와 그 뒤로 크롤링할 단지들을 페이지 풀 크기만큼 묶어 동시에 불러옴 (브라우저 모드)
         
-        for idx, trade_type in enumerate(trade_types):
-            logger.info(f"=== 거래 유형 {trade_type} 크롤링 시작 ===")
-            logger.info(f"📊 진행 상황: {idx + 1}/{len(trade_types)}, 총 요청: {self.request_count}회, 피로도: {self.fatigue_level:.2f}")
-            
-            # ✅ 개선: 2배 빠른 거래 전환 휴식 (30-60분 → 15-30분)
-            if idx > 0:
-                long_delay = self._human_like_delay(15.0, 30.0)  # 15-30분 (2배 빠름!)
-                long_delay_minutes = long_delay / 60
-                logger.info(f"🔄 거래 유형 전환 휴식: {long_delay_minutes:.1f}분 ({long_delay:.0f}초)")
-                time.sleep(long_delay)
-            
-            # ✅ 1. Playwright로 단지 목록 가져오기 (API 호출 없음!)
-            if self.use_browser:
-                logger.info("✅ Playwright 브라우저 자동화 모드!")
-                complexes = self.search_complexes_browser(cortarNo, trade_type)
-            else:
-                logger.info("⚠️  requests 모드 (차단 가능성 높음)")
-                complexes = self.search_complexes(cortarNo, trade_type)
-            
-            # 순서 무작위화 (Shuffle) - 사람처럼 불규칙하게!
-            if complexes:
-                random.shuffle(complexes)
-                logger.info(f"🔀 단지 순서 무작위화 완료 (총 {len(complexes)}개)")
-            
-            # 2. 각 단지의 매물 가져오기
-            for i, complex_info in enumerate(complexes[:10], 1):  # 테스트: 상위 10개만
-                complex_no = complex_info.get('complexNo')
-                complex_name = complex_info.get('complexName', '알 수 없음')
-                
-                logger.info(f"[{i}/{len(complexes[:10])}] {complex_name} (complexNo: {complex_no})")
-                
-                # ✅ Playwright로 매물 가져오기 (API 호출 없음!)
-                if self.use_browser:
-                    articles = self.get_complex_articles_browser(complex_no, trade_type)
-                else:
-                    articles = self.get_complex_articles(complex_no, trade_type)
+        Args:
+            complexes: 첫 단지(크롤링 확정)부터 남은 단지 목록 (크롤링 순서)
+            trade_type: 거래 유형
+            db: 건너뛸 단지 판단에 사용할 PropertyDatabase (선택)
+            cortarNo: 지역 코드 (선택)
+            limit: 남은 단지 수 제한 (없으면 풀 크기만)
+            
+        Returns:
+            {단지 번호: 매물 목록}
+        """
+        batch_size = self.browser_pages if self._page_pool() else 1
+        if limit:
+            batch_size = min(batch_size, limit)
+        
+        complex_nos = [complexes[0].get('complexNo')]
+        for complex_info in complexes[1:]:
+            if len(complex_nos) >= batch_size:
+                break
+            if self._needs_crawl(complex_info, trade_type, db, cortarNo):
+                complex_nos.append(complex_info.get('complexNo'))
+        
+        return self.get_complex_articles_browser_many(complex_nos, trade_type)
+    
+    def iter_region(self, cortarNo: str, trade_types: List[str] = ["A1"], db=None) -> Iterator[List[Dict]]:
+        """
+        특정 지역의 매물을 단지 하나가 끝날 때마다 반환하는 제너레이터
+        
+        지역 전체가 끝나기를 기다리지 않고 단지별로 필터/저장/알림을 진행할 수 있습니다.
+        
+        Args:
+            cortarNo: 지역 코드
+            trade_types: 거래 유형 리스트 (combine_trade_types면 한 번에 요청)
+            db: 페이지 조기 종료 및 변경 없는 단지 건너뛰기에 사용할 PropertyDatabase (선택)
+            
+        Yields:
+            단지 하나의 매물 정보 리스트
+        """
+        total_properties = 0
+        skipped_complexes = 0
+        complex_properties = []  # 진행 중인 단지의 매물 (시간 제한으로 중단되면 여기까지 반환)
+        
+        trade_types = self._trade_type_groups(trade_types)
+        
+        try:
+            for idx, trade_type in enumerate(trade_types):
+                logger.info(f"=== 거래 유형 {trade_type} 크롤링 시작 ===")
+                logger.info(f"📊 진행 상황: {idx + 1}/{len(trade_types)}, 총 요청: {self.request_count}회, 피로도: {self.fatigue_level:.2f}")
                 
-                # 매물 순서도 무작위화 (Shuffle)
-                if articles:
-                    random.shuffle(articles)
-                    logger.info(f"🔀 매물 순서 무작위화 완료 (총 {len(articles)}개)")
+                # 거래 유형 전환 휴식 (human 모드: 15-30분)
+                if idx > 0:
+                    self._pace(15.0, 30.0, "🔄 거래 유형 전환 휴식:")
                 
-                for article in articles:
-                    # 매물 데이터 가공
-                    property_data = self._parse_article(article, complex_info, trade_type)
-                    all_properties.append(property_data)
+                # ✅ 1. Playwright로 단지 목록 가져오기 (API 호출 없음!) - 캐시가 있으면 요청 생략
+                complexes = self._cached_complexes(cortarNo, trade_type, db)
+                if complexes is None:
+                    if self.use_browser:
+                        logger.info("✅ Playwright 브라우저 자동화 모드!")
+                        complexes = self.search_complexes_browser(cortarNo, trade_type)
+                    else:
+                        logger.info("⚠️  requests 모드 (차단 가능성 높음)")
+                        complexes = self.search_complexes(cortarNo, trade_type, db=db)
+                    self._cache_complexes(cortarNo, trade_type, complexes, db)
                 
-                # ✅ 개선: 2배 빠른 단지 이동 (5-10분 → 2.5-5분)
-                delay = self._human_like_delay(2.5, 5.0)  # 2.5-5분 (2배 빠름!)
-                delay_minutes = delay / 60
-                logger.info(f"🏢 다음 단지로 이동... {delay_minutes:.1f}분 ({delay:.0f}초)")
-                time.sleep(delay)
+                # 순서 결정 - 평소에는 사람처럼 무작위, 시간 제한 모드에서는 기대 신규 매물 순
+                complexes = self._plan_complexes(complexes, trade_type, db, cortarNo)
                 
-                # ✅ 개선: 2배 빠른 추가 휴식 (15-30분 → 7.5-15분)
-                if random.random() < 0.2:
-                    long_break_minutes = random.uniform(7.5, 15)
-                    long_break_seconds = long_break_minutes * 60
-                    logger.info(f"💤 추가 장시간 휴식: {long_break_minutes:.1f}분 ({long_break_seconds:.0f}초)")
-                    time.sleep(long_break_seconds)
-        
-        logger.info(f"총 {len(all_properties)}개 매물 크롤링 완료")
-        return all_properties
+                # 2. 각 단지의 매물 가져오기 (우선순위 순으로 최대 max_complexes개)
+                crawled_complexes = 0
+                prefetched: Dict[str, List[Dict]] = {}  # 페이지 풀로 미리 불러온 단지별 매물
+                for i, complex_info in enumerate(complexes, 1):
+                    complex_no = complex_info.get('complexNo')
+                    complex_name = complex_info.get('complexName', '알 수 없음')
+                    
+                    if self.max_complexes and crawled_complexes >= self.max_complexes:
+                        logger.info(f"📦 단지 수 제한 도달 ({self.max_complexes}개) → 나머지 {len(complexes) - i + 1}개는 다음 실행에서 크롤링")
+                        break
+                    
+                    logger.info(f"[{i}/{len(complexes)}] {complex_name} (complexNo: {complex_no})")
+                    
+                    # 매물 수가 지난 실행과 같으면 요청 없이 건너뜀 (중단된 실행이 저장한 결과가 있으면 다시 사용)
+                    if not self._needs_crawl(complex_info, trade_type, db, cortarNo):
+                        logger.info("⏭️  매물 수 변경 없음 → 건너뜀")
+                        skipped_complexes += 1
+                        continue
+                    crawled_complexes += 1
+                    
+                    # ✅ Playwright로 매물 가져오기 (API 호출 없음!)
+                    if self.use_browser:
+                        if complex_no not in prefetched:
+                            remaining = self.max_complexes - crawled_complexes + 1 if self.max_complexes else None
+                            prefetched = self._prefetch_complex_articles(complexes[i - 1:], trade_type, db, cortarNo, remaining)
+                        articles = prefetched.pop(complex_no, [])
+                        
+                        # 매물 순서도 무작위화 (Shuffle)
+                        if articles:
+                            random.shuffle(articles)
+                            logger.info(f"🔀 매물 순서 무작위화 완료 (총 {len(articles)}개)")
+                    else:
+                        # requests 모드: 페이지 단위로 받아 바로 가공 (전체 목록을 메모리에 모으지 않음)
+                        articles = self.iter_complex_articles(complex_no, trade_type, db=db, cortarNo=cortarNo)
+                    
+                    complex_properties = []
+                    for article in articles:
+                        # 매물 데이터 가공
+                        complex_properties.append(self._parse_article(article, complex_info, trade_type))
+                    
+                    self._record_complex_snapshots(complex_info, trade_type, complex_properties, db)
+                    
+                    # 단지가 끝날 때마다 바로 반환 (스트리밍)
+                    total_properties += len(complex_properties)
+                    batch, complex_properties = complex_properties, []
+                    yield batch
+                    
+                    # 단지 이동 (human 모드: 2.5-5분)
+                    self._pace(2.5, 5.0, "🏢 다음 단지로 이동...")
+                    
+                    # 추가 장시간 휴식 (human 모드: 20% 확률로 7.5-15분)
+                    if self.pacing_mode == 'human' and random.random() < 0.2:
+                        long_break_minutes = random.uniform(7.5, 15)
+                        long_break_seconds = long_break_minutes * 60
+                        logger.info(f"💤 추가 장시간 휴식: {long_break_minutes:.1f}분 ({long_break_seconds:.0f}초)")
+                        self._sleep(long_break_seconds)
+        
+        except DeadlineExceeded as e:
+            # 시간 제한: 그때까지 모은 매물만 반환 (중단된 단지는 스냅샷을 남기지 않아 다음 실행에서 다시 크롤링)
+            logger.warning(f"⏰ 실행 시간 제한으로 크롤링 중단: {e}")
+            if complex_properties:
+                total_properties += len(complex_properties)
+                yield complex_properties
+        
+        logger.info(f"총 {total_properties}개 매물 크롤링 완료 (변경 없어 건너뛴 단지: {skipped_complexes}개)")
+        logger.info(f"⏱️  요청 속도 통계: {self.rate_scheduler.get_stats()}")
+        if self.use_browser:
+            logger.info(f"🧱 리소스 차단 통계: {self.resource_blocker.get_stats()}")
+            logger.info(f"⏳ 페이지 대기 통계: {self.page_waits.get_stats()}")
+            if self.page_pool:
+                logger.info(f"🗂️  브라우저 페이지 풀 통계: {self.page_pool.get_stats()}")
+        if self.simulating:
+            logger.info(f"🕰️  가상 시계 통계: {self.clock.get_stats()}")
     
     def _parse_article(self, article: Dict, complex_info: Dict, trade_type: str) -> Dict:
         """
@@ -964,6 +2084,10 @@ class NaverRealEstateScraper:
         article_no = article.get('articleNo', '')
         complex_no = complex_info.get('complexNo', '')
         
+        # 거래 유형 묶음으로 요청했으면 매물마다 실제 거래 유형으로 나눔
+        if ':' in trade_type:
+            trade_type = article.get('tradeTypeCode') or trade_type
+        
         return {
             'id': f"{complex_no}_{article_no}",
             'complex_no': complex_no,
@@ -986,8 +2110,24 @@ class NaverRealEstateScraper:
         }
 
 
-    def __del__(self):
-        """소멸자: Playwright 종료"""
+    def close(self):
+        """
+        Playwright 종료 (브라우저를 연 스레드에서 호출)
+        
+        Playwright 동기 API는 스레드를 넘나들 수 없으므로, 지역별 작업 스레드가 만든 크롤러는
+        소멸자에 맡기지 않고 작업이 끝난 스레드에서 바로 닫습니다.
+        """
+        # 다음 실행에서 메인 페이지 방문 없이 재사용하도록 마지막 쿠키 저장 (소멸자에서 다시 불려도 한 번만)
+        try:
+            self._save_session()
+        except Exception as e:
+            logger.warning(f"⚠️  세션 저장 실패: {e}")
+        self.session_store = None
+        
+        if self.page_pool:
+            self.page_pool.close()
+            self.page_pool = None
+        
         if self.page:
             try:
                 self.page.close()
@@ -1012,6 +2152,15 @@ class NaverRealEstateScraper:
                 self.playwright.stop()
             except:
                 pass
+        
+        self.page = None
+        self.context = None
+        self.browser = None
+        self.playwright = None
+    
+    def __del__(self):
+        """소멸자: Playwright 종료"""
+        self.close()
 
 
 if __name__ == "__main__":
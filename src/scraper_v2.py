@@ -9,14 +9,24 @@ import random
 from typing import List, Dict, Optional
 from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeout
 
+from resource_blocker import ResourceBlocker
+from page_waits import PageWaits
+
 logger = logging.getLogger(__name__)
 
 
 class NaverRealEstateScraperV2:
     """네이버 부동산 크롤러 V2 - 완전한 브라우저 자동화"""
     
-    def __init__(self):
-        """크롤러 초기화"""
+    def __init__(self, resource_blocker: Optional[ResourceBlocker] = None):
+        """
+        크롤러 초기화
+        
+        Args:
+            resource_blocker: 리소스 차단 정책 (없으면 기본 정책: 이미지/미디어/폰트/지도 타일/트래커 차단)
+        """
+        self.resource_blocker = resource_blocker or ResourceBlocker()
+        self.page_waits = PageWaits()
         self.playwright = None
         self.browser = None
         self.context = None
@@ -36,12 +46,21 @@ class NaverRealEstateScraperV2:
             user_agent='Mozilla/5.0 (iPhone; CPU iPhone OS 14_0 like Mac OS X) AppleWebKit/605.1.15',
             locale='ko-KR'
         )
+        self.resource_blocker.install(self.context)
         self.page = self.context.new_page()
         
         logger.info("브라우저 시작 완료!")
     
+    def _goto(self, url: str):
+        """페이지 이동 (로딩 시간은 리소스 차단 통계에 기록, 내용은 호출한 쪽에서 준비 신호로 대기)"""
+        started = time.perf_counter()
+        self.page.goto(url, wait_until='domcontentloaded', timeout=30000)
+        self.resource_blocker.record_page_load(time.perf_counter() - started)
+    
     def stop(self):
         """브라우저 종료"""
+        logger.info(f"리소스 차단 통계: {self.resource_blocker.get_stats()}")
+        logger.info(f"페이지 대기 통계: {self.page_waits.get_stats()}")
         if self.page:
             self.page.close()
         if self.context:
@@ -69,18 +88,17 @@ class NaverRealEstateScraperV2:
             logger.info(f"지역 검색: {region_name}")
             url = f"https://m.land.naver.com/search/result/{region_name}"
             
-            self.page.goto(url, wait_until='networkidle', timeout=30000)
+            self._goto(url)
             
-            # 2. 페이지 로딩 대기
-            time.sleep(3)
-            
-            # 3. 지도 버튼 클릭 (지도 뷰로 전환)
+            # 2. 지도 버튼 클릭 (지도 뷰로 전환, 버튼이 나타날 때까지 자동 대기)
             try:
                 self.page.click('button:has-text("지도")', timeout=5000)
-                time.sleep(2)
             except:
                 logger.warning("지도 버튼을 찾을 수 없습니다.")
             
+            # 3. 매물 목록 요소 수가 안정될 때까지 대기 (고정 대기 대신)
+            self.page_waits.wait_for_selector_count(self.page, '[class*="item"]', 'search_region')
+            
             # 4. 매물 목록 추출
             properties = self.page.evaluate("""
                 () => {
@@ -122,8 +140,8 @@ class NaverRealEstateScraperV2:
             매물 상세 정보
         """
         try:
-            self.page.goto(property_url, wait_until='networkidle', timeout=30000)
-            time.sleep(2)
+            self._goto(property_url)
+            self.page_waits.wait_for_selector_count(self.page, '[class*="price"]', 'property_details')
             
             # 상세 정보 추출
             details = self.page.evaluate("""
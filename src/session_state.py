@@ -0,0 +1,144 @@
+"""
+브라우저 세션 저장 모듈
+쿠키와 localStorage(Playwright storage_state)를 파일에 저장해 다음 실행에서 메인 페이지 방문 없이 재사용
+
+- 저장: 메인 페이지 방문으로 쿠키를 받은 뒤와 크롤러 종료 시 (브라우저 모드는 context.storage_state(),
+  requests 모드는 requests.Session 쿠키를 같은 형식으로 변환)
+- 복원: Playwright 컨텍스트(new_context의 storage_state)와 requests.Session 양쪽에 적용
+- 검증은 크롤러가 가벼운 API 요청으로 수행 (NaverRealEstateScraper._validate_session)
+
+파일은 JSON 하나이며, 여러 작업 스레드가 같은 파일에 저장해도 깨지지 않도록 임시 파일에 쓴 뒤 교체합니다.
+"""
+
+import json
+import os
+import threading
+import time
+import logging
+from typing import Dict, List, Optional
+
+import requests
+
+logger = logging.getLogger(__name__)
+
+
+class SessionStateStore:
+    """브라우저 세션(쿠키 + localStorage) 파일 저장소 클래스"""
+    
+    FORMAT_VERSION = 2  # 2: 프로필 종류 대신 쿠키를 받은 User-Agent를 그대로 저장
+    
+    def __init__(self, path: str):
+        """
+        세션 저장소 초기화
+        
+        Args:
+            path: 세션 파일 경로 (예: data/session_state.json)
+        """
+        self.path = path
+        self._lock = threading.Lock()
+    
+    def load(self) -> Optional[Dict]:
+        """
+        저장된 세션 읽기 (만료된 쿠키는 제외)
+        
+        Returns:
+            {'saved_at': 저장 시각(epoch 초), 'user_agent': 쿠키를 받은 User-Agent (예전 형식이면 None),
+             'storage_state': Playwright storage_state} (파일이 없거나 읽을 수 없으면 None)
+        """
+        if not os.path.exists(self.path):
+            return None
+        
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                saved = json.load(f)
+            storage_state = saved['storage_state']
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(f"⚠️  세션 파일을 읽을 수 없습니다 ({self.path}): {e}")
+            return None
+        
+        now = time.time()
+        storage_state['cookies'] = [
+            cookie for cookie in storage_state.get('cookies', [])
+            if cookie.get('expires', -1) <= 0 or cookie['expires'] > now
+        ]
+        storage_state.setdefault('origins', [])
+        
+        return {
+            'saved_at': saved.get('saved_at', 0),
+            'user_agent': saved.get('user_agent'),
+            'storage_state': storage_state,
+        }
+    
+    def save(self, storage_state: Dict, user_agent: str):
+        """
+        세션 저장 (임시 파일에 쓴 뒤 교체)
+        
+        Args:
+            storage_state: Playwright storage_state ({'cookies': [...], 'origins': [...]})
+            user_agent: 쿠키를 받은 User-Agent (다음 실행에서 같은 브라우저 프로필을 찾는 데 사용)
+        """
+        if os.path.dirname(self.path):
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        
+        saved = {
+            'version': self.FORMAT_VERSION,
+            'saved_at': time.time(),
+            'user_agent': user_agent,
+            'storage_state': storage_state,
+        }
+        
+        with self._lock:
+            tmp_path = f"{self.path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(saved, f, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+        
+        logger.info(f"🍪 세션 저장: 쿠키 {len(storage_state.get('cookies', []))}개 ({self.path})")
+    
+    @staticmethod
+    def cookies_from_session(session: requests.Session, default_domain: str) -> List[Dict]:
+        """
+        requests.Session 쿠키를 Playwright 쿠키 형식으로 변환
+        
+        Args:
+            session: requests 세션
+            default_domain: 도메인 없이 설정된 쿠키에 쓸 도메인 (접속 서버 호스트)
+        
+        Returns:
+            Playwright 쿠키 리스트
+        """
+        return [
+            {
+                'name': cookie.name,
+                'value': cookie.value,
+                'domain': cookie.domain or default_domain,
+                'path': cookie.path or '/',
+                'expires': cookie.expires if cookie.expires else -1,
+                'httpOnly': False,
+                'secure': bool(cookie.secure),
+                'sameSite': 'Lax',
+            }
+            for cookie in session.cookies
+        ]
+    
+    @staticmethod
+    def apply_to_session(storage_state: Dict, session: requests.Session) -> int:
+        """
+        저장된 쿠키를 requests.Session에 설정
+        
+        Args:
+            storage_state: Playwright storage_state
+            session: requests 세션
+        
+        Returns:
+            설정한 쿠키 수
+        """
+        cookies = storage_state.get('cookies', [])
+        for cookie in cookies:
+            session.cookies.set(
+                cookie['name'], cookie['value'],
+                domain=cookie.get('domain', ''), path=cookie.get('path', '/'),
+                expires=int(cookie['expires']) if cookie.get('expires', -1) > 0 else None,
+                secure=cookie.get('secure', False)
+            )
+        return len(cookies)
@@ -223,6 +223,818 @@ def test_scraper_basic():
         test_results.append(("Scraper initialization", False, str(e)))
 
 
+def test_rate_scheduler():
+    """요청 속도 조절기 테스트"""
+    print("\n" + "="*60)
+    print("6. 요청 속도 조절기 테스트")
+    print("="*60)
+    
+    try:
+        from rate_scheduler import RateScheduler
+        
+        scheduler = RateScheduler(requests_per_minute=60, max_requests_per_minute=60, jitter=0)
+        waits = [round(scheduler.reserve(), 1) for _ in range(3)]
+        assert waits == [0.0, 1.0, 2.0], f"예상과 다른 대기 시간: {waits}"
+        print(f"✅ 토큰 버킷 간격 확인: {waits}")
+        
+        scheduler.record_response(429)
+        assert scheduler.current_rpm == 30, "429 응답 후 속도가 절반으로 줄어야 함"
+        print("✅ 429 응답 시 속도 감소 확인")
+        
+        for _ in range(200):
+            scheduler.record_response(200)
+        assert scheduler.current_rpm == 60, "200 응답이 이어지면 목표 속도로 회복해야 함"
+        print("✅ 200 응답 시 목표 속도 회복 확인")
+        
+        adaptive = RateScheduler(requests_per_minute=60, jitter=0)
+        for _ in range(200):
+            adaptive.record_response(200)
+        assert adaptive.current_rpm == 60 * RateScheduler.DEFAULT_CEILING_FACTOR, \
+            f"최대 속도를 지정하지 않으면 목표 속도보다 빨라질 수 있어야 함: {adaptive.current_rpm}"
+        print(f"✅ 기본 최대 속도까지 증가 확인: {adaptive.current_rpm}회/분")
+        
+        try:
+            RateScheduler(requests_per_minute=60, max_requests_per_minute=30)
+            raise AssertionError("최대 속도가 목표 속도보다 낮으면 ValueError가 나야 함")
+        except ValueError:
+            print("✅ 목표 속도보다 낮은 최대 속도 거부 확인")
+        
+        from clock import VirtualClock
+        
+        clock = VirtualClock()
+        virtual_scheduler = RateScheduler(requests_per_minute=6, jitter=0, clock=clock)
+        for _ in range(3):
+            virtual_scheduler.acquire()
+        stats = clock.get_stats()
+        assert stats['virtual_seconds'] == 20.0, f"가상 시간이 20초 진행되어야 함: {stats}"
+        assert stats['wall_seconds'] < 1, "가상 시계는 실제로 대기하지 않아야 함"
+        print(f"✅ 가상 시계 대기 확인: {stats}")
+        
+        test_results.append(("Rate scheduler", True, None))
+        
+    except Exception as e:
+        print(f"❌ 속도 조절기 테스트 실패: {e}")
+        test_results.append(("Rate scheduler", False, str(e)))
+
+
+def test_shard_merge():
+    """샤드 데이터베이스 병합 테스트 (같은 행이 양쪽에 있는 경우)"""
+    print("\n" + "="*60)
+    print("7. 샤드 병합 테스트")
+    print("="*60)
+    
+    try:
+        import sqlite3
+        import tempfile
+        from datetime import datetime, timedelta
+        from database import PropertyDatabase
+        
+        with tempfile.TemporaryDirectory() as tmp:
+            main_db = PropertyDatabase(os.path.join(tmp, 'main.db'))
+            shard_path = os.path.join(tmp, 'shard.db')
+            
+            # 컬럼 순서가 다른 샤드 (SELECT *로 합치면 값이 다른 컬럼에 들어감)
+            conn = sqlite3.connect(shard_path)
+            conn.execute("""
+                CREATE TABLE crawl_schedule (
+                    next_crawl_at TIMESTAMP, last_crawled_at TIMESTAMP, interval_hours REAL,
+                    rate_per_day REAL, trade_type TEXT, complex_no TEXT,
+                    PRIMARY KEY (complex_no, trade_type)
+                )
+            """)
+            conn.commit()
+            conn.close()
+            shard_db = PropertyDatabase(shard_path)
+            
+            early = datetime(2024, 1, 1, 9)
+            late = early + timedelta(hours=6)
+            prop = {'id': 'merge_001', 'complex_no': '100', 'complex_name': '병합아파트',
+                    'article_no': '1', 'trade_type': 'A1', 'price': 50000}
+            
+            # 같은 매물: 본 DB는 늦게 발견, 샤드는 먼저 발견하고 알림까지 보냄
+            main_db.add_property(prop, seen_at=late)
+            shard_db.add_property(prop, seen_at=early)
+            shard_db.mark_as_notified(prop['id'])
+            
+            # 같은 단지 일정: 샤드 쪽이 더 최근
+            main_db.mark_complex_crawled('100', 'A1', early)
+            shard_db.mark_complex_crawled('100', 'A1', late)
+            
+            stats = main_db.merge_from(shard_path)
+            assert stats == {'properties': 1, 'new_properties': 0}, f"중복 매물은 새로 추가되지 않아야 함: {stats}"
+            
+            conn = sqlite3.connect(os.path.join(tmp, 'main.db'))
+            first_seen, last_checked, notified = conn.execute(
+                "SELECT first_seen, last_checked, notified FROM properties WHERE id = ?", (prop['id'],)
+            ).fetchone()
+            conn.close()
+            assert first_seen == early.isoformat(), f"first_seen은 가장 이른 값이어야 함: {first_seen}"
+            assert last_checked == late.isoformat(), f"last_checked는 가장 늦은 값이어야 함: {last_checked}"
+            assert notified, "어느 한쪽이라도 알림을 보냈으면 알림 완료여야 함"
+            print("✅ 중복 매물 병합 확인 (first_seen/last_checked/notified)")
+            
+            schedule = main_db.get_crawl_schedule('100', 'A1')
+            assert schedule['last_crawled_at'] == late.isoformat(), f"더 최근 일정을 사용해야 함: {schedule}"
+            assert schedule['interval_hours'] is None, f"컬럼 순서가 달라도 값이 제자리에 들어가야 함: {schedule}"
+            print("✅ 컬럼 순서가 다른 샤드의 재크롤링 일정 병합 확인")
+        
+        test_results.append(("Shard merge", True, None))
+        
+    except Exception as e:
+        print(f"❌ 샤드 병합 테스트 실패: {e}")
+        test_results.append(("Shard merge", False, str(e)))
+
+
+def test_complex_cache():
+    """단지 정보 테이블 / 단지 목록 캐시 테스트"""
+    print("\n" + "="*60)
+    print("8. 단지 목록 캐시 테스트")
+    print("="*60)
+    
+    try:
+        import tempfile
+        from datetime import datetime, timedelta
+        from database import PropertyDatabase
+        
+        with tempfile.TemporaryDirectory() as tmp:
+            db = PropertyDatabase(os.path.join(tmp, 'cache.db'))
+            
+            fetched_at = datetime(2024, 1, 1, 9)
+            complexes = [
+                {'complexNo': '200', 'complexName': '캐시아파트', 'maxFloor': 25, 'useApproveYmd': '20150301',
+                 'totalHouseholdCount': 800, 'latitude': 37.5, 'longitude': 127.0, 'dealCount': 3},
+                {'complexNo': '201', 'complexName': '캐시빌', 'maxFloor': 15, 'useApproveYmd': '20100101',
+                 'totalHouseholdCount': 300, 'latitude': 37.4, 'longitude': 127.1, 'dealCount': 0},
+            ]
+            db.save_complexes('1168010100', 'A1', 'query-a', complexes, fetched_at)
+            
+            cached = db.get_cached_complexes('1168010100', 'A1', 'query-a', 1, fetched_at + timedelta(minutes=30))
+            assert cached == complexes, f"유효 시간 안에는 저장한 단지 목록을 그대로 반환해야 함: {cached}"
+            print("✅ 유효 시간 안의 단지 목록 재사용 확인")
+            
+            expired = db.get_cached_complexes('1168010100', 'A1', 'query-a', 1, fetched_at + timedelta(hours=2))
+            assert expired is None, "유효 시간이 지나면 다시 요청해야 함"
+            other_query = db.get_cached_complexes('1168010100', 'A1', 'query-b', 1, fetched_at)
+            assert other_query is None, "요청 파라미터가 다르면 캐시를 쓰지 않아야 함"
+            print("✅ 만료/요청 파라미터 변경 시 캐시 무시 확인")
+            
+            # 매물 행에는 단지 정보를 복사하지 않고 complexes 테이블 값으로 채워 읽음
+            db.add_property({'id': 'cache_001', 'complex_no': '200', 'complex_name': '다른 이름',
+                             'article_no': '1', 'trade_type': 'A1', 'price': 50000})
+            prop = db.get_unnotified_properties()[0]
+            assert prop['complex_name'] == '캐시아파트', f"단지명은 complexes 테이블 값이어야 함: {prop['complex_name']}"
+            assert prop['approval_year'] == 2015 and prop['household_count'] == 800, \
+                f"사용승인연도/세대수는 complexes 테이블 값이어야 함: {prop}"
+            print("✅ 매물 조회 시 단지 정보 참조 확인")
+        
+        test_results.append(("Complex cache", True, None))
+        
+    except Exception as e:
+        print(f"❌ 단지 목록 캐시 테스트 실패: {e}")
+        test_results.append(("Complex cache", False, str(e)))
+
+
+def test_pipeline():
+    """크롤링 → 필터 → 저장 → 알림 파이프라인 테스트 (오류 건너뛰기, 크롤링 중단 시 종료)"""
+    print("\n" + "="*60)
+    print("9. 매물 처리 파이프라인 테스트")
+    print("="*60)
+    
+    try:
+        import tempfile
+        import threading
+        from database import PropertyDatabase
+        from pipeline import PropertyPipeline
+        
+        class BrokenBatchFilter:
+            """'broken' 단지 묶음에서만 실패하는 필터"""
+            def filter_properties(self, properties):
+                if any(prop['complex_no'] == 'broken' for prop in properties):
+                    raise ValueError("필터 오류")
+                return [prop for prop in properties if prop['price'] <= 60000]
+        
+        class FlakyNotifier:
+            """id가 fail로 시작하는 매물에서 전송 오류"""
+            def __init__(self):
+                self.sent = []
+            
+            def send_property_notification(self, prop):
+                if prop['id'].startswith('fail'):
+                    raise ConnectionError("전송 오류")
+                self.sent.append(prop['id'])
+                return True
+        
+        def make_property(property_id, complex_no='300', price=50000):
+            return {'id': property_id, 'complex_no': complex_no, 'complex_name': '파이프라인아파트',
+                    'article_no': property_id, 'trade_type': 'A1', 'price': price}
+        
+        with tempfile.TemporaryDirectory() as tmp:
+            db = PropertyDatabase(os.path.join(tmp, 'pipeline.db'))
+            notifier = FlakyNotifier()
+            pipeline = PropertyPipeline(BrokenBatchFilter(), db, notifier=notifier, queue_size=1)
+            
+            batches = [
+                [make_property('ok_001'), make_property('ok_002', price=90000)],
+                [make_property('bad_001', complex_no='broken')],
+                [make_property('fail_001'), make_property('ok_003')],
+                [],
+            ]
+            stats = pipeline.run(batches)
+            
+            assert stats['total_crawled'] == 5, f"빈 묶음을 뺀 모든 매물을 세야 함: {stats}"
+            assert stats['filtered_properties'] == 3, f"필터 오류가 난 묶음만 건너뛰어야 함: {stats}"
+            assert stats['new_properties'] == 3 and stats['notified_properties'] == 2, f"예상과 다른 통계: {stats}"
+            assert notifier.sent == ['ok_001', 'ok_003'], f"전송 오류 뒤에도 다음 매물을 알려야 함: {notifier.sent}"
+            assert {prop['id'] for prop in db.get_unnotified_properties()} == {'fail_001'}, \
+                "전송에 실패한 매물은 알림 대기로 남아야 함"
+            print(f"✅ 단계별 오류 건너뛰기 확인: {stats}")
+            
+            # 크롤링 단계가 오류로 끝나도 이미 넘긴 매물은 끝까지 처리하고 단계 스레드가 모두 종료
+            def failing_crawl():
+                yield [make_property('ok_101'), make_property('ok_102')]
+                raise RuntimeError("크롤링 오류")
+            
+            pipeline = PropertyPipeline(BrokenBatchFilter(), db, notifier=notifier, queue_size=1)
+            try:
+                pipeline.run(failing_crawl())
+                raise AssertionError("크롤링 오류가 호출한 쪽으로 전달되어야 함")
+            except RuntimeError:
+                pass
+            
+            assert pipeline.get_stats()['notified_properties'] == 2, f"이미 넘긴 매물은 알림까지 끝나야 함: {pipeline.get_stats()}"
+            alive = [thread.name for thread in threading.enumerate() if thread.name.startswith('pipeline-')]
+            assert not alive, f"단계 스레드가 남아 있음: {alive}"
+            print("✅ 크롤링 중단 시 남은 매물 처리 후 종료 확인")
+        
+        test_results.append(("Pipeline", True, None))
+        
+    except Exception as e:
+        print(f"❌ 파이프라인 테스트 실패: {e}")
+        test_results.append(("Pipeline", False, str(e)))
+
+
+def test_recrawl_scheduler():
+    """단지별 재크롤링 일정 테스트 (신규 매물 발생률 → 간격)"""
+    print("\n" + "="*60)
+    print("10. 재크롤링 일정 테스트")
+    print("="*60)
+    
+    try:
+        import tempfile
+        from datetime import datetime, timedelta
+        from database import PropertyDatabase
+        from recrawl_scheduler import RecrawlScheduler
+        
+        with tempfile.TemporaryDirectory() as tmp:
+            db = PropertyDatabase(os.path.join(tmp, 'schedule.db'))
+            now = datetime(2024, 2, 1, 0, 0)
+            start = now - timedelta(days=10)
+            
+            def add(property_id, complex_no, seen_at):
+                db.add_property({'id': property_id, 'complex_no': complex_no, 'article_no': property_id,
+                                 'trade_type': 'A1', 'price': 50000}, seen_at=seen_at)
+            
+            # 두 단지 모두 첫 크롤링에 기존 매물 3개 (신규 발생으로 세지 않음), busy 단지만 매일 신규 매물
+            for complex_no in ('busy', 'quiet'):
+                for i in range(3):
+                    add(f"{complex_no}_initial_{i}", complex_no, start + timedelta(minutes=i))
+            for day in range(1, 10):
+                add(f"busy_new_{day}", 'busy', start + timedelta(days=day))
+            db.mark_complex_crawled('busy', 'A1', now - timedelta(hours=1))
+            
+            scheduler = RecrawlScheduler(db, default_interval_hours=24)
+            assert abs(scheduler.estimate_rate(9, 10) - 9.5 / 11) < 1e-9, "발생률 보정 공식이 달라짐"
+            assert scheduler.allocate([4, 1], 3) == [12, 24], "√발생률 비례로 예산을 나눠야 함"
+            
+            stats = scheduler.update(now=now)
+            busy = db.get_crawl_schedule('busy', 'A1')
+            quiet = db.get_crawl_schedule('quiet', 'A1')
+            assert stats['complexes'] == 2 and abs(stats['planned_per_day'] - 2) < 0.1, \
+                f"기본 예산은 모든 단지를 기준 간격마다 크롤링하는 만큼이어야 함: {stats}"
+            assert busy['interval_hours'] < 24 < quiet['interval_hours'], \
+                f"신규 매물이 잦은 단지일수록 짧은 간격이어야 함: {busy['interval_hours']} / {quiet['interval_hours']}"
+            expected_next = now - timedelta(hours=1) + timedelta(hours=busy['interval_hours'])
+            assert abs((datetime.fromisoformat(busy['next_crawl_at']) - expected_next).total_seconds()) < 1, \
+                f"다음 크롤링 시각은 마지막 크롤링 + 간격이어야 함: {busy}"
+            assert quiet['next_crawl_at'] is None, "크롤링한 적 없는 단지는 다음 크롤링 시각이 없어야 함"
+            print(f"✅ 발생률 비례 간격 확인: busy {busy['interval_hours']}시간, quiet {quiet['interval_hours']}시간")
+            
+            clamped = RecrawlScheduler(db, budget_per_day=1000, min_interval_hours=2, max_interval_hours=168)
+            clamped.update(now=now)
+            assert db.get_crawl_schedule('busy', 'A1')['interval_hours'] == 2, "예산이 커도 최소 간격보다 짧아지지 않아야 함"
+            clamped = RecrawlScheduler(db, budget_per_day=0.01, min_interval_hours=2, max_interval_hours=168)
+            clamped.update(now=now)
+            assert db.get_crawl_schedule('quiet', 'A1')['interval_hours'] == 168, "예산이 작아도 최대 간격보다 길어지지 않아야 함"
+            print("✅ 최소/최대 간격 제한 확인")
+        
+        test_results.append(("Recrawl scheduler", True, None))
+        
+    except Exception as e:
+        print(f"❌ 재크롤링 일정 테스트 실패: {e}")
+        test_results.append(("Recrawl scheduler", False, str(e)))
+
+
+def test_complex_prioritizer():
+    """단지 우선순위 테스트 (필터 호환성, 필터 통과율, 경과도)"""
+    print("\n" + "="*60)
+    print("11. 단지 우선순위 테스트")
+    print("="*60)
+    
+    try:
+        import tempfile
+        from datetime import datetime, timedelta
+        from database import PropertyDatabase
+        from complex_prioritizer import ComplexPrioritizer
+        
+        filters = {
+            'trade_types': ['A1', 'B1'],
+            'household_count': {'min': 300, 'max': 999999},
+            'approval_year': {'min': 2005, 'max': 9999},
+            'area_range': {'min': 80, 'max': 200},
+        }
+        good = {'complexNo': 'hot', 'totalHouseholdCount': 800, 'useApproveYmd': '20150301', 'maxArea': 120}
+        
+        prioritizer = ComplexPrioritizer(filters)
+        assert prioritizer.incompatibility(good, 'A1') is None, "필터를 통과할 수 있는 단지는 제외하지 않아야 함"
+        assert prioritizer.incompatibility(good, 'B2:B1') is None, "묶음 요청은 하나라도 필터 대상이면 통과"
+        assert prioritizer.incompatibility(good, 'B2'), "필터 대상이 아닌 거래 유형은 제외"
+        for field, value in (('totalHouseholdCount', 200), ('useApproveYmd', '19990101'), ('maxArea', 60)):
+            reason = prioritizer.incompatibility(dict(good, **{field: value}), 'A1')
+            assert reason, f"{field}={value} 단지는 제외해야 함"
+        assert prioritizer.incompatibility({'complexNo': 'unknown'}, 'A1') is None, "단지 정보가 없으면 제외하지 않아야 함"
+        assert prioritizer.pass_rate('hot', 'A1', 10) == 0.5, "DB가 없으면 통과율 0.5"
+        print("✅ 필터 호환성 판단 확인")
+        
+        with tempfile.TemporaryDirectory() as tmp:
+            db = PropertyDatabase(os.path.join(tmp, 'priority.db'))
+            now = datetime(2024, 2, 1, 0, 0)
+            
+            # hot 단지는 매물 4개 중 4개가 필터를 통과해 저장됨, cold 단지는 저장된 매물 없음, 오래된 기록은 제외
+            for i in range(4):
+                db.add_property({'id': f"hot_{i}", 'complex_no': 'hot', 'article_no': str(i),
+                                 'trade_type': 'A1', 'price': 50000}, seen_at=now - timedelta(days=1))
+            db.add_property({'id': 'cold_old', 'complex_no': 'cold', 'article_no': '9',
+                             'trade_type': 'A1', 'price': 50000}, seen_at=now - timedelta(days=60))
+            
+            prioritizer = ComplexPrioritizer(filters, db)
+            assert prioritizer.pass_rate('hot', 'A1', 4, now) == 5 / 6, "통과율은 (저장 수 + 1) / (매물 수 + 2)"
+            assert prioritizer.pass_rate('cold', 'A1', 10, now) == 1 / 12, "기록 기간 밖의 매물은 세지 않아야 함"
+            
+            # 경과도: 마지막 크롤링 후 지난 시간 / 재크롤링 간격
+            db.mark_complex_crawled('hot', 'A1', now - timedelta(hours=6))
+            db.save_crawl_intervals([{'complex_no': 'hot', 'trade_type': 'A1', 'rate_per_day': 1.0, 'interval_hours': 12}])
+            assert prioritizer.staleness('hot', 'A1', now) == 0.5, "경과도 계산이 달라짐"
+            assert prioritizer.staleness('cold', 'A1', now) == 1.0, "일정이 없는 단지는 경과도 1"
+            
+            hot_score = prioritizer.score(good, 'A1', expected_new=2, listed=4, now=now)
+            cold_score = prioritizer.score(dict(good, complexNo='cold'), 'A1', expected_new=2, listed=10, now=now)
+            assert hot_score > cold_score, f"필터 통과율이 높은 단지가 먼저여야 함: {hot_score} / {cold_score}"
+            print(f"✅ 우선순위 점수 확인: hot {hot_score:.2f}, cold {cold_score:.2f}")
+        
+        test_results.append(("Complex prioritizer", True, None))
+        
+    except Exception as e:
+        print(f"❌ 단지 우선순위 테스트 실패: {e}")
+        test_results.append(("Complex prioritizer", False, str(e)))
+
+
+def test_browser_pool():
+    """브라우저 페이지 풀 테스트 (상태 확인, 이동 횟수 제한 재생성)"""
+    print("\n" + "="*60)
+    print("12. 브라우저 페이지 풀 테스트")
+    print("="*60)
+    
+    try:
+        from browser_pool import BrowserPagePool
+        
+        class FakePage:
+            """Playwright Page 대역 (크래시/무응답 흉내)"""
+            def __init__(self):
+                self.handlers = {}
+                self.closed = False
+                self.hung = False
+            
+            def on(self, event, handler):
+                self.handlers[event] = handler
+            
+            def crash(self):
+                self.handlers['crash'](self)
+            
+            def is_closed(self):
+                return self.closed
+            
+            def evaluate(self, expression):
+                if self.hung:
+                    raise TimeoutError("응답 없음")
+                return 2
+        
+        class FakeContext:
+            """Playwright BrowserContext 대역"""
+            def __init__(self):
+                self.closed = False
+            
+            def new_page(self):
+                return FakePage()
+            
+            def close(self):
+                self.closed = True
+        
+        contexts = []
+        
+        def new_context():
+            contexts.append(FakeContext())
+            return contexts[-1]
+        
+        pool = BrowserPagePool(new_context, size=2, max_navigations=3)
+        
+        # 돌려받은 페이지는 다시 빌려줌
+        slot = pool.checkout()
+        pool.checkin(slot)
+        assert pool.checkout() is slot and len(contexts) == 1, "정상 페이지는 재사용해야 함"
+        
+        # 이동 횟수 제한에 도달하면 컨텍스트째 닫고 새로 만듦
+        slot.navigations = 3
+        pool.checkin(slot)
+        assert contexts[0].closed and pool.get_stats()['recycled'] == 1, f"이동 횟수 제한 재생성 실패: {pool.get_stats()}"
+        slot = pool.checkout()
+        assert slot.context is contexts[1], "재생성 후에는 새 컨텍스트를 빌려줘야 함"
+        print("✅ 재사용 및 이동 횟수 제한 재생성 확인")
+        
+        # 크래시/닫힘/무응답 페이지는 빌려줄 때 버리고 새로 만듦
+        for break_page in (lambda page: page.crash(), lambda page: setattr(page, 'closed', True),
+                           lambda page: setattr(page, 'hung', True)):
+            pool.checkin(slot)
+            break_page(slot.page)
+            broken_context = slot.context
+            slot = pool.checkout()
+            assert broken_context.closed and slot.context is not broken_context, "상태 이상 페이지를 빌려주면 안 됨"
+        assert pool.get_stats()['unhealthy'] == 3, f"상태 이상 횟수가 달라짐: {pool.get_stats()}"
+        print("✅ 크래시/닫힘/무응답 페이지 교체 확인")
+        
+        # size개를 모두 빌려주면 더 빌릴 수 없음
+        other = pool.checkout()
+        try:
+            pool.checkout()
+            raise AssertionError("풀 크기를 넘겨 빌려주면 안 됨")
+        except RuntimeError:
+            pass
+        
+        # with 블록에서 오류가 나면 그 페이지는 버림
+        pool.checkin(other)
+        try:
+            with pool.page() as borrowed:
+                raise ValueError("페이지 사용 중 오류")
+        except ValueError:
+            pass
+        assert borrowed.context.closed, "오류가 난 페이지는 닫아야 함"
+        
+        pool.checkin(slot)
+        pool.close()
+        stats = pool.get_stats()
+        assert stats['open'] == 0 and all(context.closed for context in contexts), f"닫히지 않은 페이지: {stats}"
+        print(f"✅ 풀 크기 제한 및 정리 확인: {stats}")
+        
+        test_results.append(("Browser page pool", True, None))
+        
+    except Exception as e:
+        print(f"❌ 브라우저 페이지 풀 테스트 실패: {e}")
+        test_results.append(("Browser page pool", False, str(e)))
+
+
+def test_session_restore():
+    """저장된 세션 복원 테스트 (쿠키를 받은 브라우저 프로필 그대로 사용)"""
+    print("\n" + "="*60)
+    print("13. 세션 복원 테스트")
+    print("="*60)
+    
+    srv = None
+    try:
+        import tempfile
+        from clock import VirtualClock
+        from mock_server import MockNaverLandServer
+        from scraper import NaverRealEstateScraper
+        from session_state import SessionStateStore
+        
+        srv = MockNaverLandServer(latency=0)
+        srv.start()
+        
+        chrome_profiles = [p for p in NaverRealEstateScraper.BROWSER_PROFILES if p['type'] == 'chrome']
+        saved_profile = chrome_profiles[1]
+        cookies = {'cookies': [{'name': 'NNB', 'value': 'saved', 'domain': '127.0.0.1', 'path': '/', 'expires': -1}],
+                   'origins': []}
+        
+        with tempfile.TemporaryDirectory() as tmp:
+            store = SessionStateStore(os.path.join(tmp, 'session_state.json'))
+            store.save(cookies, saved_profile['user_agent'])
+            assert store.load()['user_agent'] == saved_profile['user_agent'], "User-Agent를 그대로 저장해야 함"
+            
+            scraper = NaverRealEstateScraper(use_browser=False, base_url=srv.url, clock=VirtualClock(),
+                                             session_store=store)
+            try:
+                assert scraper.browser_profile is saved_profile, \
+                    f"같은 종류의 첫 프로필이 아니라 저장한 프로필이어야 함: {scraper.browser_profile['user_agent']}"
+                assert scraper.session.headers['User-Agent'] == saved_profile['user_agent'], "User-Agent가 바뀌면 안 됨"
+                assert srv.get_stats().get('landing', 0) == 0, f"세션을 재사용하면 메인 페이지를 방문하지 않아야 함: {srv.get_stats()}"
+            finally:
+                scraper.close()
+            print("✅ 두 번째 Chrome 프로필 세션 복원 확인")
+            
+            # 목록에 없는 User-Agent로 받은 쿠키는 쓰지 않고 메인 페이지 방문
+            store.save(cookies, 'Mozilla/5.0 (X11; Linux x86_64) Chrome/99.0.0.0')
+            scraper = NaverRealEstateScraper(use_browser=False, base_url=srv.url, clock=VirtualClock(),
+                                             session_store=store)
+            try:
+                assert scraper.saved_session is None, "프로필이 없으면 저장된 세션을 버려야 함"
+                assert srv.get_stats().get('landing', 0) == 1, f"메인 페이지를 방문해야 함: {srv.get_stats()}"
+            finally:
+                scraper.close()
+            print("✅ 맞는 프로필이 없는 세션 무시 확인")
+        
+        test_results.append(("Session restore", True, None))
+        
+    except Exception as e:
+        print(f"❌ 세션 복원 테스트 실패: {e}")
+        test_results.append(("Session restore", False, str(e)))
+    finally:
+        if srv is not None:
+            srv.stop()
+
+
+def test_filter_pushdown():
+    """필터 조건 서버 전달 테스트 (쿼리 파라미터 변환, 브라우저 페이지의 목록 API 요청 URL 수정)"""
+    print("\n" + "="*60)
+    print("14. 필터 푸시다운 테스트")
+    print("="*60)
+    
+    srv = None
+    try:
+        from urllib.parse import urlparse, parse_qs
+        from clock import VirtualClock
+        from filter_manager import FilterManager
+        from mock_server import MockNaverLandServer
+        from scraper import NaverRealEstateScraper
+        
+        srv = MockNaverLandServer(latency=0)
+        srv.start()
+        
+        filter_mgr = FilterManager("../config/filters.json")
+        
+        # 사용승인연도: 경계 연도를 포함하도록 1년 여유 (2018년 이후 → 9년 이내, 2020년 이전 → 5년 이상)
+        filter_mgr.filters = {'approval_year': {'min': 2018, 'max': 2020}}
+        assert filter_mgr.to_query_params('A1', 2026) == {'recentlyBuildYears': 9, 'oldBuildYears': 5}, \
+            f"연도 경계 변환 오류: {filter_mgr.to_query_params('A1', 2026)}"
+        filter_mgr.filters = {'approval_year': {'min': 2027, 'max': 2025}}
+        assert filter_mgr.to_query_params('A1', 2026) == {}, "올해 이후/작년 이후 경계는 보내지 않아야 함"
+        print("✅ 사용승인연도 경계 연도 변환 확인")
+        
+        # 가격: 여러 거래 유형이면 범위를 합치고, 하나라도 범위가 없으면 보내지 않음
+        filter_mgr.filters = {
+            'price_range': {'B1': {'min': 20000, 'max': 35000}, 'B2': {'min': 100, 'max': 200}},
+            'area_range': {'min': 0, 'max': 132},
+            'household_count': {'min': 0, 'max': 999999},
+            'approval_year': {'min': 0, 'max': 9999},
+        }
+        assert filter_mgr.to_query_params('B1:B2', 2026) == {'priceMin': 100, 'priceMax': 35000}, \
+            f"가격 범위를 합쳐야 함: {filter_mgr.to_query_params('B1:B2', 2026)}"
+        assert filter_mgr.to_query_params('B1:B3', 2026) == {}, "범위가 없는 거래 유형이 있으면 가격 제한이 없어야 함"
+        print("✅ 거래 유형 가격 범위 합치기/제한 없는 항목 생략 확인")
+        
+        filter_mgr.filters = {
+            'price_range': {'B1': {'min': 30000, 'max': 60000}},
+            'area_range': {'min': 59, 'max': 84},
+            'approval_year': {'min': 2020, 'max': 9999},
+        }
+        
+        # 기준 연도는 크롤러 시계에서 (2023-11-14)
+        scraper = NaverRealEstateScraper(use_browser=False, base_url=srv.url, clock=VirtualClock(start=1700000000))
+        try:
+            article_url = f"{srv.url}/api/articles/complex/200?tradeType=B1&priceMin=0&page=1&sameAddressGroup=true"
+            assert scraper._pushdown_url(article_url) is None, "filter_manager가 없으면 URL을 바꾸지 않아야 함"
+            
+            scraper.filter_manager = filter_mgr
+            assert scraper._filter_query_params('B1')['recentlyBuildYears'] == 4, \
+                f"시계의 연도를 기준으로 해야 함: {scraper._filter_query_params('B1')}"
+            
+            query = parse_qs(urlparse(scraper._pushdown_url(article_url)).query)
+            assert query['priceMin'] == ['30000'] and query['priceMax'] == ['60000'] and query['areaMin'] == ['59'], \
+                f"필터 파라미터로 덮어써야 함: {query}"
+            assert query['page'] == ['1'] and query['sameAddressGroup'] == ['true'], f"원래 파라미터는 유지해야 함: {query}"
+            print("✅ 매물 목록 요청에 필터 파라미터 적용 확인")
+            
+            complex_query = parse_qs(urlparse(scraper._pushdown_url(
+                f"{srv.url}/api/complexes?cortarNo=1168010600&tradeType=B1")).query)
+            assert complex_query['cortarNo'] == ['1168010600'] and complex_query['priceMax'] == ['60000'], \
+                f"단지 목록 요청에도 적용해야 함: {complex_query}"
+            
+            # 가격 범위가 없는 거래 유형은 면적만, 목록 API가 아닌 요청은 그대로
+            rent_query = parse_qs(urlparse(scraper._pushdown_url(
+                f"{srv.url}/api/articles/complex/200?tradeType=B2")).query)
+            assert 'priceMin' not in rent_query and rent_query['areaMin'] == ['59'], f"요청의 tradeType 기준이어야 함: {rent_query}"
+            assert scraper._pushdown_url(f"{srv.url}/api/cortars?zoom=16") is None, "목록 API가 아니면 바꾸지 않아야 함"
+            assert scraper._pushdown_url(f"{srv.url}/api/complexes/200?tradeType=B1") is None, "단지 상세는 바꾸지 않아야 함"
+            print("✅ 요청의 거래 유형 기준 적용/목록 외 요청 제외 확인")
+        finally:
+            scraper.close()
+        
+        test_results.append(("Filter pushdown", True, None))
+        
+    except Exception as e:
+        print(f"❌ 필터 푸시다운 테스트 실패: {e}")
+        test_results.append(("Filter pushdown", False, str(e)))
+    finally:
+        if srv is not None:
+            srv.stop()
+
+
+def test_frontier_resume():
+    """중단된 페이지부터 이어서 크롤링 테스트 (crawl_frontier의 in_progress/failed 페이지만 다시 요청)"""
+    print("\n" + "="*60)
+    print("15. 중단 후 재개 테스트")
+    print("="*60)
+    
+    srv = None
+    try:
+        import tempfile
+        from clock import VirtualClock
+        from database import PropertyDatabase
+        from mock_server import MockNaverLandServer
+        from scraper import NaverRealEstateScraper
+        
+        srv = MockNaverLandServer(latency=0)
+        srv.start()
+        
+        with tempfile.TemporaryDirectory() as tmp:
+            db = PropertyDatabase(os.path.join(tmp, 'frontier.db'))
+            clock = VirtualClock(start=1700000000)
+            scraper = NaverRealEstateScraper(use_browser=False, base_url=srv.url, clock=clock)
+            try:
+                # 페이지 번호별 응답 (2페이지가 마지막)
+                requested = []
+                pages = {1: {'articleList': [{'articleNo': '1'}, {'articleNo': '2'}], 'isMoreData': True},
+                         2: {'articleList': [{'articleNo': '3'}], 'isMoreData': False}}
+                
+                def fake_request(url, params=None, retry=3):
+                    requested.append(params['page'])
+                    return pages[params['page']]
+                
+                scraper._safe_request = fake_request
+                url = f"{srv.url}/api/articles/complex/200"
+                
+                for state in ('in_progress', 'failed'):
+                    checkpoint = scraper._checkpoint(db, '1168010600', 'B1', '200')
+                    scraper._save_checkpoint(checkpoint, 1, 'done', pages[1]['articleList'], True)
+                    scraper._save_checkpoint(checkpoint, 2, state)
+                    requested.clear()
+                    
+                    items = [item for page in scraper._iter_pages(url, {}, 'articleList', checkpoint) for item in page]
+                    assert requested == [2], f"{state} 페이지만 다시 요청해야 함: {requested}"
+                    assert [item['articleNo'] for item in items] == ['1', '2', '3'], f"저장된 페이지와 이어 붙여야 함: {items}"
+                    assert db.get_frontier_page('1168010600', 'B1', '200', 2, 60, clock.now()) is not None, \
+                        "다시 받은 페이지는 done으로 저장해야 함"
+                    print(f"✅ {state} 페이지부터 재개 확인")
+                
+                # 모두 완료된 항목은 요청 없이 재사용, FRONTIER_FRESHNESS_MINUTES가 지나면 처음부터 다시 요청
+                requested.clear()
+                list(scraper._iter_pages(url, {}, 'articleList', checkpoint))
+                assert requested == [], f"완료된 페이지는 요청하지 않아야 함: {requested}"
+                clock.advance((scraper.frontier_freshness_minutes + 1) * 60)
+                list(scraper._iter_pages(url, {}, 'articleList', checkpoint))
+                assert requested == [1, 2], f"오래된 페이지는 다시 요청해야 함: {requested}"
+                print("✅ 완료 페이지 재사용/만료 확인")
+            finally:
+                scraper.close()
+        
+        test_results.append(("Frontier resume", True, None))
+        
+    except Exception as e:
+        print(f"❌ 중단 후 재개 테스트 실패: {e}")
+        test_results.append(("Frontier resume", False, str(e)))
+    finally:
+        if srv is not None:
+            srv.stop()
+
+
+def test_seen_early_stop():
+    """기존 매물만 있는 페이지에서 조기 종료 테스트 (seen_articles)"""
+    print("\n" + "="*60)
+    print("16. 기존 매물 조기 종료 테스트")
+    print("="*60)
+    
+    srv = None
+    try:
+        import tempfile
+        from clock import VirtualClock
+        from database import PropertyDatabase
+        from mock_server import MockNaverLandServer
+        from scraper import NaverRealEstateScraper
+        
+        srv = MockNaverLandServer(latency=0)
+        srv.start()
+        
+        with tempfile.TemporaryDirectory() as tmp:
+            db = PropertyDatabase(os.path.join(tmp, 'seen.db'))
+            clock = VirtualClock(start=1700000000)
+            scraper = NaverRealEstateScraper(use_browser=False, base_url=srv.url, clock=clock)
+            try:
+                # 최신순 3페이지: 1페이지에 신규 매물, 2페이지부터는 모두 이전에 받은 매물
+                requested = []
+                pages = {1: ['new1', 'old1'], 2: ['old2', 'old3'], 3: ['old4']}
+                
+                def fake_request(url, params=None, retry=3):
+                    requested.append(params['page'])
+                    return {'articleList': [{'articleNo': no} for no in pages[params['page']]],
+                            'isMoreData': params['page'] < len(pages)}
+                
+                scraper._safe_request = fake_request
+                scraper._visit_landing_page = lambda page_type: None
+                scraper.frontier_freshness_minutes = 0
+                
+                # 필터에서 걸러져 properties에 없는 매물도 seen_articles에 있으면 기존 매물
+                db.mark_articles_seen('200', ['200_old1', '200_old2', '200_old3', '200_old4'], clock.now())
+                
+                articles = list(scraper.iter_complex_articles('200', 'B1', db=db))
+                assert requested == [1, 2], f"기존 매물만 있는 페이지 다음은 요청하지 않아야 함: {requested}"
+                assert [a['articleNo'] for a in articles] == ['new1', 'old1', 'old2', 'old3'], \
+                    f"조기 종료한 페이지의 매물까지는 반환해야 함: {articles}"
+                print("✅ 기존 매물만 있는 페이지에서 조기 종료 확인")
+                
+                requested.clear()
+                articles = list(scraper.iter_complex_articles('200', 'B1'))
+                assert requested == [1, 2, 3] and len(articles) == 5, f"db가 없으면 모든 페이지를 요청해야 함: {requested}"
+                print("✅ db 없이 전체 페이지 요청 확인")
+            finally:
+                scraper.close()
+        
+        test_results.append(("Seen early stop", True, None))
+        
+    except Exception as e:
+        print(f"❌ 기존 매물 조기 종료 테스트 실패: {e}")
+        test_results.append(("Seen early stop", False, str(e)))
+    finally:
+        if srv is not None:
+            srv.stop()
+
+
+def test_unchanged_complex_skip():
+    """매물 수가 그대로인 단지 건너뛰기 테스트 (complexList 매물 수 스냅샷)"""
+    print("\n" + "="*60)
+    print("17. 변경 없는 단지 건너뛰기 테스트")
+    print("="*60)
+    
+    srv = None
+    try:
+        import tempfile
+        from clock import VirtualClock
+        from database import PropertyDatabase
+        from mock_server import MockNaverLandServer
+        from scraper import NaverRealEstateScraper
+        
+        srv = MockNaverLandServer(latency=0)
+        srv.start()
+        
+        with tempfile.TemporaryDirectory() as tmp:
+            db = PropertyDatabase(os.path.join(tmp, 'snapshots.db'))
+            clock = VirtualClock(start=1700000000)
+            scraper = NaverRealEstateScraper(use_browser=False, base_url=srv.url, clock=clock)
+            try:
+                requested = []
+                scraper._safe_request = lambda url, params=None, retry=3: requested.append(url)
+                
+                complex_info = {'complexNo': '300', 'dealCount': 0, 'leaseCount': 5, 'rentCount': 2}
+                assert scraper._needs_crawl(complex_info, 'B1', db, '1168010600'), "스냅샷이 없으면 크롤링해야 함"
+                
+                scraper._record_complex_snapshots(
+                    complex_info, 'B1', [{'id': '300_1', 'article_no': '1', 'trade_type': 'B1'}], db)
+                assert not scraper._needs_crawl(complex_info, 'B1', db, '1168010600'), "매물 수가 그대로면 건너뛰어야 함"
+                assert not scraper._needs_crawl(dict(complex_info, rentCount=3), 'B1', db, '1168010600'), \
+                    "다른 거래 유형의 매물 수 변화는 무시해야 함"
+                assert scraper._needs_crawl(dict(complex_info, leaseCount=6), 'B1', db, '1168010600'), \
+                    "해당 거래 유형의 매물 수가 바뀌면 크롤링해야 함"
+                print("✅ 매물 수 비교로 건너뛰기/크롤링 판단 확인")
+                
+                # 매물 수가 그대로여도 중단된 실행이 저장한 페이지가 있으면 이어서 진행
+                checkpoint = scraper._checkpoint(db, '1168010600', 'B1', '300')
+                scraper._save_checkpoint(checkpoint, 1, 'done', [{'articleNo': '1'}], True)
+                assert scraper._needs_crawl(complex_info, 'B1', db, '1168010600'), "저장된 페이지가 있으면 이어서 크롤링해야 함"
+                
+                # 같은 수의 매물 교체를 놓치지 않도록 SNAPSHOT_MAX_AGE_HOURS가 지나면 다시 확인
+                clock.advance(scraper.SNAPSHOT_MAX_AGE_HOURS * 3600 + 1)
+                assert scraper._needs_crawl(complex_info, 'B1', db, '1168010600'), "오래된 스냅샷은 다시 확인해야 함"
+                assert requested == [], f"판단에 요청을 쓰면 안 됨: {requested}"
+                print("✅ 중단된 단지 재개/오래된 스냅샷 재확인 확인")
+            finally:
+                scraper.close()
+        
+        test_results.append(("Unchanged complex skip", True, None))
+        
+    except Exception as e:
+        print(f"❌ 변경 없는 단지 건너뛰기 테스트 실패: {e}")
+        test_results.append(("Unchanged complex skip", False, str(e)))
+    finally:
+        if srv is not None:
+            srv.stop()
+
+
 def print_summary():
     """테스트 결과 요약"""
     print("\n" + "="*60)
@@ -268,6 +1080,18 @@ def main():
     test_filter()
     test_config_files()
     test_scraper_basic()
+    test_rate_scheduler()
+    test_shard_merge()
+    test_complex_cache()
+    test_pipeline()
+    test_recrawl_scheduler()
+    test_complex_prioritizer()
+    test_browser_pool()
+    test_session_restore()
+    test_filter_pushdown()
+    test_frontier_resume()
+    test_seen_early_stop()
+    test_unchanged_complex_skip()
     
     # 결과 요약
     success = print_summary()